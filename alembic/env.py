@@ -21,10 +21,19 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.database.database import Base
-from app.models import User, Level, MainTopic, SubTopic, LearningPath, CurriculumItem, Article, UserArticleRead
+from app.models import User, Level, MainTopic, SubTopic, LearningPath, CurriculumItem, Article, ArticleBody, UserArticleRead, UserProgress, UserReadBitmap, ReadRollup
+
+from app.database.search_index import SEARCH_TABLES
 
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # FTS5 검색 인덱스(가상 테이블과 섀도 테이블)는 마이그레이션에서 직접 관리
+    if type_ == "table" and reflected and name.startswith(SEARCH_TABLES):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +56,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -70,7 +80,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,36 @@
+"""Add precompressed article bodies
+
+Revision ID: 3b1f7c2a9d4e
+Revises: 6590987bdf83
+Create Date: 2026-10-19 10:12:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f7c2a9d4e'
+down_revision: Union[str, Sequence[str], None] = '6590987bdf83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('article_bodies',
+    sa.Column('article_id', sa.String(), nullable=False),
+    sa.Column('raw_size', sa.Integer(), nullable=False),
+    sa.Column('gzip_payload', sa.LargeBinary(), nullable=False),
+    sa.Column('br_payload', sa.LargeBinary(), nullable=True),
+    sa.ForeignKeyConstraint(['article_id'], ['articles.article_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('article_id')
+    )
+    # 기존 글은 `python -m app.database.backfill_article_bodies`로 채웁니다.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('article_bodies')
@@ -0,0 +1,32 @@
+"""Add indexes for sub_topic and main_topic foreign keys
+
+Revision ID: 8c4d2e6f1a3b
+Revises: 3b1f7c2a9d4e
+Create Date: 2026-10-19 14:05:48.331907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4d2e6f1a3b'
+down_revision: Union[str, Sequence[str], None] = '3b1f7c2a9d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # `python -m app.database.index_audit`가 보고한 인덱스 없는 스캔
+    op.create_index('idx_learning_path_sub_topic_id', 'learning_paths', ['sub_topic_id'], unique=False)
+    op.create_index('idx_sub_topic_main_topic_id', 'sub_topics', ['main_topic_id'], unique=False)
+    # articles.curriculum_item_id는 idx_curriculum_item_level의 선두 컬럼이라 별도 인덱스가 필요 없음
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_sub_topic_main_topic_id', table_name='sub_topics')
+    op.drop_index('idx_learning_path_sub_topic_id', table_name='learning_paths')
@@ -0,0 +1,31 @@
+"""Extend idx_user_read_at with article_id
+
+Revision ID: a4e6c8f0b2d1
+Revises: f2c8d4b6a1e9
+Create Date: 2026-10-19 17:22:36.918450
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e6c8f0b2d1'
+down_revision: Union[str, Sequence[str], None] = 'f2c8d4b6a1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 읽은 기록 타임라인의 (read_at, article_id) 커서가 인덱스 범위 탐색이 되도록 article_id 추가
+    op.drop_index('idx_user_read_at', table_name='user_article_reads')
+    op.create_index('idx_user_read_at', 'user_article_reads', ['user_id', 'read_at', 'article_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_user_read_at', table_name='user_article_reads')
+    op.create_index('idx_user_read_at', 'user_article_reads', ['user_id', 'read_at'], unique=False)
@@ -0,0 +1,57 @@
+"""Add popularity read rollups
+
+Revision ID: b7d1e3f5a9c2
+Revises: a4e6c8f0b2d1
+Create Date: 2026-10-19 18:03:51.270815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d1e3f5a9c2'
+down_revision: Union[str, Sequence[str], None] = 'a4e6c8f0b2d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('read_rollups',
+    sa.Column('granularity', sa.String(), nullable=False),
+    sa.Column('entity_type', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('entity_id', sa.String(), nullable=False),
+    sa.Column('read_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'entity_type', 'bucket_start', 'entity_id')
+    )
+
+    # 기존 읽음 기록 백필 (사용자/글별 마지막 read_at만 남아 있으므로 근사치)
+    buckets = {
+        'hour': "strftime('%Y-%m-%d %H:00:00.000000', user_article_reads.read_at)",
+        'day': "strftime('%Y-%m-%d 00:00:00.000000', user_article_reads.read_at)",
+    }
+    entities = {
+        'article': "user_article_reads.article_id",
+        'path': "curriculum_items.path_id",
+        'sub_topic': "CAST(articles.sub_topic_id AS TEXT)",
+    }
+    for granularity, bucket in buckets.items():
+        for entity_type, entity_id in entities.items():
+            op.execute(
+                "INSERT INTO read_rollups (granularity, entity_type, bucket_start, entity_id, read_count) "
+                f"SELECT '{granularity}', '{entity_type}', {bucket}, {entity_id}, count(*) "
+                "FROM user_article_reads "
+                "JOIN articles ON articles.article_id = user_article_reads.article_id "
+                "JOIN curriculum_items ON curriculum_items.curriculum_item_id = articles.curriculum_item_id "
+                "WHERE user_article_reads.read_at IS NOT NULL "
+                f"GROUP BY {bucket}, {entity_id}"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('read_rollups')
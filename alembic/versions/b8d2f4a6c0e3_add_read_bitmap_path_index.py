@@ -0,0 +1,29 @@
+"""Add path/level index on user read bitmaps
+
+Revision ID: b8d2f4a6c0e3
+Revises: e1c7a3f9d5b2
+Create Date: 2026-10-19 23:12:40.518237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f4a6c0e3'
+down_revision: Union[str, Sequence[str], None] = 'e1c7a3f9d5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 새 글이 생긴 위치의 비트를 (경로, 레벨)의 모든 사용자 비트맵에서 끌 때 사용
+    op.create_index('idx_read_bitmap_path_level', 'user_read_bitmaps', ['path_id', 'level_code'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_read_bitmap_path_level', table_name='user_read_bitmaps')
@@ -0,0 +1,54 @@
+"""Add FTS5 search index over articles and topics
+
+Revision ID: c9e2a4f6b8d3
+Revises: b7d1e3f5a9c2
+Create Date: 2026-10-19 19:12:08.415362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e2a4f6b8d3'
+down_revision: Union[str, Sequence[str], None] = 'b7d1e3f5a9c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (FTS 테이블, 원본 테이블, 원본 rowid 컬럼, 색인 컬럼)
+SEARCH_TABLES = [
+    ('article_search', 'articles', 'rowid', ['title', 'body']),
+    ('sub_topic_search', 'sub_topics', 'sub_topic_id', ['name', 'description']),
+    ('main_topic_search', 'main_topics', 'main_topic_id', ['name']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for fts, source, rowid, columns in SEARCH_TABLES:
+        names = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.{rowid}, {new_values});"
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{rowid}, {old_values});"
+
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{names}, content='{source}', content_rowid='{rowid}', tokenize='trigram')"
+        )
+        op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {source} BEGIN {delete_old} {insert_new} END")
+
+        # 기존 데이터 색인
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for fts, source, rowid, columns in reversed(SEARCH_TABLES):
+        for suffix in ('au', 'ad', 'ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
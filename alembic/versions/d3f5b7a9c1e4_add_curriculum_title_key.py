@@ -0,0 +1,52 @@
+"""Add normalized curriculum item title key
+
+Revision ID: d3f5b7a9c1e4
+Revises: c9e2a4f6b8d3
+Create Date: 2026-10-19 20:26:44.903117
+
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f5b7a9c1e4'
+down_revision: Union[str, Sequence[str], None] = 'c9e2a4f6b8d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('curriculum_items', sa.Column('title_key', sa.String(), nullable=True))
+
+    # 기존 아이템 백필 - app.models.curriculum_item.make_title_key와 같은 규칙
+    connection = op.get_bind()
+    items = sa.table(
+        'curriculum_items',
+        sa.column('curriculum_item_id', sa.String()),
+        sa.column('title', sa.String()),
+        sa.column('title_key', sa.String())
+    )
+    rows = connection.execute(sa.select(items.c.curriculum_item_id, items.c.title)).fetchall()
+    if rows:
+        connection.execute(
+            items.update().where(items.c.curriculum_item_id == sa.bindparam('item_id')).values(title_key=sa.bindparam('key')),
+            [
+                {'item_id': item_id, 'key': re.sub(r"[\W_]+", "", unicodedata.normalize("NFKC", title).casefold())}
+                for item_id, title in rows
+            ]
+        )
+
+    op.create_index('idx_sub_topic_title_key', 'curriculum_items', ['sub_topic_id', 'title_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_sub_topic_title_key', table_name='curriculum_items')
+    with op.batch_alter_table('curriculum_items') as batch_op:
+        batch_op.drop_column('title_key')
@@ -0,0 +1,35 @@
+"""Add stored article preview
+
+Revision ID: d5a9e3c7b2f4
+Revises: 8c4d2e6f1a3b
+Create Date: 2026-10-19 15:20:07.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9e3c7b2f4'
+down_revision: Union[str, Sequence[str], None] = '8c4d2e6f1a3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('preview', sa.String(), nullable=True))
+    # 기존 글 백필 - app.models.article.make_preview와 같은 규칙 (앞 100자 + "...")
+    op.execute(
+        "UPDATE articles SET preview = CASE WHEN length(body) > 100 "
+        "THEN substr(body, 1, 100) || '...' ELSE body END "
+        "WHERE preview IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.drop_column('preview')
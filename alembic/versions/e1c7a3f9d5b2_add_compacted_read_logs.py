@@ -0,0 +1,32 @@
+"""Add compacted read event log digests
+
+Revision ID: e1c7a3f9d5b2
+Revises: d3f5b7a9c1e4
+Create Date: 2026-10-19 21:41:17.628304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c7a3f9d5b2'
+down_revision: Union[str, Sequence[str], None] = 'd3f5b7a9c1e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('compacted_read_logs',
+    sa.Column('digest', sa.String(), nullable=False),
+    sa.Column('compacted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('digest')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('compacted_read_logs')
@@ -0,0 +1,63 @@
+"""Add incrementally maintained user progress
+
+Revision ID: e7b3f1a9c5d2
+Revises: d5a9e3c7b2f4
+Create Date: 2026-10-19 16:05:41.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3f1a9c5d2'
+down_revision: Union[str, Sequence[str], None] = 'd5a9e3c7b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_progress',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('sub_topic_id', sa.Integer(), nullable=False),
+    sa.Column('path_id', sa.String(), nullable=False),
+    sa.Column('read_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['path_id'], ['learning_paths.path_id'], ),
+    sa.ForeignKeyConstraint(['sub_topic_id'], ['sub_topics.sub_topic_id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'sub_topic_id', 'path_id')
+    )
+    op.add_column('sub_topics', sa.Column('article_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('learning_paths', sa.Column('article_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 데이터 백필 - app.services.progress_tracker.ProgressTracker.rebuild와 같은 집계
+    op.execute(
+        "UPDATE sub_topics SET article_count = "
+        "(SELECT count(*) FROM articles WHERE articles.sub_topic_id = sub_topics.sub_topic_id)"
+    )
+    op.execute(
+        "UPDATE learning_paths SET article_count = "
+        "(SELECT count(*) FROM articles JOIN curriculum_items "
+        "ON curriculum_items.curriculum_item_id = articles.curriculum_item_id "
+        "WHERE curriculum_items.path_id = learning_paths.path_id)"
+    )
+    op.execute(
+        "INSERT INTO user_progress (user_id, sub_topic_id, path_id, read_count) "
+        "SELECT user_article_reads.user_id, articles.sub_topic_id, curriculum_items.path_id, count(*) "
+        "FROM user_article_reads "
+        "JOIN articles ON articles.article_id = user_article_reads.article_id "
+        "JOIN curriculum_items ON curriculum_items.curriculum_item_id = articles.curriculum_item_id "
+        "GROUP BY user_article_reads.user_id, articles.sub_topic_id, curriculum_items.path_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('learning_paths') as batch_op:
+        batch_op.drop_column('article_count')
+    with op.batch_alter_table('sub_topics') as batch_op:
+        batch_op.drop_column('article_count')
+    op.drop_table('user_progress')
@@ -0,0 +1,60 @@
+"""Add per-path read bitmaps
+
+Revision ID: f2c8d4b6a1e9
+Revises: e7b3f1a9c5d2
+Create Date: 2026-10-19 16:48:12.664019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8d4b6a1e9'
+down_revision: Union[str, Sequence[str], None] = 'e7b3f1a9c5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    user_read_bitmaps = op.create_table('user_read_bitmaps',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('path_id', sa.String(), nullable=False),
+    sa.Column('level_code', sa.String(), nullable=False),
+    sa.Column('bits', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['level_code'], ['levels.level_code'], ),
+    sa.ForeignKeyConstraint(['path_id'], ['learning_paths.path_id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'path_id', 'level_code')
+    )
+
+    # 기존 읽음 기록 백필 - app.services.read_state.ReadStateCache.rebuild와 같은 규칙
+    rows = op.get_bind().execute(sa.text(
+        "SELECT user_article_reads.user_id, curriculum_items.path_id, articles.level_code, curriculum_items.sort_order "
+        "FROM user_article_reads "
+        "JOIN articles ON articles.article_id = user_article_reads.article_id "
+        "JOIN curriculum_items ON curriculum_items.curriculum_item_id = articles.curriculum_item_id"
+    ))
+    bitmaps = {}
+    for user_id, path_id, level_code, sort_order in rows:
+        if sort_order >= 0:
+            key = (user_id, path_id, level_code)
+            bitmaps[key] = bitmaps.get(key, 0) | (1 << sort_order)
+    if bitmaps:
+        op.bulk_insert(user_read_bitmaps, [
+            {
+                "user_id": user_id,
+                "path_id": path_id,
+                "level_code": level_code,
+                "bits": bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+            }
+            for (user_id, path_id, level_code), bits in bitmaps.items()
+        ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_read_bitmaps')
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Header, Query
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from app.database.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
+from fastapi.responses import Response
+from typing import Optional, List, Tuple
+from app.database.database import LazySession, get_db
 from app.models import Article, CurriculumItem, UserArticleRead, User
+from app.services.article_body_store import article_body_store
+from app.services.article_reuse import article_reuse
+from app.services.article_cache import article_cache
+from app.services import read_models
+from app.services.fast_json import RowEncoder
+from app.services.pagination import keyset_page, page_limit, with_next_cursor
+from app.services.progress_tracker import progress_tracker
+from app.services.similarity_index import document_text, similarity_index
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -29,6 +37,13 @@ class ArticleNavigationResponse(BaseModel):
     curriculum_item_id: str
     level_code: str
 
+class RelatedArticleResponse(BaseModel):
+    article_id: str
+    title: str
+    curriculum_item_id: str
+    level_code: str
+    score: float  # 코사인 유사도
+
 class GenerateArticleRequest(BaseModel):
     level: str
     content_style: str
@@ -42,48 +57,59 @@ class GenerateArticleResponse(BaseModel):
     curriculum_item_id: str
 
 
+article_list_encoder = RowEncoder(ArticleListResponse)
+
+
 @router.get("/curriculum-items/{curriculum_item_id}/articles", response_model=List[ArticleListResponse])
 async def get_articles_by_curriculum_item(
     curriculum_item_id: str,
     level: Optional[str] = Query(None, description="beginner | intermediate | expert"),
-    db: Session = Depends(get_db)
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db)
 ):
-    """난이도별 글 목록 조회"""
+    """난이도별 글 목록 조회 (limit/cursor를 주면 level_code 기준 커서 페이지네이션)"""
     # 커리큘럼 아이템 존재 확인
-    curriculum_item = db.query(CurriculumItem).filter(
-        CurriculumItem.curriculum_item_id == curriculum_item_id
-    ).first()
-    if not curriculum_item:
+    if not read_models.curriculum_item_exists(db, curriculum_item_id):
         raise HTTPException(status_code=404, detail="Curriculum item not found")
     
-    # 글 조회 쿼리
-    query = db.query(Article).filter(Article.curriculum_item_id == curriculum_item_id)
-    
-    # 레벨 필터링
-    if level:
-        query = query.filter(Article.level_code == level)
-    
-    articles = query.all()
-    
-    return [
-        ArticleListResponse(
-            article_id=article.article_id,
-            level_code=article.level_code,
-            title=article.title,
-            preview=article.body[:100] + "..." if len(article.body) > 100 else article.body
+    limit, cursor = page
+    if limit is None:
+        rows, next_cursor = read_models.articles_by_curriculum_item(db, curriculum_item_id, level), None
+    else:
+        rows, next_cursor = keyset_page(
+            read_models.articles_by_curriculum_item_query(db, curriculum_item_id, level),
+            [Article.level_code], lambda row: (row[1],), limit, cursor
         )
-        for article in articles
-    ]
+    db.release()
+    return with_next_cursor(article_list_encoder.response(rows), next_cursor)
 
 
 @router.get("/articles/{article_id}", response_model=ArticleDetailResponse)
 async def get_article(
     article_id: str, 
-    db: Session = Depends(get_db),
+    request: Request,
+    db: LazySession = Depends(get_db),
     authorization: Optional[str] = Header(None)
 ):
     """글 상세 조회"""
-    article = db.query(Article).filter(Article.article_id == article_id).first()
+    is_logged_in = bool(authorization and authorization.startswith("Bearer "))
+    
+    # 비로그인 응답은 캐시 또는 미리 인코딩/압축해 둔 바이트를 그대로 전송
+    if not is_logged_in:
+        encoding = article_body_store.negotiate(request.headers.get("accept-encoding"))
+        payload = article_cache.get(article_id, encoding)
+        if payload is None:
+            payload = article_body_store.load(db, article_id, encoding)
+            if payload is not None:
+                db.release()
+                article_cache.put(article_id, encoding, payload)
+        if payload is not None:
+            headers = {"Vary": "Accept-Encoding"}
+            if encoding:
+                headers["Content-Encoding"] = encoding
+            return Response(content=payload, media_type="application/json", headers=headers)
+    
+    article = read_models.article_detail(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
@@ -96,7 +122,7 @@ async def get_article(
     )
     
     # 로그인 사용자인 경우 읽음 상태 확인
-    if authorization and authorization.startswith("Bearer "):
+    if is_logged_in:
         # TODO: JWT 토큰 파싱하여 user_id 추출
         # 현재는 더미 구현
         user_id = "dummy_user_id"  
@@ -108,6 +134,7 @@ async def get_article(
         
         response.is_read = read_record is not None
     
+    db.release()
     return response
 
 
@@ -115,40 +142,17 @@ async def get_article(
 async def get_next_article(
     article_id: str, 
     level: Optional[str] = Query(None, description="beginner | intermediate | expert"),
-    db: Session = Depends(get_db)
+    db: LazySession = Depends(get_db)
 ):
     """다음 글 조회"""
-    # 현재 글 조회
-    current_article = db.query(Article).filter(Article.article_id == article_id).first()
-    if not current_article:
+    # 현재 글이 속한 학습 경로와 순서 조회
+    position = read_models.article_position(db, article_id)
+    if not position:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # 레벨이 지정되지 않으면 현재 글과 동일한 레벨 사용
-    target_level = level or current_article.level_code
-    
-    # 현재 커리큘럼 아이템 조회
-    current_curriculum = db.query(CurriculumItem).filter(
-        CurriculumItem.curriculum_item_id == current_article.curriculum_item_id
-    ).first()
-    
-    if not current_curriculum:
-        return None
-    
-    # 같은 학습 경로에서 다음 순서의 커리큘럼 아이템 찾기
-    next_curriculum = db.query(CurriculumItem).filter(
-        CurriculumItem.path_id == current_curriculum.path_id,
-        CurriculumItem.sort_order > current_curriculum.sort_order
-    ).order_by(CurriculumItem.sort_order).first()
-    
-    if not next_curriculum:
-        return None
-    
-    # 다음 커리큘럼 아이템의 지정된 레벨 글 찾기
-    next_article = db.query(Article).filter(
-        Article.curriculum_item_id == next_curriculum.curriculum_item_id,
-        Article.level_code == target_level
-    ).first()
-    
+    # 같은 학습 경로에서 다음 순서 아이템의 지정된 레벨 글 (레벨이 없으면 현재 글과 동일한 레벨)
+    next_article = read_models.adjacent_article(db, position, level or position.level_code, forward=True)
+    db.release()
     if not next_article:
         return None
     
@@ -164,40 +168,17 @@ async def get_next_article(
 async def get_previous_article(
     article_id: str,
     level: Optional[str] = Query(None, description="beginner | intermediate | expert"),
-    db: Session = Depends(get_db)
+    db: LazySession = Depends(get_db)
 ):
     """이전 글 조회"""
-    # 현재 글 조회
-    current_article = db.query(Article).filter(Article.article_id == article_id).first()
-    if not current_article:
+    # 현재 글이 속한 학습 경로와 순서 조회
+    position = read_models.article_position(db, article_id)
+    if not position:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # 레벨이 지정되지 않으면 현재 글과 동일한 레벨 사용
-    target_level = level or current_article.level_code
-    
-    # 현재 커리큘럼 아이템 조회
-    current_curriculum = db.query(CurriculumItem).filter(
-        CurriculumItem.curriculum_item_id == current_article.curriculum_item_id
-    ).first()
-    
-    if not current_curriculum:
-        return None
-    
-    # 같은 학습 경로에서 이전 순서의 커리큘럼 아이템 찾기
-    previous_curriculum = db.query(CurriculumItem).filter(
-        CurriculumItem.path_id == current_curriculum.path_id,
-        CurriculumItem.sort_order < current_curriculum.sort_order
-    ).order_by(CurriculumItem.sort_order.desc()).first()
-    
-    if not previous_curriculum:
-        return None
-    
-    # 이전 커리큘럼 아이템의 지정된 레벨 글 찾기
-    previous_article = db.query(Article).filter(
-        Article.curriculum_item_id == previous_curriculum.curriculum_item_id,
-        Article.level_code == target_level
-    ).first()
-    
+    # 같은 학습 경로에서 이전 순서 아이템의 지정된 레벨 글 (레벨이 없으면 현재 글과 동일한 레벨)
+    previous_article = read_models.adjacent_article(db, position, level or position.level_code, forward=False)
+    db.release()
     if not previous_article:
         return None
     
@@ -209,25 +190,35 @@ async def get_previous_article(
     )
 
 
-@router.post("/curriculum-items/{curriculum_item_id}/articles/generate", response_model=GenerateArticleResponse)
-async def generate_article(
-    curriculum_item_id: str,
-    request: GenerateArticleRequest,
-    db: Session = Depends(get_db)
+related_article_encoder = RowEncoder(RelatedArticleResponse)
+
+
+@router.get("/articles/{article_id}/related", response_model=List[RelatedArticleResponse])
+async def get_related_articles(
+    article_id: str,
+    limit: int = Query(10, ge=1, le=50),
+    db: LazySession = Depends(get_db)
 ):
-    """AI 글 생성"""
-    # 커리큘럼 아이템 존재 확인
-    curriculum_item = db.query(CurriculumItem).filter(
-        CurriculumItem.curriculum_item_id == curriculum_item_id
-    ).first()
-    if not curriculum_item:
-        raise HTTPException(status_code=404, detail="Curriculum item not found")
+    """관련 글 (제목/본문의 문자 n-gram TF-IDF 코사인 유사도 순, 같은 커리큘럼 아이템의 다른 레벨 글 제외)"""
+    source = read_models.article_summaries(db, [article_id]).get(article_id)
+    if source is None:
+        raise HTTPException(status_code=404, detail="Article not found")
     
-    # TODO: 실제 AI 생성 로직 구현 필요
-    # 더미 글 생성
-    import uuid
-    article_id = f"art_{uuid.uuid4().hex[:8]}"
+    # 같은 아이템의 다른 레벨 글(최대 레벨 수만큼)과 삭제된 글을 걸러낼 여유분까지 조회
+    entries = similarity_index.similar(db, "article", article_id, limit * 2 + 3)
+    rows = read_models.article_summaries(db, [entry.entity_id for entry in entries])
+    db.release()
     
+    related = [
+        (*rows[entry.entity_id], entry.score)
+        for entry in entries
+        if entry.entity_id in rows and rows[entry.entity_id].curriculum_item_id != source.curriculum_item_id
+    ]
+    return related_article_encoder.response(related[:limit])
+
+
+def _dummy_article_content(curriculum_item: CurriculumItem, request: GenerateArticleRequest) -> Tuple[str, str]:
+    """더미 글 제목/본문 (title, body)"""
     # 더미 컨텐츠 생성
     level_names = {
         "beginner": "기초",
@@ -250,6 +241,34 @@ TODO: 실제 AI로 생성된 고품질 학습 컨텐츠가 이 위치에 들어
 
 이 내용을 통해 학습자는 {curriculum_item.title}에 대한 체계적인 이해를 얻을 수 있습니다.
 """.strip()
+    return title, body
+
+
+@router.post("/curriculum-items/{curriculum_item_id}/articles/generate", response_model=GenerateArticleResponse)
+async def generate_article(
+    curriculum_item_id: str,
+    request: GenerateArticleRequest,
+    db: LazySession = Depends(get_db)
+):
+    """AI 글 생성"""
+    # 커리큘럼 아이템 존재 확인
+    curriculum_item = db.query(CurriculumItem).filter(
+        CurriculumItem.curriculum_item_id == curriculum_item_id
+    ).first()
+    if not curriculum_item:
+        raise HTTPException(status_code=404, detail="Curriculum item not found")
+    
+    # TODO: 실제 AI 생성 로직 구현 필요
+    # 더미 글 생성
+    import uuid
+    article_id = f"art_{uuid.uuid4().hex[:8]}"
+    
+    # 같은 소주제에 제목이 거의 같은 아이템의 같은 레벨 글이 있으면 생성 없이 복제
+    reusable = article_reuse.find(db, curriculum_item, request.level)
+    if reusable is not None:
+        title, body = reusable.title, reusable.body
+    else:
+        title, body = _dummy_article_content(curriculum_item, request)
     
     new_article = Article(
         article_id=article_id,
@@ -261,13 +280,18 @@ TODO: 실제 AI로 생성된 고품질 학습 컨텐츠가 이 위치에 들어
     )
     
     db.add(new_article)
+    article_body_store.save(db, new_article)
+    progress_tracker.record_article_added(db, new_article)
+    # commit 뒤 refresh로 커넥션을 다시 잡지 않도록 응답을 먼저 만듦 (값은 모두 파이썬에서 정해짐)
+    response = GenerateArticleResponse(
+        article_id=article_id,
+        title=title,
+        body=body,
+        level_code=request.level,
+        curriculum_item_id=curriculum_item_id
+    )
     db.commit()
-    db.refresh(new_article)
-    
-    return GenerateArticleResponse(
-        article_id=new_article.article_id,
-        title=new_article.title,
-        body=new_article.body,
-        level_code=new_article.level_code,
-        curriculum_item_id=new_article.curriculum_item_id
-    )
\ No newline at end of file
+    db.release()
+    article_cache.invalidate(article_id)
+    similarity_index.add("article", article_id, document_text(title, body))
+    return response
\ No newline at end of file
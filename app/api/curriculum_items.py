@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.database.database import get_db
-from app.models import LearningPath, CurriculumItem, Article
+from typing import List, Optional, Tuple
+from app.database.database import LazySession, get_db
+from app.models import CurriculumItem
+from app.services import read_models
+from app.services.fast_json import RowEncoder
+from app.services.pagination import keyset_page, page_limit, with_next_cursor
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api", tags=["CurriculumItem"])
@@ -15,31 +17,26 @@ class CurriculumItemResponse(BaseModel):
     has_articles: bool
 
 
+curriculum_item_encoder = RowEncoder(CurriculumItemResponse)
+
+
 @router.get("/learning-paths/{path_id}/curriculum-items", response_model=List[CurriculumItemResponse])
-async def get_curriculum_items(path_id: str, db: Session = Depends(get_db)):
-    """커리큘럼 아이템 목록 조회"""
+async def get_curriculum_items(
+    path_id: str,
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db)
+):
+    """커리큘럼 아이템 목록 조회 (limit/cursor를 주면 sort_order 기준 커서 페이지네이션)"""
     # 학습 경로 존재 확인
-    learning_path = db.query(LearningPath).filter(LearningPath.path_id == path_id).first()
-    if not learning_path:
+    if not read_models.learning_path_exists(db, path_id):
         raise HTTPException(status_code=404, detail="Learning path not found")
     
-    # 커리큘럼 아이템들 조회 (순서대로)
-    curriculum_items = db.query(CurriculumItem).filter(
-        CurriculumItem.path_id == path_id
-    ).order_by(CurriculumItem.sort_order).all()
-    
-    result = []
-    for item in curriculum_items:
-        # 각 커리큘럼 아이템에 글이 있는지 확인
-        has_articles = db.query(Article).filter(
-            Article.curriculum_item_id == item.curriculum_item_id
-        ).count() > 0
-        
-        result.append(CurriculumItemResponse(
-            curriculum_item_id=item.curriculum_item_id,
-            title=item.title,
-            sort_order=item.sort_order,
-            has_articles=has_articles
-        ))
-    
-    return result
\ No newline at end of file
+    limit, cursor = page
+    if limit is None:
+        rows, next_cursor = read_models.curriculum_items(db, path_id), None
+    else:
+        rows, next_cursor = keyset_page(
+            read_models.curriculum_items_query(db, path_id), [CurriculumItem.sort_order], lambda row: (row[2],), limit, cursor
+        )
+    db.release()
+    return with_next_cursor(curriculum_item_encoder.response(rows), next_cursor)
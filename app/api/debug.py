@@ -1,12 +1,14 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from sqlalchemy import text, inspect
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
 import uuid
 from datetime import datetime
 
-from app.database.database import get_db, engine
+from app.database.database import LazySession, get_db, engine
+from app.database.rebuild_similarity_index import rebuild_similarity_index
+from app.database.slow_query_log import slow_query_log
 from app.config import settings
 from app.models.user import User
 from app.models.level import Level
@@ -16,6 +18,15 @@ from app.models.learning_path import LearningPath
 from app.models.curriculum_item import CurriculumItem
 from app.models.article import Article
 from app.models.user_article_read import UserArticleRead
+from app.services.article_body_store import article_body_store
+from app.services.catalog_cache import catalog_cache
+from app.services.article_cache import article_cache
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.popularity import popularity_rollups
+from app.services.progress_tracker import progress_tracker
+from app.services.article_reuse import article_reuse
+from app.services.read_state import read_state_cache
+from app.services.similarity_index import similarity_index
 
 router = APIRouter(
     prefix="/debug",
@@ -34,7 +45,7 @@ def is_debug_enabled():
 
 
 @router.get("/tables", dependencies=[Depends(is_debug_enabled)])
-async def list_tables(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def list_tables(db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """데이터베이스의 모든 테이블 목록 조회"""
     try:
         inspector = inspect(engine)
@@ -49,7 +60,7 @@ async def list_tables(db: Session = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.get("/tables/{table_name}", dependencies=[Depends(is_debug_enabled)])
-async def get_table_info(table_name: str, db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_table_info(table_name: str, db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """특정 테이블의 구조 정보 조회"""
     try:
         inspector = inspect(engine)
@@ -109,9 +120,10 @@ async def get_table_data(
     table_name: str, 
     limit: int = 100, 
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: LazySession = Depends(get_db)
 ) -> Dict[str, Any]:
-    """특정 테이블의 데이터 조회"""
+    """특정 테이블의 데이터 조회 (cursor를 주면 rowid 기준 keyset, 아니면 offset)"""
     try:
         inspector = inspect(engine)
         
@@ -123,16 +135,27 @@ async def get_table_data(
         count_result = db.execute(text(f"SELECT COUNT(*) as count FROM {table_name}"))
         total_count = count_result.fetchone()[0]
         
-        # 데이터 조회
-        data_result = db.execute(text(f"SELECT * FROM {table_name} LIMIT {limit} OFFSET {offset}"))
-        columns = data_result.keys()
+        # 데이터 조회 - 커서가 있으면 OFFSET 없이 rowid 인덱스로 바로 이동
+        if cursor is not None:
+            after_rowid = decode_cursor(cursor, (int,))[0]
+            data_result = db.execute(
+                text(f"SELECT rowid AS _cursor_rowid, * FROM {table_name} WHERE rowid > :after ORDER BY rowid LIMIT {limit + 1}"),
+                {"after": after_rowid}
+            )
+        else:
+            data_result = db.execute(text(f"SELECT rowid AS _cursor_rowid, * FROM {table_name} LIMIT {limit + 1} OFFSET {offset}"))
+        columns = list(data_result.keys())[1:]
         rows = data_result.fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1][0]])
         
         # 결과를 딕셔너리 형태로 변환
         data = []
         for row in rows:
             row_dict = {}
-            for i, col in enumerate(columns):
+            for i, col in enumerate(columns, start=1):
                 value = row[i]
                 # JSON 문자열인 경우 파싱 시도
                 if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
@@ -149,6 +172,7 @@ async def get_table_data(
             "returned_count": len(data),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "data": data
         }
     except HTTPException:
@@ -159,7 +183,7 @@ async def get_table_data(
 
 
 @router.get("/db-stats", dependencies=[Depends(is_debug_enabled)])
-async def get_database_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_database_stats(db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """데이터베이스 전체 통계 정보"""
     try:
         inspector = inspect(engine)
@@ -189,7 +213,7 @@ async def get_database_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.delete("/tables/{table_name}", dependencies=[Depends(is_debug_enabled)])
-async def clear_table(table_name: str, db: Session = Depends(get_db)) -> Dict[str, str]:
+async def clear_table(table_name: str, db: LazySession = Depends(get_db)) -> Dict[str, str]:
     """특정 테이블의 모든 데이터 삭제 (개발용)"""
     try:
         inspector = inspect(engine)
@@ -198,26 +222,64 @@ async def clear_table(table_name: str, db: Session = Depends(get_db)) -> Dict[st
         if table_name not in inspector.get_table_names():
             raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
         
-        # 데이터 삭제
+        # 데이터 삭제 후 파생 데이터(진행률/읽음 비트맵, 인기 집계, 유사도 인덱스)를 다시 계산
         result = db.execute(text(f"DELETE FROM {table_name}"))
+        progress_tracker.rebuild(db)
+        popularity_rollups.rebuild(db)
         db.commit()
-        
-        return {
-            "message": f"All data from table '{table_name}' has been deleted",
-            "table_name": table_name,
-            "rows_affected": str(result.rowcount) if hasattr(result, 'rowcount') else "unknown"
-        }
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error clearing table: {str(e)}")
+    db.release()
+    catalog_cache.invalidate()
+    article_cache.clear()
+    await asyncio.to_thread(rebuild_similarity_index)
+    
+    return {
+        "message": f"All data from table '{table_name}' has been deleted",
+        "table_name": table_name,
+        "rows_affected": str(result.rowcount) if hasattr(result, 'rowcount') else "unknown"
+    }
+
+
+@router.get("/caches", dependencies=[Depends(is_debug_enabled)])
+async def get_cache_stats() -> Dict[str, Any]:
+    """인메모리 캐시 통계 (적중률, 메모리 사용량)"""
+    return {
+        "catalog": catalog_cache.stats(),
+        "articles": article_cache.stats(),
+        "read_state": read_state_cache.stats(),
+        "article_reuse": article_reuse.stats()
+    }
+
+
+@router.get("/slow-queries", dependencies=[Depends(is_debug_enabled)])
+async def get_slow_queries(limit: int = 50, full_scan_only: bool = False) -> Dict[str, Any]:
+    """느린 쿼리 기록 조회 (최근 순, EXPLAIN QUERY PLAN 포함)"""
+    entries = slow_query_log.entries()
+    if full_scan_only:
+        entries = [entry for entry in entries if entry["full_scan"]]
+    return {
+        "threshold_ms": slow_query_log.threshold_ns / 1_000_000,
+        "total_recorded": slow_query_log.total_recorded,
+        "returned_count": len(entries[:limit]),
+        "queries": entries[:limit]
+    }
+
+
+@router.delete("/slow-queries", dependencies=[Depends(is_debug_enabled)])
+async def clear_slow_queries() -> Dict[str, str]:
+    """느린 쿼리 기록 초기화"""
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
 
 
 # 데이터 생성 API 엔드포인트들
 
 @router.post("/data/users", dependencies=[Depends(is_debug_enabled)])
-async def create_user(user_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_user(user_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """사용자 데이터 생성"""
     try:
         user = User(
@@ -243,7 +305,7 @@ async def create_user(user_data: Dict[str, Any], db: Session = Depends(get_db))
 
 
 @router.post("/data/levels", dependencies=[Depends(is_debug_enabled)])
-async def create_level(level_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_level(level_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """난이도 데이터 생성"""
     try:
         level = Level(
@@ -254,6 +316,7 @@ async def create_level(level_data: Dict[str, Any], db: Session = Depends(get_db)
         db.add(level)
         db.commit()
         db.refresh(level)
+        catalog_cache.invalidate()
         
         return {
             "message": "Level created successfully",
@@ -269,7 +332,7 @@ async def create_level(level_data: Dict[str, Any], db: Session = Depends(get_db)
 
 
 @router.post("/data/main-topics", dependencies=[Depends(is_debug_enabled)])
-async def create_main_topic(topic_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_main_topic(topic_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """메인 토픽 데이터 생성"""
     try:
         main_topic = MainTopic(
@@ -279,6 +342,7 @@ async def create_main_topic(topic_data: Dict[str, Any], db: Session = Depends(ge
         db.add(main_topic)
         db.commit()
         db.refresh(main_topic)
+        catalog_cache.invalidate()
         
         return {
             "message": "Main topic created successfully",
@@ -294,7 +358,7 @@ async def create_main_topic(topic_data: Dict[str, Any], db: Session = Depends(ge
 
 
 @router.post("/data/sub-topics", dependencies=[Depends(is_debug_enabled)])
-async def create_sub_topic(topic_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_sub_topic(topic_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """서브 토픽 데이터 생성"""
     try:
         sub_topic = SubTopic(
@@ -306,6 +370,8 @@ async def create_sub_topic(topic_data: Dict[str, Any], db: Session = Depends(get
         db.add(sub_topic)
         db.commit()
         db.refresh(sub_topic)
+        catalog_cache.invalidate()
+        similarity_index.add_sub_topic(sub_topic)
         
         return {
             "message": "Sub topic created successfully",
@@ -323,7 +389,7 @@ async def create_sub_topic(topic_data: Dict[str, Any], db: Session = Depends(get
 
 
 @router.post("/data/learning-paths", dependencies=[Depends(is_debug_enabled)])
-async def create_learning_path(path_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_learning_path(path_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """학습 경로 데이터 생성"""
     try:
         learning_path = LearningPath(
@@ -353,7 +419,7 @@ async def create_learning_path(path_data: Dict[str, Any], db: Session = Depends(
 
 
 @router.post("/data/curriculum-items", dependencies=[Depends(is_debug_enabled)])
-async def create_curriculum_item(item_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_curriculum_item(item_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """커리큘럼 아이템 데이터 생성"""
     try:
         curriculum_item = CurriculumItem(
@@ -383,7 +449,7 @@ async def create_curriculum_item(item_data: Dict[str, Any], db: Session = Depend
 
 
 @router.post("/data/articles", dependencies=[Depends(is_debug_enabled)])
-async def create_article(article_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_article(article_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """아티클 데이터 생성"""
     try:
         article = Article(
@@ -395,8 +461,12 @@ async def create_article(article_data: Dict[str, Any], db: Session = Depends(get
             body=article_data["body"]
         )
         db.add(article)
+        article_body_store.save(db, article)
+        progress_tracker.record_article_added(db, article)
         db.commit()
         db.refresh(article)
+        article_cache.invalidate(article.article_id)
+        similarity_index.add_article(article)
         
         return {
             "message": "Article created successfully",
@@ -406,7 +476,7 @@ async def create_article(article_data: Dict[str, Any], db: Session = Depends(get
                 "sub_topic_id": article.sub_topic_id,
                 "level_code": article.level_code,
                 "title": article.title,
-                "body": article.body[:100] + "..." if len(article.body) > 100 else article.body
+                "body": article.preview
             }
         }
     except Exception as e:
@@ -415,7 +485,7 @@ async def create_article(article_data: Dict[str, Any], db: Session = Depends(get
 
 
 @router.post("/data/user-article-reads", dependencies=[Depends(is_debug_enabled)])
-async def create_user_article_read(read_data: Dict[str, Any], db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def create_user_article_read(read_data: Dict[str, Any], db: LazySession = Depends(get_db)) -> Dict[str, Any]:
     """사용자 아티클 읽기 기록 생성"""
     try:
         user_read = UserArticleRead(
@@ -424,6 +494,7 @@ async def create_user_article_read(read_data: Dict[str, Any], db: Session = Depe
             read_at=datetime.fromisoformat(read_data.get("read_at", datetime.now().isoformat()))
         )
         db.add(user_read)
+        progress_tracker.count_new_read(db, user_read.user_id, user_read.article_id, user_read.read_at)
         db.commit()
         db.refresh(user_read)
         
@@ -443,49 +514,49 @@ async def create_user_article_read(read_data: Dict[str, Any], db: Session = Depe
 # 참조 데이터 조회를 위한 헬퍼 엔드포인트들
 
 @router.get("/reference/main-topics", dependencies=[Depends(is_debug_enabled)])
-async def get_main_topics_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_main_topics_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """메인 토픽 참조 데이터"""
     topics = db.query(MainTopic).all()
     return [{"id": t.main_topic_id, "name": t.name} for t in topics]
 
 
 @router.get("/reference/sub-topics", dependencies=[Depends(is_debug_enabled)])
-async def get_sub_topics_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_sub_topics_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """서브 토픽 참조 데이터"""
     topics = db.query(SubTopic).all()
     return [{"id": t.sub_topic_id, "name": t.name, "main_topic_id": t.main_topic_id} for t in topics]
 
 
 @router.get("/reference/learning-paths", dependencies=[Depends(is_debug_enabled)])
-async def get_learning_paths_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_learning_paths_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """학습 경로 참조 데이터"""
     paths = db.query(LearningPath).all()
     return [{"id": p.path_id, "title": p.title, "sub_topic_id": p.sub_topic_id} for p in paths]
 
 
 @router.get("/reference/curriculum-items", dependencies=[Depends(is_debug_enabled)])
-async def get_curriculum_items_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_curriculum_items_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """커리큘럼 아이템 참조 데이터"""
     items = db.query(CurriculumItem).all()
     return [{"id": i.curriculum_item_id, "title": i.title, "sub_topic_id": i.sub_topic_id} for i in items]
 
 
 @router.get("/reference/levels", dependencies=[Depends(is_debug_enabled)])
-async def get_levels_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_levels_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """레벨 참조 데이터"""
     levels = db.query(Level).all()
     return [{"code": l.level_code, "name": l.name} for l in levels]
 
 
 @router.get("/reference/users", dependencies=[Depends(is_debug_enabled)])
-async def get_users_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_users_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """사용자 참조 데이터"""
     users = db.query(User).all()
     return [{"id": u.user_id, "nickname": u.nickname} for u in users]
 
 
 @router.get("/reference/articles", dependencies=[Depends(is_debug_enabled)])
-async def get_articles_reference(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_articles_reference(db: LazySession = Depends(get_db)) -> List[Dict[str, Any]]:
     """아티클 참조 데이터"""
     articles = db.query(Article).all()
     return [{"id": a.article_id, "title": a.title, "level_code": a.level_code} for a in articles]
\ No newline at end of file
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
 from datetime import datetime
-import asyncio
 from typing import Dict, Any
 
-from app.database.database import get_db
 from app.config import settings
+from app.services.health_prober import health_prober
+from app.services.metrics import metrics, pool_status
+from app.services.catalog_cache import catalog_cache
+from app.services.article_cache import article_cache
 
 router = APIRouter(
     prefix="",
@@ -14,12 +15,29 @@ router = APIRouter(
 )
 
 
+def _cache_gauge(field: str):
+    def collect():
+        return {
+            (("cache", "catalog"),): catalog_cache.stats()[field],
+            (("cache", "articles"),): article_cache.stats()[field],
+        }
+    return collect
+
+
+metrics.gauge("infou_cache_hits", "Cache hits since start", _cache_gauge("hits"))
+metrics.gauge("infou_cache_misses", "Cache misses since start", _cache_gauge("misses"))
+metrics.gauge("infou_cache_bytes", "Bytes held by in-memory response caches", _cache_gauge("bytes"))
+
+
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def health_check() -> Dict[str, Any]:
     """
     헬스체크 엔드포인트
     데이터베이스 연결, 서비스 상태 등을 확인하여 반환
+    (DB/LLM 상태는 백그라운드 프로버가 주기적으로 갱신한 값을 사용)
     """
+    latency = metrics.summary()
+    pool = pool_status()
     health_status = {
         "status": "healthy",
         "version": settings.app_version,
@@ -29,31 +47,62 @@ async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
             "llm_providers": []
         },
         "metrics": {
-            "avg_response_time": "0ms",
-            "active_sessions": 0,
-            "generation_queue": 0
+            "avg_response_time": f"{latency['avg_ms']}ms",
+            "active_sessions": pool["checked_out"],
+            "generation_queue": metrics.in_flight_generation,
+            "latency": latency,
+            "db_pool": pool
         }
     }
     
+    snapshot = health_prober.snapshot
+    
     # 데이터베이스 연결 상태 확인
-    try:
-        db.execute(text("SELECT 1"))
+    if snapshot["database"]["status"] == "connected" and not health_prober.is_stale():
         health_status["services"]["database"] = "connected"
-    except Exception as e:
+    else:
         health_status["services"]["database"] = "disconnected"
         health_status["status"] = "degraded"
     
     # LLM 프로바이더 상태 확인
-    available_providers = []
-    if settings.openai_api_key:
-        available_providers.append("openai")
-    if settings.anthropic_api_key:
-        available_providers.append("anthropic")
-    
+    available_providers = snapshot["llm_providers"]
     health_status["services"]["llm_providers"] = available_providers
     
     # LLM 프로바이더가 없으면 제한된 상태로 설정
     if not available_providers:
         health_status["status"] = "limited"
     
-    return health_status
\ No newline at end of file
+    return health_status
+
+
+@router.get("/health/live")
+async def liveness_check() -> Dict[str, str]:
+    """Liveness 프로브 - 프로세스가 요청을 처리할 수 있는지만 확인 (의존성 확인 없음)"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness 프로브
+    백그라운드 프로버가 캐시한 DB/LLM 상태를 그대로 반환하며 커넥션 풀을 사용하지 않음
+    준비되지 않았거나 프로버 결과가 오래되었으면 503
+    """
+    snapshot = health_prober.snapshot
+    stale = health_prober.is_stale()
+    ready = snapshot["ready"] and not stale
+    content = {
+        "status": "ready" if ready else "not_ready",
+        "stale": stale,
+        **snapshot
+    }
+    return JSONResponse(content=content, status_code=200 if ready else 503)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> str:
+    """Prometheus 형식 메트릭 (라우트별 지연시간 p50/p95/p99, 진행 중 요청, 커넥션 풀, 캐시)"""
+    return PlainTextResponse(
+        metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
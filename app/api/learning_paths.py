@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from typing import List
-from app.database.database import get_db
+from app.database.database import LazySession, get_db
 from app.models import SubTopic, LearningPath, CurriculumItem
+from app.services import read_models
+from app.services.fast_json import RowEncoder
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api", tags=["LearningPath"])
@@ -37,61 +38,44 @@ class GenerateLearningPathResponse(BaseModel):
     curriculum_items: List[CurriculumItemResponse]
 
 
+learning_path_list_encoder = RowEncoder(LearningPathListResponse)
+
+
 @router.get("/sub-topics/{sub_topic_id}/learning-paths", response_model=List[LearningPathListResponse])
-async def get_learning_paths(sub_topic_id: int, db: Session = Depends(get_db)):
+async def get_learning_paths(sub_topic_id: int, db: LazySession = Depends(get_db)):
     """학습 경로 목록 조회"""
     # 소주제 존재 확인
-    sub_topic = db.query(SubTopic).filter(SubTopic.sub_topic_id == sub_topic_id).first()
-    if not sub_topic:
+    if not read_models.sub_topic_exists(db, sub_topic_id):
         raise HTTPException(status_code=404, detail="Sub topic not found")
     
-    # 학습 경로들 조회
-    learning_paths = db.query(LearningPath).filter(
-        LearningPath.sub_topic_id == sub_topic_id
-    ).all()
-    
-    result = []
-    for path in learning_paths:
-        # 각 경로의 커리큘럼 수 계산
-        curriculum_count = db.query(CurriculumItem).filter(
-            CurriculumItem.path_id == path.path_id
-        ).count()
-        
-        result.append(LearningPathListResponse(
-            path_id=path.path_id,
-            title=path.title,
-            description=path.description or "",
-            curriculum_count=curriculum_count,
-            estimated_hours=curriculum_count * 2  # 더미 계산: 커리큘럼당 2시간
-        ))
-    
-    return result
+    rows = read_models.learning_paths(db, sub_topic_id)
+    db.release()
+    return learning_path_list_encoder.response(rows)
 
 
 @router.get("/learning-paths/{path_id}", response_model=LearningPathDetailResponse)
-async def get_learning_path_detail(path_id: str, db: Session = Depends(get_db)):
+async def get_learning_path_detail(path_id: str, db: LazySession = Depends(get_db)):
     """특정 학습 경로 상세 조회"""
     # 학습 경로 존재 확인
-    learning_path = db.query(LearningPath).filter(LearningPath.path_id == path_id).first()
+    learning_path = read_models.learning_path(db, path_id)
     if not learning_path:
         raise HTTPException(status_code=404, detail="Learning path not found")
     
     # 커리큘럼 아이템들 조회 (순서대로)
-    curriculum_items = db.query(CurriculumItem).filter(
-        CurriculumItem.path_id == path_id
-    ).order_by(CurriculumItem.sort_order).all()
+    items = read_models.path_items(db, path_id)
+    db.release()
     
     return LearningPathDetailResponse(
         path_id=learning_path.path_id,
         title=learning_path.title,
-        description=learning_path.description or "",
+        description=learning_path.description,
         curriculum_items=[
             CurriculumItemResponse(
                 curriculum_item_id=item.curriculum_item_id,
                 title=item.title,
                 sort_order=item.sort_order
             )
-            for item in curriculum_items
+            for item in items
         ]
     )
 
@@ -100,7 +84,7 @@ async def get_learning_path_detail(path_id: str, db: Session = Depends(get_db)):
 async def generate_learning_path(
     sub_topic_id: int,
     request: GenerateLearningPathRequest,
-    db: Session = Depends(get_db)
+    db: LazySession = Depends(get_db)
 ):
     """AI 커리큘럼 생성"""
     # 소주제 존재 확인
@@ -142,10 +126,12 @@ async def generate_learning_path(
             sort_order=curriculum_item.sort_order
         ))
     
-    db.commit()
-    
-    return GenerateLearningPathResponse(
+    # commit 뒤 만료된 속성을 다시 읽지 않도록 응답을 먼저 만듦
+    response = GenerateLearningPathResponse(
         path_id=path_id,
         title=new_path.title,
         curriculum_items=curriculum_items
-    )
\ No newline at end of file
+    )
+    db.commit()
+    db.release()
+    return response
\ No newline at end of file
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
-from app.database.database import get_db
-from app.models import Level
+from app.database.database import LazySession, get_db
+from app.services import read_models
+from app.services.fast_json import RowEncoder
+from app.services.catalog_cache import catalog_cache
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api", tags=["Level"])
@@ -14,16 +16,20 @@ class LevelResponse(BaseModel):
     description: str
 
 
+level_encoder = RowEncoder(LevelResponse)
+
+
+def load_levels(db: Session) -> bytes:
+    """난이도 목록 응답 바이트 (카탈로그 캐시 로더)"""
+    return level_encoder.encode_list(read_models.levels(db))
+
+
+catalog_cache.register("levels", load_levels)
+
+
 @router.get("/levels", response_model=List[LevelResponse])
-async def get_levels(db: Session = Depends(get_db)):
+async def get_levels(db: LazySession = Depends(get_db)):
     """난이도 목록 조회"""
-    levels = db.query(Level).all()
-    
-    return [
-        LevelResponse(
-            level_code=level.level_code,
-            name=level.name,
-            description=level.description or ""
-        )
-        for level in levels
-    ]
\ No newline at end of file
+    response = catalog_cache.response(db, "levels")
+    db.release()
+    return response
\ No newline at end of file
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional
-from app.database.database import get_db
+from typing import List, Optional, Tuple
+from app.database.database import LazySession, get_db
 from app.models import Article, UserArticleRead, User, CurriculumItem, LearningPath, SubTopic
-from pydantic import BaseModel
 from datetime import datetime
+from app.services import read_models
+from app.services.fast_json import RowEncoder
+from app.services.pagination import DEFAULT_PAGE_SIZE, keyset_page, page_limit, with_next_cursor
+from app.services.progress_tracker import progress_tracker
+from app.services.read_event_log import read_event_log
+from app.services.read_state import positions_mask, read_state_cache
+from pydantic import BaseModel
 
 router = APIRouter(prefix="/api", tags=["UserArticleRead"])
 
@@ -18,6 +22,47 @@ class CurrentArticleResponse(BaseModel):
     article_id: str
     title: str
 
+class ResumeArticleResponse(BaseModel):
+    article_id: str
+    title: str
+    curriculum_item_id: str
+    sort_order: int
+
+class ResumeResponse(BaseModel):
+    path_id: str
+    level_code: str
+    current_article: Optional[ResumeArticleResponse] = None  # 모두 읽었으면 null
+
+class PathReadStateItem(BaseModel):
+    curriculum_item_id: str
+    title: str
+    sort_order: int
+    article_id: Optional[str] = None  # 해당 레벨 글이 아직 없으면 null
+    is_read: bool
+
+class PathReadStateResponse(BaseModel):
+    path_id: str
+    level_code: str
+    total_articles: int
+    read_articles: int
+    progress_percentage: int
+    items: List[PathReadStateItem]
+
+class UnreadArticleResponse(BaseModel):
+    article_id: str
+    title: str
+    curriculum_item_id: str
+    level_code: str
+    path_id: str
+    sort_order: int
+
+class ReadHistoryResponse(BaseModel):
+    article_id: str
+    title: str
+    level_code: str
+    curriculum_item_id: str
+    read_at: str
+
 class ProgressResponse(BaseModel):
     total_articles: int
     read_articles: int
@@ -36,50 +81,41 @@ def get_user_id_from_token(authorization: str) -> str:
 @router.post("/articles/{article_id}/read", response_model=ReadResponse)
 async def mark_article_read(
     article_id: str,
-    db: Session = Depends(get_db),
+    db: LazySession = Depends(get_db),
     authorization: str = Header()
 ):
     """글 읽음 처리"""
     user_id = get_user_id_from_token(authorization)
     
-    # 글 존재 확인
-    article = db.query(Article).filter(Article.article_id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    # 이미 읽은 기록이 있는지 확인
-    existing_read = db.query(UserArticleRead).filter(
-        UserArticleRead.user_id == user_id,
-        UserArticleRead.article_id == article_id
-    ).first()
-    
-    if existing_read:
-        # 이미 읽은 경우 시간만 업데이트
-        existing_read.read_at = datetime.utcnow()
-        read_record = existing_read
-    else:
-        # 새로운 읽음 기록 생성
-        read_record = UserArticleRead(
-            user_id=user_id,
-            article_id=article_id,
-            read_at=datetime.utcnow()
-        )
-        db.add(read_record)
+    if read_event_log.enabled:
+        # 로그에 덧붙이고 바로 응답 - DB 반영은 압축기가 일괄 처리
+        if not read_models.article_exists(db, article_id):
+            raise HTTPException(status_code=404, detail="Article not found")
+        db.release()
+        read_at = datetime.utcnow()
+        read_event_log.append(user_id, article_id, read_at)
+        return ReadResponse(article_id=article_id, read_at=read_at.isoformat() + "Z")
     
-    db.commit()
-    db.refresh(read_record)
+    # 읽음 기록 + 진행률 집계 갱신 (글이 없으면 None)
+    read_record = progress_tracker.record_read(db, user_id, article_id)
+    if read_record is None:
+        raise HTTPException(status_code=404, detail="Article not found")
     
-    return ReadResponse(
+    # commit 뒤 refresh로 커넥션을 다시 잡지 않도록 응답을 먼저 만듦 (값은 모두 파이썬에서 정해짐)
+    response = ReadResponse(
         article_id=read_record.article_id,
         read_at=read_record.read_at.isoformat() + "Z"
     )
+    db.commit()
+    db.release()
+    return response
 
 
 @router.get("/users/{user_id}/progress", response_model=ProgressResponse)
 async def get_user_progress(
     user_id: str,
     sub_topic_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: LazySession = Depends(get_db),
     authorization: str = Header()
 ):
     """사용자 진행률 조회"""
@@ -89,42 +125,11 @@ async def get_user_progress(
     if user_id != token_user_id:
         raise HTTPException(status_code=403, detail="Access forbidden")
     
-    if sub_topic_id:
-        # 특정 소주제의 진행률
-        # 해당 소주제의 모든 글 수 계산
-        total_articles = db.query(Article).filter(Article.sub_topic_id == sub_topic_id).count()
-        
-        # 읽은 글 수 계산
-        read_articles = db.query(UserArticleRead).join(Article).filter(
-            UserArticleRead.user_id == user_id,
-            Article.sub_topic_id == sub_topic_id
-        ).count()
-        
-        # 다음 읽을 글 찾기
-        read_article_ids = db.query(UserArticleRead.article_id).filter(
-            UserArticleRead.user_id == user_id
-        ).subquery()
-        
-        next_article = db.query(Article).filter(
-            Article.sub_topic_id == sub_topic_id,
-            ~Article.article_id.in_(read_article_ids)
-        ).first()
-        
-    else:
-        # 전체 진행률
-        total_articles = db.query(Article).count()
-        read_articles = db.query(UserArticleRead).filter(
-            UserArticleRead.user_id == user_id
-        ).count()
-        
-        # 다음 읽을 글 찾기 (전체에서)
-        read_article_ids = db.query(UserArticleRead.article_id).filter(
-            UserArticleRead.user_id == user_id
-        ).subquery()
-        
-        next_article = db.query(Article).filter(
-            ~Article.article_id.in_(read_article_ids)
-        ).first()
+    # 전체/읽은 글 수는 집계 테이블에서 조회
+    total_articles, read_articles = progress_tracker.progress(db, user_id, sub_topic_id)
+    
+    # 이어 읽을 글: 커리큘럼 순서상 첫 번째 안 읽은 글
+    next_article = read_models.first_unread_article(db, user_id, sub_topic_id=sub_topic_id or None)
     
     progress_percentage = int((read_articles / total_articles * 100)) if total_articles > 0 else 0
     
@@ -134,10 +139,170 @@ async def get_user_progress(
             article_id=next_article.article_id,
             title=next_article.title
         )
+    db.release()
     
     return ProgressResponse(
         total_articles=total_articles,
         read_articles=read_articles,
         progress_percentage=progress_percentage,
         current_article=current_article
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/users/{user_id}/resume", response_model=ResumeResponse)
+async def get_resume_point(
+    user_id: str,
+    path_id: str = Query(...),
+    level: str = Query(...),
+    db: LazySession = Depends(get_db),
+    authorization: str = Header()
+):
+    """학습 경로/레벨별 이어 읽기 위치 조회"""
+    token_user_id = get_user_id_from_token(authorization)
+    
+    if user_id != token_user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+    
+    if not read_models.learning_path_exists(db, path_id):
+        raise HTTPException(status_code=404, detail="Learning path not found")
+    
+    # idx_path_sort_order 순서대로 훑다가 첫 번째 안 읽은 글에서 멈춤
+    article = read_models.first_unread_article(db, user_id, path_id=path_id, level=level)
+    db.release()
+    
+    current_article = None
+    if article:
+        current_article = ResumeArticleResponse(
+            article_id=article.article_id,
+            title=article.title,
+            curriculum_item_id=article.curriculum_item_id,
+            sort_order=article.sort_order
+        )
+    return ResumeResponse(path_id=path_id, level_code=level, current_article=current_article)
+
+
+@router.get("/users/{user_id}/learning-paths/{path_id}/read-state", response_model=PathReadStateResponse)
+async def get_path_read_state(
+    user_id: str,
+    path_id: str,
+    level: str = Query(...),
+    unread_only: bool = Query(False),
+    db: LazySession = Depends(get_db),
+    authorization: str = Header()
+):
+    """학습 경로 화면용 아이템별 읽음 여부와 진행률"""
+    token_user_id = get_user_id_from_token(authorization)
+    
+    if user_id != token_user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+    
+    if not read_models.learning_path_exists(db, path_id):
+        raise HTTPException(status_code=404, detail="Learning path not found")
+    
+    rows = read_models.path_level_articles(db, path_id, level)
+    read_bits = read_state_cache.get(db, user_id, path_id, level)
+    db.release()
+    
+    # 읽음 여부/진행률/필터 모두 비트 연산으로 계산
+    available = positions_mask(row.sort_order for row in rows if row.article_id)
+    read = read_bits & available
+    total_articles = available.bit_count()
+    read_articles = read.bit_count()
+    progress_percentage = int((read_articles / total_articles * 100)) if total_articles > 0 else 0
+    
+    items = []
+    for row in rows:
+        is_read = row.sort_order >= 0 and (read >> row.sort_order) & 1 == 1
+        if unread_only and (is_read or not row.article_id):
+            continue
+        items.append(PathReadStateItem(
+            curriculum_item_id=row.curriculum_item_id,
+            title=row.title,
+            sort_order=row.sort_order,
+            article_id=row.article_id,
+            is_read=is_read
+        ))
+    
+    return PathReadStateResponse(
+        path_id=path_id,
+        level_code=level,
+        total_articles=total_articles,
+        read_articles=read_articles,
+        progress_percentage=progress_percentage,
+        items=items
+    )
+
+
+unread_article_encoder = RowEncoder(UnreadArticleResponse)
+
+
+@router.get("/users/{user_id}/unread", response_model=List[UnreadArticleResponse])
+async def get_unread_articles(
+    user_id: str,
+    sub_topic_id: Optional[int] = Query(None),
+    path_id: Optional[str] = Query(None),
+    level: Optional[str] = Query(None, description="beginner | intermediate | expert"),
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db),
+    authorization: str = Header()
+):
+    """아직 안 읽은 글 목록 (커리큘럼 순서, 항상 커서 페이지네이션 - 다음 커서는 X-Next-Cursor 헤더)"""
+    token_user_id = get_user_id_from_token(authorization)
+    
+    if user_id != token_user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+    
+    if path_id is not None and not read_models.learning_path_exists(db, path_id):
+        raise HTTPException(status_code=404, detail="Learning path not found")
+    if sub_topic_id is not None and not read_models.sub_topic_exists(db, sub_topic_id):
+        raise HTTPException(status_code=404, detail="Sub topic not found")
+    
+    # 읽은 글이 많아도 페이지마다 확인하는 글 수만큼만 user_article_reads PK를 조회
+    # 경로를 지정하면 키에서 path_id를 빼야 커서 조건이 idx_path_sort_order 범위 탐색이 됨
+    limit, cursor = page
+    if path_id is not None:
+        key_columns = [CurriculumItem.sort_order, Article.level_code]
+        key = lambda row: (row.sort_order, row.level_code)
+    else:
+        key_columns = [CurriculumItem.path_id, CurriculumItem.sort_order, Article.level_code]
+        key = lambda row: (row.path_id, row.sort_order, row.level_code)
+    rows, next_cursor = keyset_page(
+        read_models.unread_articles_query(db, user_id, path_id, sub_topic_id, level),
+        key_columns, key, limit or DEFAULT_PAGE_SIZE, cursor
+    )
+    db.release()
+    return with_next_cursor(unread_article_encoder.response(rows), next_cursor)
+
+
+read_history_encoder = RowEncoder(ReadHistoryResponse)
+
+
+@router.get("/users/{user_id}/history", response_model=List[ReadHistoryResponse])
+async def get_reading_history(
+    user_id: str,
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db),
+    authorization: str = Header()
+):
+    """읽은 기록 타임라인 (최근 순, 항상 커서 페이지네이션 - 다음 커서는 X-Next-Cursor 헤더)"""
+    token_user_id = get_user_id_from_token(authorization)
+    
+    if user_id != token_user_id:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+    
+    # (read_at, article_id) 커서로 인덱스 범위 탐색 - 정렬 단계 없음
+    limit, cursor = page
+    rows, next_cursor = keyset_page(
+        read_models.reading_history_query(db, user_id),
+        [UserArticleRead.read_at, UserArticleRead.article_id],
+        lambda row: (row.read_at.isoformat(), row.article_id),
+        limit or DEFAULT_PAGE_SIZE, cursor,
+        descending=True,
+        parse=lambda values: (datetime.fromisoformat(values[0]), values[1])
+    )
+    db.release()
+    
+    return with_next_cursor(read_history_encoder.response(
+        (article_id, title, level_code, curriculum_item_id, read_at.isoformat() + "Z")
+        for article_id, title, level_code, curriculum_item_id, read_at in rows
+    ), next_cursor)
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from typing import List, Optional, Tuple
+from app.database.database import LazySession, get_db
+from app.services import full_text_search
+from app.services.fast_json import RowEncoder
+from app.services.pagination import DEFAULT_PAGE_SIZE, page_limit, with_next_cursor
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api", tags=["Search"])
+
+# Response Models
+class SearchResultResponse(BaseModel):
+    entity_type: str
+    entity_id: str
+    title: str
+    snippet: str  # 일치 부분은 <mark>...</mark>로 감쌈
+    score: float  # 종류별로 정규화한 bm25 관련도 (0 초과 1 이하, 그 종류에서 가장 관련도 높은 결과가 1)
+
+
+search_result_encoder = RowEncoder(SearchResultResponse)
+
+
+@router.get("/search", response_model=List[SearchResultResponse])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백으로 구분한 단어를 모두 포함)"),
+    entity_type: Optional[str] = Query(None, pattern="^(article|sub_topic|main_topic)$", description="article | sub_topic | main_topic"),
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db)
+):
+    """글/소주제/대주제 전문 검색 (관련도 순, 항상 커서 페이지네이션 - 다음 커서는 X-Next-Cursor 헤더)
+
+    3글자 이상 단어는 FTS5 trigram 색인으로 본문까지 찾고, 2글자 이하 단어는 그 결과를 좁히는 데만 씁니다
+    (2글자 이하 단어만 있으면 400).
+    """
+    limit, cursor = page
+    entity_types = [entity_type] if entity_type else full_text_search.ENTITY_TYPES
+    rows, next_cursor = full_text_search.search(db, q, entity_types, limit or DEFAULT_PAGE_SIZE, cursor)
+    db.release()
+
+    return with_next_cursor(search_result_encoder.response(
+        (row.entity_type, row.entity_id, row.title, row.snippet, row.score)
+        for row in rows
+    ), next_cursor)
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
-from app.database.database import get_db
+from typing import List, Optional, Tuple
+from app.database.database import LazySession, get_db
 from app.models import MainTopic, SubTopic
+from app.services import read_models
+from app.services.fast_json import RowEncoder
+from app.services.catalog_cache import catalog_cache
+from app.services.pagination import keyset_page, page_limit, with_next_cursor
+from app.services.similarity_index import document_text, similarity_index
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api", tags=["MainTopic & SubTopic"])
@@ -19,6 +24,13 @@ class SubTopicResponse(BaseModel):
     description: str
     source_type: str
 
+class SimilarSubTopicResponse(BaseModel):
+    sub_topic_id: int
+    name: str
+    description: str
+    source_type: str
+    score: float  # 코사인 유사도
+
 class GenerateSubTopicRequest(BaseModel):
     topic_hint: str
 
@@ -29,49 +41,102 @@ class GenerateSubTopicResponse(BaseModel):
     source_type: str = "generated"
 
 
+main_topic_encoder = RowEncoder(MainTopicResponse)
+sub_topic_encoder = RowEncoder(SubTopicResponse)
+similar_sub_topic_encoder = RowEncoder(SimilarSubTopicResponse)
+
+
+def load_main_topics(db: Session) -> bytes:
+    """대주제 목록 응답 바이트 (카탈로그 캐시 로더)"""
+    return main_topic_encoder.encode_list(read_models.main_topics(db))
+
+
+def load_sub_topics(db: Session, main_topic_id: int) -> Optional[bytes]:
+    """대주제별 소주제 목록 응답 바이트 (카탈로그 캐시 로더, 대주제가 없으면 None)"""
+    if not read_models.main_topic_exists(db, main_topic_id):
+        return None
+    return sub_topic_encoder.encode_list(read_models.sub_topics(db, main_topic_id))
+
+
+catalog_cache.register("main_topics", load_main_topics)
+catalog_cache.register(
+    "sub_topics",
+    load_sub_topics,
+    warm_args=lambda db: db.query(MainTopic.main_topic_id).all()
+)
+
+
 # MainTopic APIs
 @router.get("/main-topics", response_model=List[MainTopicResponse])
-async def get_main_topics(db: Session = Depends(get_db)):
-    """대주제 목록 조회"""
-    topics = db.query(MainTopic).all()
-    return [
-        MainTopicResponse(
-            main_topic_id=topic.main_topic_id,
-            name=topic.name,
-            description=topic.description or ""
-        )
-        for topic in topics
-    ]
+async def get_main_topics(
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db)
+):
+    """대주제 목록 조회 (limit/cursor를 주면 main_topic_id 기준 커서 페이지네이션)"""
+    limit, cursor = page
+    if limit is None:
+        response = catalog_cache.response(db, "main_topics")
+        db.release()
+        return response
+    
+    rows, next_cursor = keyset_page(
+        read_models.main_topics_query(db), [MainTopic.main_topic_id], lambda row: (row[0],), limit, cursor
+    )
+    db.release()
+    return with_next_cursor(main_topic_encoder.response(rows), next_cursor)
 
 
 # SubTopic APIs
 @router.get("/main-topics/{main_topic_id}/sub-topics", response_model=List[SubTopicResponse])
-async def get_sub_topics(main_topic_id: int, db: Session = Depends(get_db)):
-    """소주제 목록 조회"""
+async def get_sub_topics(
+    main_topic_id: int,
+    page: Tuple[Optional[int], Optional[str]] = Depends(page_limit),
+    db: LazySession = Depends(get_db)
+):
+    """소주제 목록 조회 (limit/cursor를 주면 sub_topic_id 기준 커서 페이지네이션)"""
+    limit, cursor = page
+    if limit is None:
+        response = catalog_cache.response(db, "sub_topics", main_topic_id)
     # 대주제 존재 확인
-    main_topic = db.query(MainTopic).filter(MainTopic.main_topic_id == main_topic_id).first()
-    if not main_topic:
+    elif read_models.main_topic_exists(db, main_topic_id):
+        rows, next_cursor = keyset_page(
+            read_models.sub_topics_query(db, main_topic_id), [SubTopic.sub_topic_id], lambda row: (row[0],), limit, cursor
+        )
+        response = with_next_cursor(sub_topic_encoder.response(rows), next_cursor)
+    else:
+        response = None
+    db.release()
+    if response is None:
         raise HTTPException(status_code=404, detail="Main topic not found")
+    return response
+
+
+@router.get("/sub-topics/{sub_topic_id}/similar", response_model=List[SimilarSubTopicResponse])
+async def get_similar_sub_topics(
+    sub_topic_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    db: LazySession = Depends(get_db)
+):
+    """비슷한 소주제 (이름/설명의 문자 n-gram TF-IDF 코사인 유사도 순)"""
+    if not read_models.sub_topic_exists(db, sub_topic_id):
+        raise HTTPException(status_code=404, detail="Sub topic not found")
     
-    # 소주제 조회
-    sub_topics = db.query(SubTopic).filter(SubTopic.main_topic_id == main_topic_id).all()
+    entries = similarity_index.similar(db, "sub_topic", str(sub_topic_id), limit)
+    rows = read_models.sub_topics_by_ids(db, [int(entry.entity_id) for entry in entries])
+    db.release()
     
-    return [
-        SubTopicResponse(
-            sub_topic_id=sub_topic.sub_topic_id,
-            name=sub_topic.name,
-            description=sub_topic.description or "",
-            source_type=sub_topic.source_type
-        )
-        for sub_topic in sub_topics
-    ]
+    # 인덱스 생성 후 삭제된 소주제는 제외
+    return similar_sub_topic_encoder.response(
+        (*rows[int(entry.entity_id)], entry.score)
+        for entry in entries if int(entry.entity_id) in rows
+    )
 
 
 @router.post("/main-topics/{main_topic_id}/sub-topics/generate", response_model=GenerateSubTopicResponse)
 async def generate_sub_topic(
     main_topic_id: int, 
     request: GenerateSubTopicRequest,
-    db: Session = Depends(get_db)
+    db: LazySession = Depends(get_db)
 ):
     """AI 소주제 생성"""
     # 대주제 존재 확인
@@ -89,12 +154,16 @@ async def generate_sub_topic(
     )
     
     db.add(new_sub_topic)
-    db.commit()
-    db.refresh(new_sub_topic)
-    
-    return GenerateSubTopicResponse(
+    db.flush()  # sub_topic_id를 얻기 위해
+    # commit 뒤 refresh로 커넥션을 다시 잡지 않도록 응답을 먼저 만듦
+    response = GenerateSubTopicResponse(
         sub_topic_id=new_sub_topic.sub_topic_id,
         name=new_sub_topic.name,
         description=new_sub_topic.description,
         source_type=new_sub_topic.source_type
-    )
\ No newline at end of file
+    )
+    db.commit()
+    db.release()
+    catalog_cache.invalidate()
+    similarity_index.add("sub_topic", str(response.sub_topic_id), document_text(response.name, response.description))
+    return response
\ No newline at end of file
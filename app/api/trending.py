@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query
+from typing import List
+from app.database.database import LazySession, get_db
+from app.services.fast_json import RowEncoder
+from app.services.popularity import popularity_rollups
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/api", tags=["Trending"])
+
+# Response Models
+class TrendingResponse(BaseModel):
+    entity_type: str
+    entity_id: str
+    title: str
+    read_count: int
+
+
+trending_encoder = RowEncoder(TrendingResponse)
+
+
+@router.get("/trending", response_model=List[TrendingResponse])
+async def get_trending(
+    entity_type: str = Query("article", pattern="^(article|path|sub_topic)$", description="article | path | sub_topic"),
+    hours: int = Query(24, ge=1, le=24 * 90, description="집계 기간 (48시간 이하는 시간 단위, 그 이상은 일 단위 집계)"),
+    limit: int = Query(10, ge=1, le=100),
+    db: LazySession = Depends(get_db)
+):
+    """최근 많이 읽힌 글/학습 경로/소주제"""
+    entries = popularity_rollups.trending(db, entity_type, hours, limit)
+    db.release()
+
+    return trending_encoder.response(
+        (entity_type, entry.entity_id, entry.title, entry.read_count) for entry in entries
+    )
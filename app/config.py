@@ -24,12 +24,50 @@ class Settings(BaseSettings):
     
     # API Configuration  
     cors_origins: str = "http://localhost:3000,http://localhost:8080"
-    api_rate_limit: int = 100  # requests per minute
+    api_rate_limit: int = 100  # requests per minute (0이면 제한 없음)
+    generation_rate_limit: int = 10  # AI 생성 요청 per minute (0이면 제한 없음)
+    rate_limit_trust_forwarded: bool = False  # 프록시 뒤에서 X-Forwarded-For로 클라이언트 식별
     
     # Session Configuration
     session_expires_days: int = 30
     max_articles_per_session: int = 20
     
+    # Query instrumentation
+    query_stats_enabled: bool = True  # 요청별 SQL 수/DB 시간을 Server-Timing 헤더로 노출
+    n_plus_one_threshold: int = 5  # 한 요청에서 같은 형태의 쿼리가 이 횟수 이상이면 N+1 의심
+    slow_query_threshold_ms: float = 100.0  # 이 시간을 넘은 쿼리는 실행 계획과 함께 기록
+    slow_query_log_size: int = 100  # 느린 쿼리 링 버퍼 크기
+    
+    # Cache
+    catalog_cache_ttl: int = 300  # seconds (다른 워커의 카탈로그 변경이 반영되는 최대 지연)
+    article_cache_max_bytes: int = 32 * 1024 * 1024  # 인기 글 응답 캐시 메모리 예산
+    read_state_cache_size: int = 50000  # 메모리에 둘 (사용자, 경로, 레벨) 읽음 비트맵 수
+    read_state_cache_ttl: int = 300  # seconds (다른 워커의 읽음 기록이 반영되는 최대 지연)
+    
+    # Health
+    health_probe_interval: float = 5.0  # seconds (readiness 상태 갱신 주기)
+    
+    # SQLite maintenance
+    db_maintenance_interval: float = 300.0  # seconds (PRAGMA optimize + WAL 체크포인트 주기, 0이면 비활성화)
+    db_analyze_interval: float = 21600.0  # seconds (ANALYZE 주기)
+    wal_truncate_bytes: int = 64 * 1024 * 1024  # -wal 파일이 이 크기 이상이면 TRUNCATE 체크포인트
+    incremental_vacuum_pages: int = 0  # auto_vacuum=INCREMENTAL인 DB에서 주기마다 반환할 페이지 수 (0이면 비활성화)
+    
+    # Read event log
+    read_event_log_enabled: bool = False  # 읽음 처리를 로그 파일에 먼저 쓰고 주기적으로 DB에 일괄 반영
+    read_event_log_dir: str = "./data/read_events"
+    read_event_log_fsync_interval: float = 0.05  # seconds (모아서 fsync하는 간격 = 장애 시 유실 가능 구간)
+    read_event_log_compact_interval: float = 2.0  # seconds (진행률/기록 조회에 반영되기까지의 최대 지연)
+    
+    # Popularity rollups
+    rollup_hourly_retention_days: int = 7  # 시간 단위 읽음 집계 보관 기간 (일 단위 집계는 계속 보관)
+    
+    # Similarity index
+    similarity_index_dir: str = "./data/similarity"
+    similarity_dimensions: int = 128  # n-gram 해시를 접는 벡터 차원 (글 10만 개 = 약 50MB mmap, 조회 비용은 차원에 비례)
+    similarity_delta_max_rows: int = 1000  # 추가된 행이 이만큼 쌓이면 기준 행렬에 합침
+    similarity_update_interval: float = 1.0  # seconds (새 글/소주제를 모아 인덱스에 반영하는 주기)
+    
     # WebSocket
     websocket_connection_timeout: int = 300  # seconds
     
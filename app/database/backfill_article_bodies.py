@@ -0,0 +1,14 @@
+from app.database.database import SessionLocal
+from app.services.article_body_store import article_body_store
+
+def backfill_article_bodies() -> int:
+    """압축 변형본이 없는 기존 글의 article_bodies 레코드를 생성합니다."""
+    db = SessionLocal()
+    try:
+        return article_body_store.backfill(db)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    count = backfill_article_bodies()
+    print(f"{count}개 글의 압축 변형본이 생성되었습니다.")
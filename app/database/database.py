@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Iterator, Optional
 from app.config import settings
 
 # SQLite 최적화 설정
@@ -42,10 +43,52 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+class LazySession:
+    """요청 범위 지연 세션
+
+    실제 Session은 처음 사용할 때 만들고, 커넥션은 첫 쿼리에서 체크아웃합니다.
+    캐시 히트처럼 DB를 쓰지 않는 요청은 세션을 만들지 않습니다.
+    FastAPI는 yield 의존성의 정리 코드를 응답 전송이 끝난 뒤에 실행하므로, 핸들러는
+    마지막 DB 사용 직후 `release()`를 호출해 직렬화/전송 전에 커넥션을 풀에 돌려줍니다.
+    release는 최종적이어서 이후 다시 사용하면 RuntimeError가 발생합니다 (요청당 커넥션
+    체크아웃이 한 번을 넘지 않도록). 나머지 속성은 Session에 위임하므로 서비스 함수에는
+    그대로 넘길 수 있고, 핸들러는 `release()`를 쓰기 위해 `LazySession`으로 받습니다.
+    """
+
+    __slots__ = ("_session", "_released")
+
+    def __init__(self):
+        self._session: Optional[Session] = None
+        self._released = False
+
+    @property
+    def session(self) -> Session:
+        if self._released:
+            raise RuntimeError("DB session used after release()")
+        if self._session is None:
+            self._session = SessionLocal()
+        return self._session
+
+    @property
+    def active(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def release(self):
+        """트랜잭션을 끝내고 커넥션을 풀에 반환합니다 (커밋하지 않은 변경은 롤백)."""
+        self._released = True
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
 # 데이터베이스 세션 의존성
-def get_db():
-    db = SessionLocal()
+# 같은 요청의 중첩 의존성은 FastAPI 의존성 캐시로 같은 LazySession을 공유합니다.
+def get_db() -> Iterator[LazySession]:
+    db = LazySession()
     try:
         yield db
     finally:
-        db.close()
+        db.release()
@@ -0,0 +1,246 @@
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 인덱스 감사 도구
+#
+#   python -m app.database.index_audit [-v]
+#
+# 임시 SQLite DB에 샘플 데이터를 넣고 /api 아래의 모든 GET 라우트와 쓰기 경로
+# (읽음 처리 POST, 일괄 읽음 반영, 비트맵 위치 초기화, 이벤트 로그 압축)를 실행하면서
+# 실행된 SQL의 EXPLAIN QUERY PLAN을 수집해, 인덱스 없이 테이블을 스캔하는
+# 문장을 보고합니다. WHERE 절이 없는 목록 조회(전체 테이블 읽기)는 의도된
+# 스캔으로 보고 -v일 때만 출력합니다. INSERT ... ON CONFLICT upsert는 충돌 대상
+# 유니크 인덱스로만 기존 행을 찾으므로 실행 계획이 비어 있어 분석 대상에서 빠집니다.
+# 문제가 있으면 종료 코드 1을 반환합니다.
+
+# 라우트 경로/쿼리 파라미터에 채울 샘플 값 (seed_database가 만든 데이터와 일치)
+SAMPLE_PARAMS: Dict[str, Any] = {
+    "main_topic_id": 1,
+    "sub_topic_id": 1,
+    "path_id": "audit-path-1",
+    "curriculum_item_id": "audit-path-1-item-2",
+    "article_id": "audit-path-1-item-2-beginner",
+    "user_id": "dummy_user_id",
+    "level": "beginner",
+    "q": "article",
+}
+AUDIT_HEADERS = {"Authorization": "Bearer index-audit"}
+
+
+def seed_database(db):
+    """감사용 샘플 데이터 생성 (주제 2개 x 학습 경로 x 항목 3개 x 레벨 3개)"""
+    from app.models import (
+        Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic, User, UserArticleRead
+    )
+    from app.services.article_body_store import article_body_store
+    from datetime import datetime
+
+    levels = ["beginner", "intermediate", "expert"]
+    db.add_all([Level(level_code=code, name=code) for code in levels])
+    db.add(User(user_id="dummy_user_id", nickname="audit"))
+
+    for topic_no in (1, 2):
+        main_topic = MainTopic(main_topic_id=topic_no, name=f"Main {topic_no}")
+        sub_topic = SubTopic(
+            sub_topic_id=topic_no, main_topic_id=topic_no, name=f"Sub {topic_no}", source_type="curated"
+        )
+        path_id = f"audit-path-{topic_no}"
+        db.add_all([
+            main_topic,
+            sub_topic,
+            LearningPath(path_id=path_id, sub_topic_id=topic_no, title=f"Path {topic_no}", description="audit"),
+        ])
+        for sort_order in (1, 2, 3):
+            item_id = f"{path_id}-item-{sort_order}"
+            db.add(CurriculumItem(
+                curriculum_item_id=item_id, sub_topic_id=topic_no, path_id=path_id,
+                title=f"Item {sort_order}", sort_order=sort_order
+            ))
+            for level_code in levels:
+                article = Article(
+                    article_id=f"{item_id}-{level_code}", curriculum_item_id=item_id, sub_topic_id=topic_no,
+                    level_code=level_code, title=f"Article {sort_order} {level_code}", body="audit body " * 40
+                )
+                db.add(article)
+                article_body_store.save(db, article)
+    db.flush()
+    db.add(UserArticleRead(
+        user_id="dummy_user_id", article_id="audit-path-1-item-1-beginner", read_at=datetime.utcnow()
+    ))
+    db.commit()
+
+
+def api_get_routes(app) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """OpenAPI 스키마에서 /api GET 라우트와 파라미터 목록을 가져옵니다."""
+    routes = []
+    for path, operations in app.openapi()["paths"].items():
+        if path.startswith("/api/") and "get" in operations:
+            routes.append((path, operations["get"].get("parameters", [])))
+    return routes
+
+
+def build_request(path: str, parameters: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    query = {}
+    for parameter in parameters:
+        name = parameter["name"]
+        if parameter["in"] == "path":
+            path = path.replace("{" + name + "}", str(SAMPLE_PARAMS[name]))
+        elif parameter["in"] == "query" and name in SAMPLE_PARAMS:
+            query[name] = SAMPLE_PARAMS[name]
+    return path, query
+
+
+def write_operations(client) -> List[Tuple[str, Callable[[], Optional[int]]]]:
+    """감사할 쓰기 경로 (이름, 실행 함수 → HTTP 상태 또는 None)
+
+    GET 라우트만으로는 실행되지 않는 upsert/병합/정리 문장을 실행합니다.
+    """
+    from datetime import datetime, timedelta
+
+    from app.database.database import SessionLocal
+    from app.services.popularity import popularity_rollups
+    from app.services.progress_tracker import progress_tracker
+    from app.services.read_event_log import read_event_log
+    from app.services.read_state import read_state_cache
+
+    user_id = SAMPLE_PARAMS["user_id"]
+    now = datetime.utcnow()
+
+    def in_session(work: Callable) -> Callable[[], None]:
+        def run():
+            db = SessionLocal()
+            try:
+                work(db)
+                db.commit()
+            finally:
+                db.close()
+        return run
+
+    def post_read() -> int:
+        return client.post(f"/api/articles/{SAMPLE_PARAMS['article_id']}/read", headers=AUDIT_HEADERS).status_code
+
+    def record_reads(db):
+        popularity_rollups._last_pruned = None  # 보관 기간이 지난 시간 단위 집계 정리 문장도 실행
+        article_ids = [f"audit-path-{topic_no}-item-3-expert" for topic_no in (1, 2)]
+        progress_tracker.record_reads(
+            db,
+            {(user_id, article_id): now for article_id in article_ids},
+            {(article_id, now - timedelta(hours=1)): 2 for article_id in article_ids}
+        )
+
+    def clear_position(db):
+        read_state_cache.clear_position(db, SAMPLE_PARAMS["path_id"], SAMPLE_PARAMS["level"], 2)
+
+    def compact_read_events():
+        for level_code in ("beginner", "intermediate"):
+            read_event_log.append(user_id, f"audit-path-2-item-1-{level_code}", now)
+        read_event_log.compact_once()
+
+    return [
+        ("POST /api/articles/{article_id}/read", post_read),
+        ("progress_tracker.record_reads", in_session(record_reads)),
+        ("read_state_cache.clear_position", in_session(clear_position)),
+        ("read_event_log.compact_once", compact_read_events),
+    ]
+
+
+def run_audit() -> List[Dict[str, Any]]:
+    """라우트/쓰기 경로별로 실행된 문장과 실행 계획을 수집합니다."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    import main
+    from app.database.database import SessionLocal, engine
+    from app.database.init_db import init_db
+    from app.database.slow_query_log import explain_query_plan, has_full_scan
+
+    init_db()
+    db = SessionLocal()
+    try:
+        seed_database(db)
+    finally:
+        db.close()
+
+    captured: List[Tuple[str, Any]] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        # executemany(일괄 upsert)는 첫 행의 파라미터로 실행 계획을 봄
+        captured.append((statement, parameters[0] if executemany else parameters))
+
+    client = TestClient(main.app)
+    operations: List[Tuple[str, Callable[[], Optional[int]]]] = []
+    for route, parameters in api_get_routes(main.app):
+        url, query = build_request(route, parameters)
+        operations.append((
+            f"GET {route}",
+            lambda url=url, query=query: client.get(url, params=query, headers=AUDIT_HEADERS).status_code
+        ))
+    operations.extend(write_operations(client))
+
+    results = []
+    raw_connection = engine.raw_connection()
+    try:
+        for name, operation in operations:
+            captured.clear()
+            status = operation()
+            statements = list(captured)
+            for statement, statement_params in statements:
+                plan = explain_query_plan(raw_connection, statement, statement_params)
+                if not plan:
+                    continue
+                sql = " ".join(statement.split())
+                results.append({
+                    "route": name,
+                    "status": status,
+                    "sql": sql,
+                    "plan": plan,
+                    "full_scan": has_full_scan(plan),
+                    "filtered": " WHERE " in sql.upper(),
+                })
+    finally:
+        raw_connection.close()
+        event.remove(engine, "after_cursor_execute", _capture)
+    return results
+
+
+def print_report(results: List[Dict[str, Any]], verbose: bool = False) -> int:
+    findings = [r for r in results if r["full_scan"] and r["filtered"]]
+    routes = sorted({r["route"] for r in results})
+    print(f"{len(routes)}개 라우트/쓰기 경로, {len(results)}개 문장 분석")
+
+    for result in results:
+        if not result["full_scan"] or (not result["filtered"] and not verbose):
+            continue
+        label = "인덱스 없는 스캔" if result["filtered"] else "전체 목록 조회 (의도된 스캔)"
+        status = f" (HTTP {result['status']})" if result["status"] is not None else ""
+        print(f"\n[{label}] {result['route']}{status}")
+        print(f"  {result['sql']}")
+        for line in result["plan"]:
+            print(f"    {line}")
+
+    if findings:
+        print(f"\n{len(findings)}개 문장이 인덱스 없이 테이블을 스캔합니다.")
+    else:
+        print("\n인덱스 없이 스캔하는 조회가 없습니다.")
+    return len(findings)
+
+
+if __name__ == "__main__":
+    # 운영 DB/인덱스 파일을 건드리지 않도록 app을 임포트하기 전에 임시 디렉터리로 전환
+    audit_dir = tempfile.mkdtemp(prefix="infou-index-audit-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{audit_dir}/audit.db"
+    os.environ["SIMILARITY_INDEX_DIR"] = f"{audit_dir}/similarity"
+    os.environ["READ_EVENT_LOG_DIR"] = f"{audit_dir}/read_events"
+    os.environ["DEBUG"] = "false"
+    os.environ["API_RATE_LIMIT"] = "0"
+    os.environ["SLOW_QUERY_THRESHOLD_MS"] = "60000"
+
+    try:
+        finding_count = print_report(run_audit(), verbose="-v" in sys.argv)
+    finally:
+        shutil.rmtree(audit_dir, ignore_errors=True)
+    sys.exit(1 if finding_count else 0)
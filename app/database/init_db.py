@@ -1,9 +1,12 @@
 from app.database.database import engine, Base
-from app.models import User, Level, MainTopic, SubTopic, LearningPath, CurriculumItem, Article, UserArticleRead
+from app.database.search_index import create_search_index
+from app.models import User, Level, MainTopic, SubTopic, LearningPath, CurriculumItem, Article, ArticleBody, UserArticleRead, UserProgress, UserReadBitmap, ReadRollup
 
 def init_db():
     """데이터베이스 테이블을 생성합니다."""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        create_search_index(connection)
 
 if __name__ == "__main__":
     init_db()
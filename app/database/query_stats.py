@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.database.database import engine
+from app.database.slow_query_log import slow_query_log
+
+# IN (?, ?, ?) 처럼 파라미터 개수만 다른 문장을 같은 형태로 취급
+_IN_LIST = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 값과 IN 목록 길이를 무시한 SQL 문장 형태"""
+    return _IN_LIST.sub("(?)", " ".join(statement.split()))
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 SQL 문장 수와 누적 DB 시간"""
+
+    __slots__ = ("count", "total_ns", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.shapes: Counter = Counter()
+
+    def add(self, statement: str, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.shapes[statement] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1_000_000
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """같은 형태의 문장이 threshold번 이상 반복된 경우 (N+1 의심)"""
+        repeated: Dict[str, int] = {}
+        for statement, count in self.shapes.items():
+            shape = statement_shape(statement)
+            repeated[shape] = repeated.get(shape, 0) + count
+        return sorted(
+            ((shape, count) for shape, count in repeated.items() if count >= threshold),
+            key=lambda item: -item[1]
+        )
+
+
+class QueryBudgetExceeded(AssertionError):
+    """query_budget 블록 안에서 허용된 쿼리 수를 넘었을 때 발생"""
+
+
+class QueryBudget:
+    def __init__(self, max_queries: int, label: str):
+        self.max_queries = max_queries
+        self.label = label
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+_active_budgets: List[QueryBudget] = []
+_budget_lock = threading.Lock()
+
+
+def begin_request() -> Tuple[RequestQueryStats, object]:
+    """요청 단위 집계를 시작합니다. 반환된 토큰은 end_request에 넘깁니다."""
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request(token):
+    _current_stats.reset(token)
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def query_budget(max_queries: int, label: str = "") -> Iterator[QueryBudget]:
+    """테스트용 쿼리 수 상한 검증
+
+    블록 안의 HTTP 요청에서 실행된 SQL 문장을 세고, 블록을 벗어날 때 max_queries를
+    넘었으면 QueryBudgetExceeded(AssertionError)를 발생시킵니다.
+    TestClient처럼 앱이 다른 스레드에서 돌아도 집계되도록 전역으로 기록하며,
+    요청 밖의 쿼리(백그라운드 작업 등)는 세지 않습니다 (QueryStatsMiddleware 필요).
+
+        with query_budget(3, "GET /api/learning-paths/{id}/curriculum-items"):
+            client.get(f"/api/learning-paths/{path_id}/curriculum-items")
+    """
+    budget = QueryBudget(max_queries, label)
+    with _budget_lock:
+        _active_budgets.append(budget)
+    try:
+        yield budget
+    finally:
+        with _budget_lock:
+            _active_budgets.remove(budget)
+    if budget.count > max_queries:
+        listing = "\n".join(f"  {i + 1}. {statement_shape(s)}" for i, s in enumerate(budget.statements))
+        raise QueryBudgetExceeded(
+            f"{label or 'query_budget'}: {budget.count} queries executed (max {max_queries})\n{listing}"
+        )
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_ns", []).append(time.perf_counter_ns())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ns = time.perf_counter_ns() - conn.info["query_start_ns"].pop()
+    if elapsed_ns >= slow_query_log.threshold_ns:
+        slow_query_log.record(conn, statement, parameters, elapsed_ns, executemany)
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.add(statement, elapsed_ns)
+    if _active_budgets:
+        for budget in list(_active_budgets):
+            budget.statements.append(statement)
+
+
+@event.listens_for(engine, "handle_error")
+def _discard_query_timer(exception_context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각을 버림
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_ns"):
+        conn.info["query_start_ns"].pop()
@@ -0,0 +1,18 @@
+from typing import Dict
+
+from app.database.database import SessionLocal
+from app.services.similarity_index import KINDS, similarity_index, texts
+
+def rebuild_similarity_index() -> Dict[str, int]:
+    """DB의 모든 글/소주제로 유사도 인덱스를 다시 만들고 종류별 행 수를 반환합니다."""
+    db = SessionLocal()
+    try:
+        for kind in KINDS:
+            similarity_index.build(kind, lambda: texts(db, kind))
+        return {kind: similarity_index.size(kind) for kind in KINDS}
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sizes = rebuild_similarity_index()
+    print(f"유사도 인덱스가 다시 만들어졌습니다. (글 {sizes['article']}개, 소주제 {sizes['sub_topic']}개)")
@@ -0,0 +1,73 @@
+from sqlalchemy.engine import Connection
+
+from app.database.database import engine
+
+# 검색용 FTS5 인덱스 (trigram 토크나이저 - 띄어쓰기/형태소와 무관하게 3글자 이상 부분 문자열 검색)
+#
+# 원본 테이블을 content로 쓰는 external content 테이블이라 본문을 한 번 더 저장하지 않으며,
+# 원본 테이블 트리거로 증분 갱신됩니다. articles는 INTEGER PRIMARY KEY가 없어 rowid로 연결하므로
+# 전체 VACUUM으로 rowid가 바뀌었다면 `python -m app.database.search_index`로 다시 만들어야 합니다.
+SEARCH_TABLES = ("article_search", "sub_topic_search", "main_topic_search")
+
+SEARCH_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS article_search USING fts5(
+        title, body, content='articles', content_rowid='rowid', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS article_search_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO article_search(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS article_search_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO article_search(article_search, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS article_search_au AFTER UPDATE OF title, body ON articles BEGIN
+        INSERT INTO article_search(article_search, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+        INSERT INTO article_search(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS sub_topic_search USING fts5(
+        name, description, content='sub_topics', content_rowid='sub_topic_id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS sub_topic_search_ai AFTER INSERT ON sub_topics BEGIN
+        INSERT INTO sub_topic_search(rowid, name, description) VALUES (new.sub_topic_id, new.name, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS sub_topic_search_ad AFTER DELETE ON sub_topics BEGIN
+        INSERT INTO sub_topic_search(sub_topic_search, rowid, name, description)
+        VALUES ('delete', old.sub_topic_id, old.name, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS sub_topic_search_au AFTER UPDATE OF name, description ON sub_topics BEGIN
+        INSERT INTO sub_topic_search(sub_topic_search, rowid, name, description)
+        VALUES ('delete', old.sub_topic_id, old.name, old.description);
+        INSERT INTO sub_topic_search(rowid, name, description) VALUES (new.sub_topic_id, new.name, new.description);
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS main_topic_search USING fts5(
+        name, content='main_topics', content_rowid='main_topic_id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS main_topic_search_ai AFTER INSERT ON main_topics BEGIN
+        INSERT INTO main_topic_search(rowid, name) VALUES (new.main_topic_id, new.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS main_topic_search_ad AFTER DELETE ON main_topics BEGIN
+        INSERT INTO main_topic_search(main_topic_search, rowid, name) VALUES ('delete', old.main_topic_id, old.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS main_topic_search_au AFTER UPDATE OF name ON main_topics BEGIN
+        INSERT INTO main_topic_search(main_topic_search, rowid, name) VALUES ('delete', old.main_topic_id, old.name);
+        INSERT INTO main_topic_search(rowid, name) VALUES (new.main_topic_id, new.name);
+    END""",
+]
+
+
+def create_search_index(connection: Connection):
+    """검색 인덱스 테이블과 동기화 트리거를 만듭니다 (이미 있으면 그대로 둠)."""
+    for statement in SEARCH_SCHEMA:
+        connection.exec_driver_sql(statement)
+
+
+def rebuild_search_index():
+    """원본 테이블에서 검색 인덱스를 다시 만듭니다 (기존 데이터 색인, rowid 변경 후 복구)."""
+    with engine.begin() as connection:
+        create_search_index(connection)
+        for table in SEARCH_TABLES:
+            connection.exec_driver_sql(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            connection.exec_driver_sql(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+
+if __name__ == "__main__":
+    rebuild_search_index()
+    print("검색 인덱스가 다시 만들어졌습니다.")
@@ -0,0 +1,117 @@
+import logging
+import re
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# EXPLAIN QUERY PLAN을 붙일 수 있는 문장 (DDL/PRAGMA/트랜잭션 제어 제외)
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+# xBestIndex가 idxStr을 채운 가상 테이블 조회 (예: FTS5 MATCH → "VIRTUAL TABLE INDEX 0:M1")
+_VIRTUAL_TABLE_INDEX = re.compile(r"VIRTUAL TABLE INDEX \d+:\S")
+
+
+def parameters_shape(parameters: Any) -> Any:
+    """파라미터 값 대신 타입만 남깁니다 (개인정보/본문이 로그에 남지 않도록)."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def explain_query_plan(dbapi_connection, statement: str, parameters: Any) -> List[str]:
+    """SQLite EXPLAIN QUERY PLAN 결과를 들여쓰기된 문자열 목록으로 반환합니다."""
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return []
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters or ())
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    depth: Dict[int, int] = {0: -1}
+    plan = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, -1) + 1
+        plan.append("  " * depth[node_id] + detail)
+    return plan
+
+
+def has_full_scan(plan: List[str]) -> bool:
+    """인덱스 없이 테이블 전체를 읽는 단계가 있는지
+
+    서브쿼리/CTE 결과(co-routine, materialize)와 상수 행을 읽는 단계, 제약 조건을 넘긴
+    가상 테이블(FTS MATCH 등) 조회는 테이블 스캔으로 보지 않습니다.
+    """
+    derived = {
+        line.strip().split(" ", 1)[1]
+        for line in plan
+        if line.lstrip().startswith(("CO-ROUTINE ", "MATERIALIZE "))
+    }
+    for line in plan:
+        step = line.strip()
+        if not step.startswith("SCAN ") or " USING " in step or "CONSTANT ROW" in step:
+            continue
+        target = step[len("SCAN "):]
+        if target.startswith("(subquery-") or target in derived or _VIRTUAL_TABLE_INDEX.search(target):
+            continue
+        return True
+    return False
+
+
+class SlowQueryLog:
+    """임계값을 넘은 쿼리의 SQL, 파라미터 형태, 소요 시간, 실행 계획을 보관하는 링 버퍼"""
+
+    def __init__(self, threshold_ms: float, max_entries: int):
+        self.threshold_ns = int(threshold_ms * 1_000_000)
+        self._entries: deque = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self.total_recorded = 0
+
+    def record(self, conn, statement: str, parameters: Any, elapsed_ns: int, executemany: bool):
+        plan: List[str] = []
+        if not executemany:
+            try:
+                plan = explain_query_plan(conn.connection.dbapi_connection, statement, parameters)
+            except Exception as e:
+                plan = [f"EXPLAIN failed: {str(e)}"]
+
+        entry = {
+            "captured_at": datetime.utcnow().isoformat() + "Z",
+            "duration_ms": round(elapsed_ns / 1_000_000, 3),
+            "sql": " ".join(statement.split()),
+            "params_shape": parameters_shape(parameters),
+            "executemany": executemany,
+            "plan": plan,
+            "full_scan": has_full_scan(plan),
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.total_recorded += 1
+        logger.warning(f"느린 쿼리 {entry['duration_ms']}ms: {entry['sql']}")
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 기록부터 반환합니다."""
+        with self._lock:
+            items = list(self._entries)
+        items.reverse()
+        return items[:limit] if limit else items
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 싱글톤 인스턴스
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_threshold_ms,
+    max_entries=settings.slow_query_log_size
+)
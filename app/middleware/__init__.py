@@ -0,0 +1 @@
+# 미들웨어 패키지 초기화
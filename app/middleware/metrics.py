@@ -0,0 +1,45 @@
+import time
+
+from app.middleware.rate_limit import classify_route
+from app.services.metrics import metrics
+
+
+class MetricsMiddleware:
+    """요청별 지연시간과 진행 중 요청 수를 기록하는 ASGI 미들웨어
+
+    라우트 템플릿(`GET /api/articles/{article_id}`) 단위로 고정 메모리
+    히스토그램에 기록하므로 경로 파라미터 수와 관계없이 메모리가 일정합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_generation = classify_route(scope["method"], scope["path"]) == "generation"
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        if is_generation:
+            metrics.in_flight_generation += 1
+        start = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_us = (time.perf_counter_ns() - start) // 1000
+            metrics.in_flight -= 1
+            if is_generation:
+                metrics.in_flight_generation -= 1
+            # 라우팅 후 scope에 기록된 라우트 템플릿으로 집계 (매칭 실패 시 하나로 묶음)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            metrics.observe(f"{scope['method']} {path}", status, elapsed_us)
@@ -0,0 +1,57 @@
+import logging
+from typing import Optional
+
+from app.config import settings
+from app.database.query_stats import begin_request, end_request
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+suspected_n_plus_one = metrics.counter(
+    "infou_db_suspected_n_plus_one_total",
+    "Requests that repeated the same SQL statement shape too many times"
+)
+db_queries = metrics.counter("infou_db_queries_total", "SQL statements executed, by route")
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 문장 수와 DB 시간을 Server-Timing 헤더로 내보내는 ASGI 미들웨어
+
+    같은 형태의 문장이 `n_plus_one_threshold`번 이상 반복되면 N+1 패턴으로 보고
+    경고 로그, `X-Query-Warning` 헤더, 메트릭 카운터로 알립니다.
+    """
+
+    def __init__(self, app, threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = threshold or settings.n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = begin_request()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"'.encode("latin-1")
+                ))
+                repeated = stats.repeated_statements(self.threshold)
+                if repeated:
+                    shape, count = repeated[0]
+                    headers.append((b"x-query-warning", f"n+1; repeated={count}".encode("latin-1")))
+                    route = getattr(scope.get("route"), "path", None) or "unmatched"
+                    suspected_n_plus_one.inc(route=f"{scope['method']} {route}")
+                    logger.warning(f"N+1 의심: {scope['method']} {scope['path']} - 같은 쿼리 {count}회 실행: {shape}")
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            db_queries.inc(stats.count, route=f"{scope['method']} {route}")
+            end_request(token)
@@ -0,0 +1,117 @@
+import json
+import math
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+
+
+class TokenBucketLimiter:
+    """키별 토큰 버킷 카운터
+
+    버킷은 [남은 토큰, 마지막 갱신 시각] 두 값만 저장하며, 요청마다
+    경과 시간만큼 토큰을 채운 뒤 하나를 소비하므로 요청당 O(1)입니다.
+    일정 주기마다 가득 찬(= 한동안 요청이 없던) 버킷을 정리해 메모리를 회수합니다.
+    """
+
+    def __init__(self, limit_per_minute: int, sweep_interval: float = 60.0):
+        self.capacity = float(limit_per_minute)
+        self.rate = limit_per_minute / 60.0  # 초당 충전 토큰 수
+        self.sweep_interval = sweep_interval
+        self._buckets: Dict[str, list] = {}
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    def acquire(self, key: str) -> float:
+        """토큰 하나를 소비합니다. 허용되면 0, 거절되면 재시도까지 남은 초를 반환."""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [self.capacity - 1.0, now]
+            return 0.0
+
+        tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / self.rate
+
+    def _sweep(self, now: float):
+        # 마지막 요청 이후 버킷이 가득 찰 만큼 지난 키는 새 버킷과 같으므로 삭제
+        refill_seconds = self.capacity / self.rate
+        idle = [key for key, (tokens, last) in self._buckets.items() if now - last >= refill_seconds]
+        for key in idle:
+            del self._buckets[key]
+        self._next_sweep = now + self.sweep_interval
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def classify_route(method: str, path: str) -> Optional[str]:
+    """요청을 제한 대상 경로 분류로 나눕니다. 제한하지 않는 경로는 None."""
+    if not path.startswith("/api/"):
+        return None  # 헬스체크, 문서, 디버그 경로는 제외
+    if method == "POST" and path.endswith("/generate"):
+        return "generation"
+    return "read"
+
+
+class RateLimitMiddleware:
+    """클라이언트 + 경로 분류(조회/생성)별 요청 수 제한 ASGI 미들웨어
+
+    라우팅 전에 동작하므로 제한에 걸린 요청은 DB 세션을 열기 전에
+    `429 Too Many Requests`와 `Retry-After` 헤더로 바로 거절됩니다.
+    """
+
+    def __init__(self, app, limits: Optional[Dict[str, int]] = None, trust_forwarded: bool = False):
+        self.app = app
+        limits = limits or {
+            "read": settings.api_rate_limit,
+            "generation": settings.generation_rate_limit,
+        }
+        self.limiters = {
+            route_class: TokenBucketLimiter(limit)
+            for route_class, limit in limits.items()
+            if limit > 0
+        }
+        self.trust_forwarded = trust_forwarded
+
+    def _client_key(self, scope) -> str:
+        if self.trust_forwarded:
+            for name, value in scope.get("headers", ()):
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.limiters.get(classify_route(scope["method"], scope["path"]))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = limiter.acquire(self._client_key(scope))
+        if retry_after <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "Rate limit exceeded"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(math.ceil(retry_after)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
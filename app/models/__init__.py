@@ -6,7 +6,12 @@ from .sub_topic import SubTopic
 from .learning_path import LearningPath
 from .curriculum_item import CurriculumItem
 from .article import Article
+from .article_body import ArticleBody
 from .user_article_read import UserArticleRead
+from .user_progress import UserProgress
+from .user_read_bitmap import UserReadBitmap
+from .read_rollup import ReadRollup
+from .compacted_read_log import CompactedReadLog
 
 __all__ = [
     "User", 
@@ -16,5 +21,10 @@ __all__ = [
     "LearningPath", 
     "CurriculumItem", 
     "Article", 
-    "UserArticleRead"
+    "ArticleBody",
+    "UserArticleRead",
+    "UserProgress",
+    "UserReadBitmap",
+    "ReadRollup",
+    "CompactedReadLog"
 ]
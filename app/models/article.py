@@ -1,7 +1,16 @@
 from sqlalchemy import Column, String, Text, Integer, ForeignKey, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred, validates
 from app.database.database import Base
 
+PREVIEW_LENGTH = 100
+
+
+def make_preview(body: str) -> str:
+    """목록용 미리보기 (본문 앞 100자, 잘렸으면 "..." 추가)"""
+    if len(body) > PREVIEW_LENGTH:
+        return body[:PREVIEW_LENGTH] + "..."
+    return body
+
 class Article(Base):
     __tablename__ = "articles"
 
@@ -10,13 +19,21 @@ class Article(Base):
     sub_topic_id = Column(Integer, ForeignKey("sub_topics.sub_topic_id"), nullable=False)
     level_code = Column(String, ForeignKey("levels.level_code"), nullable=False)
     title = Column(String, nullable=False)
-    body = Column(Text, nullable=False)
+    # 본문은 상세 조회에서만 필요하므로 지연 로딩 (목록은 preview 컬럼만 읽음)
+    body = deferred(Column(Text, nullable=False))
+    preview = Column(String)  # 작성 시 body에서 계산해 저장
     
     # 관계 설정
     curriculum_item = relationship("CurriculumItem", back_populates="articles")
     sub_topic = relationship("SubTopic", back_populates="articles")
     level = relationship("Level", back_populates="articles")
     user_reads = relationship("UserArticleRead", back_populates="article", cascade="all, delete-orphan")
+    body_variants = relationship("ArticleBody", back_populates="article", uselist=False, cascade="all, delete-orphan")
+    
+    @validates("body")
+    def _update_preview(self, key, body):
+        self.preview = make_preview(body)
+        return body
     
     __table_args__ = (
         Index('idx_sub_topic_level', 'sub_topic_id', 'level_code'),
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, LargeBinary, ForeignKey
+from sqlalchemy.orm import relationship
+from app.database.database import Base
+
+class ArticleBody(Base):
+    __tablename__ = "article_bodies"
+
+    # 글 상세 응답(JSON)을 작성 시점에 미리 압축해 둔 변형본 (원문은 articles.body)
+    article_id = Column(String, ForeignKey("articles.article_id", ondelete="CASCADE"), primary_key=True)
+    raw_size = Column(Integer, nullable=False)  # 압축 전 JSON 바이트 수
+    gzip_payload = Column(LargeBinary, nullable=False)
+    br_payload = Column(LargeBinary)  # brotli 모듈이 없으면 NULL
+    
+    # 관계 설정
+    article = relationship("Article", back_populates="body_variants")
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, DateTime
+from app.database.database import Base
+
+class CompactedReadLog(Base):
+    __tablename__ = "compacted_read_logs"
+
+    # SQLite에 반영한 읽음 이벤트 로그 파일 - 반영 후 삭제 전에 죽었을 때 다시 반영하지 않도록 (app.services.read_event_log)
+    digest = Column(String, primary_key=True)  # 봉인 파일 내용의 sha256 (다른 워커가 rename으로 가져가도 같음)
+    compacted_at = Column(DateTime, nullable=False)
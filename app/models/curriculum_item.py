@@ -1,7 +1,17 @@
+import re
+import unicodedata
+
 from sqlalchemy import Column, String, Integer, ForeignKey, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from app.database.database import Base
 
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def make_title_key(title: str) -> str:
+    """재사용 조회용 정규화 제목 (NFKC + 대소문자 무시, 공백/문장부호 제거)"""
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", title).casefold())
+
 class CurriculumItem(Base):
     __tablename__ = "curriculum_items"
 
@@ -9,6 +19,7 @@ class CurriculumItem(Base):
     sub_topic_id = Column(Integer, ForeignKey("sub_topics.sub_topic_id"), nullable=False)
     path_id = Column(String, ForeignKey("learning_paths.path_id"), nullable=False)
     title = Column(String, nullable=False)
+    title_key = Column(String)  # 작성 시 title에서 계산해 저장 (같은 소주제의 비슷한 아이템 글 재사용)
     sort_order = Column(Integer, nullable=False)
     
     # 관계 설정
@@ -16,7 +27,13 @@ class CurriculumItem(Base):
     learning_path = relationship("LearningPath", back_populates="curriculum_items")
     articles = relationship("Article", back_populates="curriculum_item", cascade="all, delete-orphan")
     
+    @validates("title")
+    def _update_title_key(self, key, title):
+        self.title_key = make_title_key(title)
+        return title
+    
     __table_args__ = (
         Index('idx_path_sort_order', 'path_id', 'sort_order', unique=True),
         Index('idx_sub_topic_id', 'sub_topic_id'),
-    )
\ No newline at end of file
+        Index('idx_sub_topic_title_key', 'sub_topic_id', 'title_key'),
+    )
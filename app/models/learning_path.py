@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
@@ -10,7 +10,12 @@ class LearningPath(Base):
     title = Column(String, nullable=False)
     description = Column(Text)
     is_default = Column(Boolean)  # 선택: 기본 경로 표시가 필요할 때만 사용
+    article_count = Column(Integer, nullable=False, default=0, server_default="0")  # 진행률 분모 (글 생성 시 증분 갱신)
     
     # 관계 설정
     sub_topic = relationship("SubTopic", back_populates="learning_paths")
-    curriculum_items = relationship("CurriculumItem", back_populates="learning_path", cascade="all, delete-orphan")
\ No newline at end of file
+    curriculum_items = relationship("CurriculumItem", back_populates="learning_path", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index('idx_learning_path_sub_topic_id', 'sub_topic_id'),
+    )
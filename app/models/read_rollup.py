@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from app.database.database import Base
+
+class ReadRollup(Base):
+    __tablename__ = "read_rollups"
+
+    # 시간 구간별 읽음 수 - 읽음 이벤트마다 증분 갱신 (app.services.popularity)
+    granularity = Column(String, primary_key=True)  # 'hour' | 'day'
+    entity_type = Column(String, primary_key=True)  # 'article' | 'path' | 'sub_topic'
+    bucket_start = Column(DateTime, primary_key=True)  # 구간 시작 (UTC)
+    entity_id = Column(String, primary_key=True)  # article_id | path_id | sub_topic_id
+    read_count = Column(Integer, nullable=False, default=0)
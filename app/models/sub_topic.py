@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database.database import Base
 
@@ -10,9 +10,14 @@ class SubTopic(Base):
     name = Column(String, nullable=False)
     description = Column(Text)
     source_type = Column(String, nullable=False)  # 'curated' | 'generated'
+    article_count = Column(Integer, nullable=False, default=0, server_default="0")  # 진행률 분모 (글 생성 시 증분 갱신)
     
     # 관계 설정
     main_topic = relationship("MainTopic", back_populates="sub_topics")
     learning_paths = relationship("LearningPath", back_populates="sub_topic", cascade="all, delete-orphan")
     curriculum_items = relationship("CurriculumItem", back_populates="sub_topic", cascade="all, delete-orphan")
-    articles = relationship("Article", back_populates="sub_topic", cascade="all, delete-orphan")
\ No newline at end of file
+    articles = relationship("Article", back_populates="sub_topic", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index('idx_sub_topic_main_topic_id', 'main_topic_id'),
+    )
@@ -14,5 +14,5 @@ class UserArticleRead(Base):
     article = relationship("Article", back_populates="user_reads")
     
     __table_args__ = (
-        Index('idx_user_read_at', 'user_id', 'read_at'),
+        Index('idx_user_read_at', 'user_id', 'read_at', 'article_id'),  # 읽은 기록 타임라인 (read_at, article_id) 커서
     )
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Integer, ForeignKey
+from app.database.database import Base
+
+class UserProgress(Base):
+    __tablename__ = "user_progress"
+
+    # 사용자별 (소주제, 학습 경로) 읽은 글 수 - 읽음 이벤트마다 증분 갱신 (app.services.progress_tracker)
+    user_id = Column(String, ForeignKey("users.user_id"), primary_key=True)
+    sub_topic_id = Column(Integer, ForeignKey("sub_topics.sub_topic_id"), primary_key=True)
+    path_id = Column(String, ForeignKey("learning_paths.path_id"), primary_key=True)
+    read_count = Column(Integer, nullable=False, default=0)
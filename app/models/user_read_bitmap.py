@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, LargeBinary, ForeignKey, Index
+from app.database.database import Base
+
+class UserReadBitmap(Base):
+    __tablename__ = "user_read_bitmaps"
+
+    # (사용자, 학습 경로, 레벨)별 읽음 비트맵 - 비트 i는 sort_order가 i인 커리큘럼 아이템 (app.services.read_state)
+    user_id = Column(String, ForeignKey("users.user_id"), primary_key=True)
+    path_id = Column(String, ForeignKey("learning_paths.path_id"), primary_key=True)
+    level_code = Column(String, ForeignKey("levels.level_code"), primary_key=True)
+    bits = Column(LargeBinary, nullable=False)  # little-endian 정수
+
+    __table_args__ = (
+        Index('idx_read_bitmap_path_level', 'path_id', 'level_code'),  # 위치에 새 글이 생길 때 비트 끄기
+    )
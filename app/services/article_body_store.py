@@ -0,0 +1,130 @@
+import gzip
+import json
+import logging
+from typing import Optional, Dict
+
+from sqlalchemy.orm import Session, undefer
+
+from app.models import Article, ArticleBody
+from app.services import read_models
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip 변형만 저장)
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleBodyStore:
+    """글 상세 응답을 작성 시점에 한 번만 압축해 보관하는 저장소
+
+    비로그인 `GET /api/articles/{id}` 응답 JSON을 gzip/brotli로 미리 압축해
+    `article_bodies` 테이블에 저장하고, 조회 시에는 Accept-Encoding에 맞는
+    변형본을 재압축 없이 그대로 내려줍니다.
+    """
+
+    GZIP_LEVEL = 9
+    BROTLI_QUALITY = 11
+
+    @property
+    def supported_encodings(self) -> tuple:
+        # 같은 q 값이면 압축률이 좋은 brotli를 우선
+        return ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def encode_payload(self, article) -> bytes:
+        """ArticleDetailResponse(is_read=None)와 동일한 JSON 바이트를 생성합니다."""
+        content = {
+            "article_id": article.article_id,
+            "title": article.title,
+            "body": article.body,
+            "level_code": article.level_code,
+            "curriculum_item_id": article.curriculum_item_id,
+            "is_read": None,
+        }
+        # FastAPI JSONResponse와 동일한 직렬화 옵션
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+    def build_variants(self, article: Article) -> Dict[str, object]:
+        """압축 변형본을 계산합니다."""
+        payload = self.encode_payload(article)
+        return {
+            "raw_size": len(payload),
+            "gzip_payload": gzip.compress(payload, compresslevel=self.GZIP_LEVEL, mtime=0),
+            "br_payload": brotli.compress(payload, quality=self.BROTLI_QUALITY) if brotli is not None else None,
+        }
+
+    def save(self, db: Session, article: Article) -> ArticleBody:
+        """글 작성/수정 시 호출 - 변형본을 세션에 반영합니다 (commit은 호출자 책임)."""
+        variants = self.build_variants(article)
+        record = db.get(ArticleBody, article.article_id)
+        if record is None:
+            record = ArticleBody(article_id=article.article_id, **variants)
+            db.add(record)
+        else:
+            for key, value in variants.items():
+                setattr(record, key, value)
+        return record
+
+    def load(self, db: Session, article_id: str, encoding: Optional[str]) -> Optional[bytes]:
+        """요청한 인코딩의 응답 바이트만 조회합니다. 없으면 None.
+
+        encoding이 None(무압축)이면 글 컬럼만 읽어 Pydantic 없이 바로 인코딩합니다.
+        """
+        if encoding is None:
+            row = read_models.article_detail(db, article_id)
+            return self.encode_payload(row) if row else None
+
+        column = ArticleBody.br_payload if encoding == "br" else ArticleBody.gzip_payload
+        row = db.query(column).filter(ArticleBody.article_id == article_id).first()
+        return row[0] if row else None
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Accept-Encoding 헤더에서 제공 가능한 인코딩을 고릅니다. 없으면 None (무압축)."""
+        if not accept_encoding:
+            return None
+
+        weights = {}
+        for part in accept_encoding.split(","):
+            token, _, params = part.strip().partition(";")
+            token = token.strip().lower()
+            if not token:
+                continue
+            q = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":  # 파라미터 이름은 대소문자 구분 없음
+                    try:
+                        q = float(value.strip())
+                    except ValueError:
+                        q = 0.0
+            weights[token] = q
+
+        best, best_q = None, 0.0
+        for encoding in self.supported_encodings:
+            q = weights.get(encoding, weights.get("*", 0.0))
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def backfill(self, db: Session, batch_size: int = 200) -> int:
+        """변형본이 없는 기존 글을 배치 단위로 채웁니다."""
+        total = 0
+        while True:
+            articles = db.query(Article).options(undefer(Article.body)).outerjoin(ArticleBody).filter(
+                ArticleBody.article_id.is_(None)
+            ).limit(batch_size).all()
+            if not articles:
+                break
+            for article in articles:
+                self.save(db, article)
+            db.commit()
+            total += len(articles)
+            logger.info(f"article_bodies 백필 진행: {total}건")
+        return total
+
+
+# 싱글톤 인스턴스
+article_body_store = ArticleBodyStore()
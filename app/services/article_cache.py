@@ -0,0 +1,159 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.config import settings
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+class FrequencySketch:
+    """TinyLFU 방식의 접근 빈도 추정기 (4행 Count-Min Sketch, 4비트 카운터)
+
+    일정 횟수(sample_size)만큼 기록하면 모든 카운터를 절반으로 줄여
+    오래된 인기도가 점점 잊히도록 합니다.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, width: int):
+        # 인덱스 계산을 비트 마스크로 하기 위해 2의 거듭제곱으로 맞춤
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self._mask = self.width - 1
+        self._table = bytearray(self.DEPTH * self.width)
+        self._sample_size = 10 * self.width
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+        return [row * self.width + ((h1 + row * h2) & self._mask) for row in range(self.DEPTH)]
+
+    def frequency(self, key: Hashable) -> int:
+        table = self._table
+        return min(table[i] for i in self._indexes(key))
+
+    def increment(self, key: Hashable):
+        table = self._table
+        indexes = self._indexes(key)
+        current = min(table[i] for i in indexes)
+        if current >= self.MAX_COUNT:
+            return
+        # conservative update: 최소값인 카운터만 올려 과대 추정을 줄임
+        for i in indexes:
+            if table[i] == current:
+                table[i] = current + 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(c >> 1 for c in table)
+            self._additions //= 2
+
+
+class ArticleResponseCache:
+    """인코딩 완료된 글 상세 응답 바이트의 LRU 캐시 (바이트 예산 기반)
+
+    키는 (article_id, encoding)이고 값은 그대로 전송할 응답 본문입니다.
+    용량은 항목 수가 아니라 저장된 바이트 합계로 제한하며, 공간이 부족할 때는
+    TinyLFU 승인 정책으로 새 항목이 밀어낼 항목보다 자주 요청된 경우에만 받아들여
+    한 번 읽히고 마는 스캔성 요청이 인기 글을 밀어내지 못하게 합니다.
+    """
+
+    def __init__(self, max_bytes: int, sketch_width: int = 8192):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._sketch = FrequencySketch(sketch_width)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.admissions = 0
+        self.rejections = 0
+        self.evictions = 0
+
+    def get(self, article_id: str, encoding: Optional[str]) -> Optional[bytes]:
+        key = (article_id, encoding or "identity")
+        with self._lock:
+            self._sketch.increment(article_id)
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, article_id: str, encoding: Optional[str], payload: bytes) -> bool:
+        """항목 저장을 시도합니다. 승인 정책에 의해 거절되면 False."""
+        key = (article_id, encoding or "identity")
+        size = len(payload)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            # 같은 키의 이전 항목은 승인된 뒤에만 교체 (거절되면 기존 항목 유지)
+            previous = self._entries.get(key)
+            available = self.max_bytes - self.current_bytes + (len(previous) if previous is not None else 0)
+
+            # 공간이 부족하면 LRU 쪽 희생 후보들과 빈도를 비교
+            victims = []
+            freed = 0
+            if size > available:
+                candidate_freq = self._sketch.frequency(article_id)
+                for victim_key, victim_payload in self._entries.items():
+                    if victim_key[0] == article_id:
+                        continue  # 같은 글의 다른 인코딩은 빈도가 같으므로 비교하지 않음
+                    if self._sketch.frequency(victim_key[0]) >= candidate_freq:
+                        self.rejections += 1
+                        return False
+                    victims.append(victim_key)
+                    freed += len(victim_payload)
+                    if size <= available + freed:
+                        break
+                if size > available + freed:
+                    self.rejections += 1
+                    return False
+
+            if previous is not None:
+                del self._entries[key]
+                self.current_bytes -= len(previous)
+            for victim_key in victims:
+                self.current_bytes -= len(self._entries.pop(victim_key))
+                self.evictions += 1
+
+            self._entries[key] = payload
+            self.current_bytes += size
+            self.admissions += 1
+            return True
+
+    def invalidate(self, article_id: str):
+        """글이 수정/삭제되었을 때 해당 글의 모든 인코딩 항목을 제거합니다."""
+        with self._lock:
+            for encoding in ENCODINGS:
+                payload = self._entries.pop((article_id, encoding), None)
+                if payload is not None:
+                    self.current_bytes -= len(payload)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "admissions": self.admissions,
+            "rejections": self.rejections,
+            "evictions": self.evictions,
+        }
+
+
+# 싱글톤 인스턴스
+article_cache = ArticleResponseCache(max_bytes=settings.article_cache_max_bytes)
@@ -0,0 +1,64 @@
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Article, CurriculumItem
+from app.services.metrics import metrics
+
+reuse_lookups = metrics.counter(
+    "infou_article_reuse_lookups_total", "Article generation requests checked for a reusable article, by result"
+)
+
+
+class ReusableArticle(NamedTuple):
+    article_id: str
+    title: str
+    body: str
+
+
+class ArticleReuse:
+    """글 생성 전 재사용 단계
+
+    생성된 학습 경로에는 같은 소주제의 다른 경로와 제목이 거의 같은 아이템이 자주 생기므로,
+    글을 생성하기 전에 (sub_topic_id, title_key) 인덱스로 정규화 제목이 같은 아이템의
+    같은 레벨 글을 찾아 있으면 그 제목/본문을 복제합니다. 없을 때만 생성합니다.
+    적중률은 `stats()`(워커별)와 `infou_article_reuse_lookups_total{result}`로 확인합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, db: Session, curriculum_item: CurriculumItem, level_code: str) -> Optional[ReusableArticle]:
+        row = None
+        if curriculum_item.title_key:
+            row = db.query(Article.article_id, Article.title, Article.body).join(
+                CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+            ).filter(
+                CurriculumItem.sub_topic_id == curriculum_item.sub_topic_id,
+                CurriculumItem.title_key == curriculum_item.title_key,
+                CurriculumItem.curriculum_item_id != curriculum_item.curriculum_item_id,
+                Article.level_code == level_code
+            ).order_by(Article.article_id).first()
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        reuse_lookups.inc(result="miss" if row is None else "hit")
+        return ReusableArticle(*row) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+# 싱글톤 인스턴스
+article_reuse = ArticleReuse()
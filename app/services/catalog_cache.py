@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[..., Optional[bytes]]
+
+
+class CatalogCache:
+    """레벨/대주제/소주제 목록용 버전 기반 읽기 관통(read-through) 캐시
+
+    카탈로그 데이터는 거의 바뀌지 않으므로 응답 JSON을 미리 인코딩된 바이트로
+    메모리에 보관합니다. 카탈로그를 바꾸는 쓰기 경로는 `invalidate()` 하나만
+    호출하면 되고, 호출 시 버전이 올라가며 모든 항목이 버려집니다.
+    무효화는 프로세스 단위이므로 다른 워커에는 TTL이 지난 뒤 반영됩니다.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entries: Dict[Hashable, Tuple[bytes, float]] = {}
+        self._loaders: Dict[str, Tuple[Loader, Optional[Callable[[Session], Iterable[tuple]]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def register(
+        self,
+        name: str,
+        loader: Loader,
+        warm_args: Optional[Callable[[Session], Iterable[tuple]]] = None
+    ):
+        """캐시 항목 로더를 등록합니다. loader(db, *args)는 인코딩된 바이트나 None(없음)을 반환."""
+        self._loaders[name] = (loader, warm_args)
+
+    def get(self, db: Session, name: str, *args: Any) -> Optional[bytes]:
+        """캐시된 바이트를 반환하고, 없으면 로더로 읽어 채웁니다."""
+        key = (name, *args)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        version = self._version
+        payload = self._loaders[name][0](db, *args)
+        if payload is not None:
+            with self._lock:
+                # 로드 도중 무효화되었다면 이전 버전 데이터를 저장하지 않음
+                if self._version == version:
+                    self._entries[key] = (payload, time.monotonic())
+        return payload
+
+    def response(self, db: Session, name: str, *args: Any) -> Optional[Response]:
+        payload = self.get(db, name, *args)
+        if payload is None:
+            return None
+        return Response(content=payload, media_type="application/json")
+
+    def invalidate(self):
+        """카탈로그 쓰기 경로에서 호출하는 단일 무효화 훅"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def warm(self, db: Session):
+        """등록된 모든 항목을 미리 적재합니다 (앱 시작 시 호출)."""
+        for name, (_, warm_args) in list(self._loaders.items()):
+            for args in (warm_args(db) if warm_args else [()]):
+                self.get(db, name, *args)
+        logger.info(f"카탈로그 캐시 적재 완료: {len(self._entries)}개 항목 (version={self._version})")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "version": self._version,
+            "entries": len(self._entries),
+            "bytes": sum(len(payload) for payload, _ in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+catalog_cache = CatalogCache(ttl_seconds=settings.catalog_cache_ttl)
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.database.database import engine
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+maintenance_runs = metrics.counter("infou_db_maintenance_runs_total", "SQLite maintenance tasks executed, by task")
+maintenance_errors = metrics.counter("infou_db_maintenance_errors_total", "SQLite maintenance tasks that failed, by task")
+maintenance_seconds = metrics.counter(
+    "infou_db_maintenance_seconds_total", "Time spent in SQLite maintenance tasks, by task"
+)
+checkpoint_busy = metrics.counter(
+    "infou_db_wal_checkpoint_busy_total", "WAL checkpoints that could not finish because of active readers/writers"
+)
+
+
+def wal_path() -> Optional[str]:
+    """파일 기반 SQLite DB의 -wal 파일 경로 (메모리 DB면 None)"""
+    database = engine.url.database
+    if engine.url.get_backend_name() != "sqlite" or not database or database == ":memory:":
+        return None
+    return database + "-wal"
+
+
+def wal_size_bytes() -> int:
+    path = wal_path()
+    try:
+        return os.path.getsize(path) if path else 0
+    except OSError:
+        return 0
+
+
+class DatabaseMaintenance:
+    """SQLite 유지보수를 주기적으로 실행하는 백그라운드 작업
+
+    - 매 주기: `PRAGMA optimize`, WAL 체크포인트
+      (-wal 파일이 `wal_truncate_bytes` 이상이면 TRUNCATE로 파일을 비우고, 아니면 PASSIVE)
+    - `analyze_interval`마다: `ANALYZE`로 플래너 통계 갱신
+    - `incremental_vacuum_pages` > 0이고 auto_vacuum=INCREMENTAL인 DB면 빈 페이지 반환
+    실행 결과는 /metrics 카운터와 `status()`로 확인합니다.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        analyze_interval_seconds: float,
+        wal_truncate_bytes: int,
+        incremental_vacuum_pages: int = 0
+    ):
+        self.interval_seconds = interval_seconds
+        self.analyze_interval_seconds = analyze_interval_seconds
+        self.wal_truncate_bytes = wal_truncate_bytes
+        self.incremental_vacuum_pages = incremental_vacuum_pages
+        self._task: Optional[asyncio.Task] = None
+        self._last_analyze: Optional[float] = None
+        self.last_run: Dict[str, Any] = {}
+
+    def _timed(self, task: str, fn):
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            maintenance_errors.inc(task=task)
+            logger.warning(f"DB 유지보수 작업 실패 ({task}): {str(e)}")
+            return None
+        maintenance_runs.inc(task=task)
+        maintenance_seconds.inc(time.perf_counter() - start, task=task)
+        return result
+
+    def run_once(self) -> Dict[str, Any]:
+        """유지보수 작업을 한 번 실행합니다 (동기, 스레드에서 실행)."""
+        result: Dict[str, Any] = {"started_at": datetime.utcnow().isoformat() + "Z"}
+        with engine.connect() as connection:
+            self._timed("optimize", lambda: connection.exec_driver_sql("PRAGMA optimize"))
+
+            now = time.monotonic()
+            if self._last_analyze is None or now - self._last_analyze >= self.analyze_interval_seconds:
+                if self._timed("analyze", lambda: connection.exec_driver_sql("ANALYZE")) is not None:
+                    self._last_analyze = now
+                    result["analyzed"] = True
+            connection.commit()
+
+            if wal_path():
+                wal_bytes = wal_size_bytes()
+                mode = "TRUNCATE" if wal_bytes >= self.wal_truncate_bytes else "PASSIVE"
+                row = self._timed(
+                    f"checkpoint_{mode.lower()}",
+                    lambda: connection.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})").fetchone()
+                )
+                if row is not None:
+                    busy, log_frames, checkpointed_frames = row
+                    if busy:
+                        checkpoint_busy.inc(mode=mode.lower())
+                    result["checkpoint"] = {
+                        "mode": mode,
+                        "wal_bytes_before": wal_bytes,
+                        "wal_bytes_after": wal_size_bytes(),
+                        "log_frames": log_frames,
+                        "checkpointed_frames": checkpointed_frames,
+                        "busy": bool(busy),
+                    }
+
+            if self.incremental_vacuum_pages > 0:
+                auto_vacuum = connection.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+                if auto_vacuum == 2:  # INCREMENTAL
+                    self._timed(
+                        "incremental_vacuum",
+                        lambda: connection.exec_driver_sql(
+                            f"PRAGMA incremental_vacuum({int(self.incremental_vacuum_pages)})"
+                        ).fetchall()
+                    )
+
+        self.last_run = result
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "wal_bytes": wal_size_bytes(),
+            "last_run": self.last_run,
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.warning(f"DB 유지보수 실패: {str(e)}")
+
+    def start(self):
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 싱글톤 인스턴스
+db_maintenance = DatabaseMaintenance(
+    interval_seconds=settings.db_maintenance_interval,
+    analyze_interval_seconds=settings.db_analyze_interval,
+    wal_truncate_bytes=settings.wal_truncate_bytes,
+    incremental_vacuum_pages=settings.incremental_vacuum_pages
+)
+
+metrics.gauge("infou_db_wal_bytes", "Current size of the SQLite -wal file", wal_size_bytes)
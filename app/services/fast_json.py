@@ -0,0 +1,74 @@
+import json
+from json.encoder import encode_basestring
+from typing import Any, Callable, Iterable, Sequence, Type, Union, get_args, get_origin
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def _encode_bool(value: Any) -> str:
+    # SQLite의 EXISTS/불리언 컬럼은 0/1 정수로 돌아오므로 truthiness로 판단
+    return "true" if value else "false"
+
+
+def _encode_any(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def _nullable(encoder: Callable[[Any], str]) -> Callable[[Any], str]:
+    def encode(value: Any) -> str:
+        return "null" if value is None else encoder(value)
+    return encode
+
+
+def _value_encoder(annotation: Any) -> Callable[[Any], str]:
+    """필드 타입 어노테이션에 맞는 값 인코더를 고릅니다."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _value_encoder(args[0]) if len(args) == 1 else _encode_any
+        return _nullable(inner)
+    if annotation is str:
+        return encode_basestring
+    if annotation is bool:
+        return _encode_bool
+    if annotation is int:
+        return int.__repr__
+    return _encode_any
+
+
+class RowEncoder:
+    """응답 모델 정의로 미리 컴파일한 행(tuple) → JSON 인코더
+
+    리스트 엔드포인트에서 행마다 Pydantic 모델을 만들고 다시 직렬화하는 대신,
+    컬럼만 조회한 튜플을 모델 필드 순서 그대로 JSON 바이트로 인코딩합니다.
+    출력은 FastAPI 기본 JSONResponse와 동일한 형식입니다.
+    라우트에는 response_model을 그대로 두므로 OpenAPI 스키마는 바뀌지 않습니다.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.fields = tuple(model.model_fields)
+        # 키 부분은 미리 인코딩해 두고, 행마다 값만 이어 붙임
+        self._parts = tuple(
+            ("{" if i == 0 else ",") + encode_basestring(name) + ":"
+            for i, name in enumerate(self.fields)
+        )
+        self._encoders = tuple(
+            _value_encoder(field.annotation) for field in model.model_fields.values()
+        )
+        self._plan = tuple(zip(self._parts, self._encoders))
+
+    def encode_row(self, row: Sequence[Any]) -> str:
+        """필드 순서대로 정렬된 행 하나를 JSON 객체 문자열로 인코딩합니다."""
+        return "".join([part + encode(value) for (part, encode), value in zip(self._plan, row)]) + "}"
+
+    def encode_list(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        encode_row = self.encode_row
+        return ("[" + ",".join([encode_row(row) for row in rows]) + "]").encode("utf-8")
+
+    def encode_one(self, row: Sequence[Any]) -> bytes:
+        return self.encode_row(row).encode("utf-8")
+
+    def response(self, rows: Iterable[Sequence[Any]]) -> Response:
+        """리스트 응답을 Response로 감싸 반환합니다 (response_model 검증 생략)."""
+        return Response(content=self.encode_list(rows), media_type="application/json")
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+MIN_TERM_LENGTH = 3  # trigram 토크나이저가 색인할 수 있는 최소 글자 수
+MAX_TERMS = 8
+SNIPPET_TOKENS = 16
+
+
+class SearchSource(NamedTuple):
+    entity_type: str
+    fts_table: str
+    table: str
+    id_column: str
+    rowid_column: str  # FTS content_rowid와 연결되는 원본 컬럼
+    title_column: str
+    columns: Tuple[str, ...]
+    weights: Tuple[float, ...]  # bm25 컬럼 가중치 (제목 일치를 본문 일치보다 우선)
+
+
+SOURCES = (
+    SearchSource("article", "article_search", "articles", "article_id", "rowid", "title", ("title", "body"), (10.0, 1.0)),
+    SearchSource(
+        "sub_topic", "sub_topic_search", "sub_topics", "sub_topic_id", "sub_topic_id", "name",
+        ("name", "description"), (10.0, 1.0)
+    ),
+    SearchSource("main_topic", "main_topic_search", "main_topics", "main_topic_id", "main_topic_id", "name", ("name",), (10.0,)),
+)
+ENTITY_TYPES = tuple(source.entity_type for source in SOURCES)
+
+
+class SearchHitRow(NamedTuple):
+    entity_type: str
+    entity_id: str
+    title: str
+    snippet: str
+    score: float  # 종류(FTS 테이블)별로 정규화한 관련도 (0 초과 1 이하, 클수록 관련도 높음)
+
+
+def split_terms(q: str) -> Tuple[List[str], List[str]]:
+    """검색어를 (색인 검색할 3글자 이상 단어, 3글자 미만 단어)로 나눕니다."""
+    terms = []
+    for term in q.replace('"', " ").split():
+        if term.lower() not in terms:
+            terms.append(term.lower())
+    terms = terms[:MAX_TERMS]
+    return (
+        [term for term in terms if len(term) >= MIN_TERM_LENGTH],
+        [term for term in terms if len(term) < MIN_TERM_LENGTH]
+    )
+
+
+def _source_select(source: SearchSource, short_terms: List[str]) -> str:
+    # 짧은 단어는 색인으로 찾을 수 없으므로 MATCH로 좁힌 행에서만 포함 여부를 확인
+    text_expr = " || ' ' || ".join(f"coalesce(src.{column}, '')" for column in source.columns)
+    short_filters = "".join(
+        f" AND instr(lower({text_expr}), :short_{i}) > 0" for i in range(len(short_terms))
+    )
+    weights = ", ".join(str(weight) for weight in source.weights)
+    matches = (
+        f"SELECT CAST(src.{source.id_column} AS TEXT) AS entity_id, src.{source.title_column} AS title, "
+        f"snippet({source.fts_table}, -1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS snippet, "
+        f"bm25({source.fts_table}, {weights}) AS bm25 "
+        f"FROM {source.fts_table} JOIN {source.table} AS src ON src.{source.rowid_column} = {source.fts_table}.rowid "
+        f"WHERE {source.fts_table} MATCH :match{short_filters}"
+    )
+    # bm25는 테이블마다 문서 수/길이 통계가 달라 그대로 비교할 수 없으므로, 그 테이블에서
+    # 가장 관련도 높은 결과(가장 작은 음수)에 대한 비율로 바꿔 (0, 1] 범위로 맞춤
+    return (
+        f"SELECT '{source.entity_type}' AS entity_type, entity_id, title, snippet, "
+        f"bm25 / min(bm25) OVER () AS score FROM ({matches})"
+    )
+
+
+def search(
+    db: Session,
+    q: str,
+    entity_types: Sequence[str],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[SearchHitRow], Optional[str]]:
+    """글/소주제/대주제 통합 검색 (관련도 순 keyset 페이지)
+
+    3글자 이상 단어는 모두 포함(AND)해야 하며 FTS5 trigram 색인으로 찾고 bm25로 순위를
+    매깁니다. 3글자 미만 단어는 색인으로 찾은 행에서 포함 여부만 확인하며, 짧은 단어만으로는
+    색인을 쓸 수 없어 전체를 훑게 되므로 400을 반환합니다. 정렬 키 (score 내림차순,
+    entity_type, entity_id)를 커서로 써서 다음 페이지를 이어 읽습니다.
+    """
+    long_terms, short_terms = split_terms(q)
+    if not long_terms and not short_terms:
+        raise HTTPException(status_code=400, detail="Empty search query")
+    if not long_terms:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Search query needs at least one term of {MIN_TERM_LENGTH} or more characters"
+        )
+
+    params: Dict[str, Any] = {f"short_{i}": term for i, term in enumerate(short_terms)}
+    # 각 단어를 구문으로 감싸 FTS 쿼리 문법(AND/OR/NEAR, *, 컬럼 필터)으로 해석되지 않게 함
+    params["match"] = " ".join(f'"{term}"' for term in long_terms)
+
+    sql = " UNION ALL ".join(
+        _source_select(source, short_terms)
+        for source in SOURCES if source.entity_type in entity_types
+    )
+    sql = f"SELECT entity_type, entity_id, title, snippet, score FROM ({sql})"
+    if cursor is not None:
+        score, entity_type, entity_id = decode_cursor(cursor, (float, str, str))
+        sql += (
+            " WHERE score < :after_score"
+            " OR (score = :after_score AND (entity_type, entity_id) > (:after_type, :after_id))"
+        )
+        params.update(after_score=score, after_type=entity_type, after_id=entity_id)
+    sql += " ORDER BY score DESC, entity_type, entity_id LIMIT :limit"
+    params["limit"] = limit + 1
+
+    rows = [SearchHitRow(*row) for row in db.execute(text(sql), params)]
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor((last.score, last.entity_type, last.entity_id))
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+def configured_llm_providers() -> List[str]:
+    """API 키가 설정된 LLM 프로바이더 목록"""
+    available_providers = []
+    if settings.openai_api_key:
+        available_providers.append("openai")
+    if settings.anthropic_api_key:
+        available_providers.append("anthropic")
+    return available_providers
+
+
+class HealthProber:
+    """DB/LLM 프로바이더 상태를 주기적으로 확인해 캐시하는 백그라운드 프로버
+
+    오케스트레이터가 자주 호출하는 readiness 프로브는 이 스냅샷만 읽으므로
+    프로브 요청마다 커넥션 풀 슬롯을 쓰거나 SQLite 잠금을 잡지 않습니다.
+    추가 의존성(예: 서킷 브레이커)은 `register_check`로 등록합니다.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._checks: Dict[str, Callable[[], Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.snapshot: Dict[str, Any] = {
+            "ready": False,
+            "checked_at": None,
+            "database": {"status": "unknown"},
+            "llm_providers": [],
+            "checks": {},
+        }
+        self._checked_monotonic: Optional[float] = None
+
+    def register_check(self, name: str, check: Callable[[], Any]):
+        """추가 상태 확인 함수를 등록합니다. 예외가 나면 해당 항목은 error로 표시."""
+        self._checks[name] = check
+
+    def _probe_database(self) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return {"status": "connected", "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+        except Exception as e:
+            return {"status": "disconnected", "error": str(e)}
+
+    def probe_once(self) -> Dict[str, Any]:
+        """모든 의존성을 한 번 확인하고 스냅샷을 갱신합니다 (동기, 스레드에서 실행)."""
+        database = self._probe_database()
+        checks = {}
+        for name, check in self._checks.items():
+            try:
+                checks[name] = check()
+            except Exception as e:
+                checks[name] = {"status": "error", "error": str(e)}
+
+        self.snapshot = {
+            "ready": database["status"] == "connected",
+            "checked_at": datetime.utcnow().isoformat() + "Z",
+            "database": database,
+            "llm_providers": configured_llm_providers(),
+            "checks": checks,
+        }
+        self._checked_monotonic = time.monotonic()
+        return self.snapshot
+
+    def is_stale(self) -> bool:
+        """프로버가 멈춰 스냅샷이 오래되었는지 (주기의 3배 초과)"""
+        if self._checked_monotonic is None:
+            return True
+        return time.monotonic() - self._checked_monotonic > self.interval_seconds * 3
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.probe_once)
+            except Exception as e:
+                logger.warning(f"헬스 프로브 실패: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 싱글톤 인스턴스
+health_prober = HealthProber(interval_seconds=settings.health_probe_interval)
@@ -0,0 +1,227 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy import event
+
+from app.database.database import engine
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """고정 메모리 HDR 방식 지연시간 히스토그램 (마이크로초 단위)
+
+    32 미만은 1µs 단위로, 그 이상은 2의 거듭제곱 구간마다 16개의 하위 구간으로
+    나누어 기록하므로 상대 오차가 약 6% 이내입니다. 버킷 수가 고정되어 있어
+    요청 수와 관계없이 메모리가 일정하고, 기록은 정수 연산 몇 번으로 끝납니다.
+    """
+
+    LINEAR_MAX = 32
+    SUB_BUCKETS = 16
+    MAX_SHIFT = 23  # 약 268초까지 구분, 그 이상은 마지막 버킷에 기록
+    BUCKET_COUNT = LINEAR_MAX + MAX_SHIFT * SUB_BUCKETS
+
+    __slots__ = ("counts", "count", "total_us", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    @classmethod
+    def bucket_index(cls, value_us: int) -> int:
+        if value_us < cls.LINEAR_MAX:
+            return value_us if value_us > 0 else 0
+        shift = value_us.bit_length() - 5
+        if shift > cls.MAX_SHIFT:
+            return cls.BUCKET_COUNT - 1
+        return cls.LINEAR_MAX + (shift - 1) * cls.SUB_BUCKETS + ((value_us >> shift) - cls.SUB_BUCKETS)
+
+    @classmethod
+    def bucket_upper_bound(cls, index: int) -> int:
+        if index < cls.LINEAR_MAX:
+            return index
+        shift, offset = divmod(index - cls.LINEAR_MAX, cls.SUB_BUCKETS)
+        shift += 1
+        return ((offset + cls.SUB_BUCKETS + 1) << shift) - 1
+
+    def record(self, value_us: int):
+        self.counts[self.bucket_index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other: "LatencyHistogram"):
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> int:
+        """p(0~100) 백분위 지연시간 (µs, 버킷 상한값)"""
+        if not self.count:
+            return 0
+        target = max(1, int(self.count * p / 100.0 + 0.5))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(self.bucket_upper_bound(i), self.max_us)
+        return self.max_us
+
+    def mean(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any):
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def total(self) -> float:
+        return sum(self.values.values())
+
+
+class MetricsRegistry:
+    """요청 지연시간, 진행 중 요청 수, 카운터/게이지를 모아 Prometheus 형식으로 내보냅니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[str, LatencyHistogram] = {}
+        self.responses = Counter("infou_http_responses_total", "HTTP responses by route and status class")
+        self.in_flight = 0
+        self.in_flight_generation = 0
+        self._counters: Dict[str, Counter] = {self.responses.name: self.responses}
+        self._gauges: List[Tuple[str, str, Callable[[], Any]]] = []
+
+    def observe(self, route: str, status: int, elapsed_us: int):
+        histogram = self.routes.get(route)
+        if histogram is None:
+            with self._lock:
+                histogram = self.routes.setdefault(route, LatencyHistogram())
+        histogram.record(elapsed_us)
+        self.responses.inc(route=route, status=f"{status // 100}xx")
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """이름으로 카운터를 가져오거나 새로 등록합니다."""
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = Counter(name, help_text)
+            return counter
+
+    def gauge(self, name: str, help_text: str, fn: Callable[[], Any]):
+        """수집 시점에 값을 읽어오는 게이지를 등록합니다. fn은 숫자 또는 {라벨 dict 튜플: 값}을 반환."""
+        self._gauges.append((name, help_text, fn))
+
+    def overall(self) -> LatencyHistogram:
+        merged = LatencyHistogram()
+        for histogram in list(self.routes.values()):
+            merged.merge(histogram)
+        return merged
+
+    def summary(self) -> Dict[str, Any]:
+        """헬스체크용 요약"""
+        overall = self.overall()
+        return {
+            "requests": overall.count,
+            "avg_ms": round(overall.mean() / 1000, 2),
+            "p50_ms": round(overall.percentile(50) / 1000, 2),
+            "p95_ms": round(overall.percentile(95) / 1000, 2),
+            "p99_ms": round(overall.percentile(99) / 1000, 2),
+            "in_flight": self.in_flight,
+        }
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP infou_http_request_duration_seconds HTTP request latency by route",
+            "# TYPE infou_http_request_duration_seconds summary",
+        ]
+        for route, histogram in sorted(self.routes.items()):
+            label = _escape(route)
+            for q in (0.5, 0.95, 0.99):
+                value = histogram.percentile(q * 100) / 1_000_000
+                lines.append(f'infou_http_request_duration_seconds{{route="{label}",quantile="{q}"}} {value}')
+            lines.append(f'infou_http_request_duration_seconds_sum{{route="{label}"}} {histogram.total_us / 1_000_000}')
+            lines.append(f'infou_http_request_duration_seconds_count{{route="{label}"}} {histogram.count}')
+
+        lines += [
+            "# HELP infou_http_requests_in_flight Requests currently being processed",
+            "# TYPE infou_http_requests_in_flight gauge",
+            f"infou_http_requests_in_flight {self.in_flight}",
+            "# HELP infou_generation_requests_in_flight AI generation requests currently being processed",
+            "# TYPE infou_generation_requests_in_flight gauge",
+            f"infou_generation_requests_in_flight {self.in_flight_generation}",
+        ]
+
+        for counter in list(self._counters.values()):
+            lines.append(f"# HELP {counter.name} {counter.help_text}")
+            lines.append(f"# TYPE {counter.name} counter")
+            for labels, value in sorted(counter.values.items()):
+                lines.append(f"{counter.name}{_format_labels(labels)} {value}")
+
+        for name, help_text, fn in self._gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            value = fn()
+            if isinstance(value, dict):
+                for labels, v in sorted(value.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {v}")
+            else:
+                lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    labels = list(labels)
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry()
+
+
+# 커넥션 풀 통계
+pool_checkouts = metrics.counter("infou_db_pool_checkouts_total", "Connections checked out from the pool")
+
+
+@event.listens_for(engine, "checkout")
+def _count_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_checkouts.inc()
+
+
+def pool_status() -> Dict[str, int]:
+    pool = engine.pool
+    return {
+        "size": pool.size() if hasattr(pool, "size") else 0,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+        # QueuePool.overflow()는 풀이 덜 찼을 때 음수를 반환하므로 0으로 맞춤
+        "overflow": max(0, pool.overflow()) if hasattr(pool, "overflow") else 0,
+        "checkouts_total": int(pool_checkouts.total()),
+    }
+
+
+def _pool_gauge() -> Dict[Labels, int]:
+    status = pool_status()
+    return {(("state", state),): status[state] for state in ("size", "checked_out", "overflow")}
+
+
+metrics.gauge("infou_db_pool_connections", "Database pool connections by state", _pool_gauge)
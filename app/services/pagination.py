@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query as QueryParam
+from fastapi.responses import Response
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+# 다음 페이지 커서를 담는 응답 헤더 (목록 응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+JSON_TYPES = (int, float, str, bool)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 불투명한 URL-safe 커서 문자열로 인코딩합니다."""
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _is_instance(value: Any, expected: type) -> bool:
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """커서를 정렬 키 값 튜플로 되돌립니다. 개수나 키별 타입(types)이 맞지 않으면 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(types):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not all(_is_instance(value, expected) for value, expected in zip(values, types)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(values)
+
+
+def page_limit(
+    limit: Optional[int] = QueryParam(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정하면 커서 페이지네이션)"),
+    cursor: Optional[str] = QueryParam(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
+) -> Tuple[Optional[int], Optional[str]]:
+    """목록 엔드포인트 공통 페이지 파라미터 의존성
+
+    limit과 cursor가 모두 없으면 (None, None)을 반환하며, 이때는 기존처럼 전체 목록을 반환합니다.
+    """
+    if limit is None and cursor is not None:
+        limit = DEFAULT_PAGE_SIZE
+    return limit, cursor
+
+
+def keyset_page(
+    query: Query,
+    key_columns: Sequence[Any],
+    key: Callable[[Any], Sequence[Any]],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    parse: Optional[Callable[[Tuple[Any, ...]], Sequence[Any]]] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """정렬 키 기준 keyset 페이지 조회
+
+    OFFSET 대신 `WHERE (키) > (커서 값) ORDER BY 키 LIMIT n`으로 읽으므로 깊은 페이지도
+    인덱스 탐색 한 번으로 첫 페이지와 같은 비용이 듭니다. key_columns는 필터 조건 안에서
+    고유해야 하며, key(row)는 조회한 행에서 같은 순서의 키 값을 꺼냅니다.
+    descending이면 `(키) < (커서 값) ORDER BY 키 DESC`로 읽습니다. 키 값이 JSON으로
+    표현되지 않는 타입(datetime 등)이면 key가 문자열로 바꾸고 parse가 되돌립니다.
+    커서 값은 키 컬럼의 파이썬 타입과 맞아야 하며 (아니면 400), 타입이 다른 값이
+    SQLite 비교로 흘러가 빈 페이지나 바인딩 오류가 되지 않게 합니다.
+    다음 페이지가 있으면 (행 목록, 다음 커서), 마지막 페이지면 (행 목록, None)을 반환합니다.
+    """
+    if cursor is not None:
+        types = [column.type.python_type for column in key_columns]
+        if parse is None:
+            after = decode_cursor(cursor, types)
+        else:
+            # JSON으로 표현되지 않는 타입은 문자열로 인코딩되어 있음
+            after = decode_cursor(cursor, [t if t in JSON_TYPES else str for t in types])
+            try:
+                after = tuple(parse(after))
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            if len(after) != len(types) or not all(_is_instance(v, t) for v, t in zip(after, types)):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        if len(key_columns) == 1:
+            condition = key_columns[0] < after[0] if descending else key_columns[0] > after[0]
+        else:
+            columns, values = tuple_(*key_columns), tuple_(*after)
+            condition = columns < values if descending else columns > values
+        query = query.filter(condition)
+
+    order_by = [column.desc() for column in key_columns] if descending else key_columns
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key(rows[-1]))
+
+
+def with_next_cursor(response: Response, next_cursor: Optional[str]) -> Response:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
@@ -0,0 +1,157 @@
+import heapq
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Article, CurriculumItem, ReadRollup, UserArticleRead
+from app.services import read_models
+
+GRANULARITIES = ("hour", "day")
+ENTITY_TYPES = ("article", "path", "sub_topic")
+HOURLY_WINDOW_LIMIT = 48  # 이보다 긴 기간은 일 단위 집계로 계산
+
+# (article_id, sub_topic_id, path_id, 시간 구간 시작) → 읽음 수
+ReadCounts = Mapping[Tuple[str, int, str, datetime], int]
+
+
+class TrendingEntry(NamedTuple):
+    entity_id: str
+    title: str
+    read_count: int
+
+
+def bucket_start(at: datetime, granularity: str) -> datetime:
+    if granularity == "hour":
+        return at.replace(minute=0, second=0, microsecond=0)
+    return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class PopularityRollups:
+    """글/학습 경로/소주제별 시간·일 단위 읽음 수 집계
+
+    read_rollups(granularity, entity_type, bucket_start, entity_id)에 읽음 이벤트마다
+    카운터를 더하므로 인기 목록은 user_article_reads를 훑지 않고 기간 안의 구간 행만
+    읽어 계산합니다. 다시 읽은 글도 한 번의 읽음으로 셉니다. 시간 단위 집계는
+    `hourly_retention_days`가 지나면 지웁니다 (일 단위 집계는 보관).
+    """
+
+    def __init__(self, hourly_retention_days: int):
+        self.hourly_retention = timedelta(days=hourly_retention_days)
+        self._lock = threading.Lock()
+        self._last_pruned: Optional[datetime] = None
+
+    def record(self, db: Session, article_id: str, sub_topic_id: int, path_id: str, read_at: datetime):
+        self.record_counts(db, {(article_id, sub_topic_id, path_id, bucket_start(read_at, "hour")): 1})
+
+    def record_counts(self, db: Session, counts: ReadCounts):
+        """읽음 수를 모든 구간/대상 집계에 더합니다. commit은 호출자 책임입니다."""
+        totals: Dict[Tuple[str, str, datetime, str], int] = defaultdict(int)
+        for (article_id, sub_topic_id, path_id, read_at), count in counts.items():
+            for granularity in GRANULARITIES:
+                start = bucket_start(read_at, granularity)
+                totals[(granularity, "article", start, article_id)] += count
+                totals[(granularity, "path", start, path_id)] += count
+                totals[(granularity, "sub_topic", start, str(sub_topic_id))] += count
+        if not totals:
+            return
+
+        stmt = sqlite_insert(ReadRollup.__table__)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["granularity", "entity_type", "bucket_start", "entity_id"],
+            set_={"read_count": stmt.table.c.read_count + stmt.excluded.read_count}
+        ), [
+            {
+                "granularity": granularity,
+                "entity_type": entity_type,
+                "bucket_start": start,
+                "entity_id": entity_id,
+                "read_count": count
+            }
+            for (granularity, entity_type, start, entity_id), count in totals.items()
+        ])
+        self._prune_if_due(db)
+
+    def rebuild(self, db: Session):
+        """user_article_reads의 마지막 읽은 시각으로 집계를 다시 만듭니다 (디버그 데이터 삭제 후).
+
+        읽음 기록에는 글마다 마지막 읽음만 남으므로 다시 읽은 횟수는 복원되지 않습니다.
+        """
+        db.execute(delete(ReadRollup).where(ReadRollup.entity_type.in_(ENTITY_TYPES)))
+        rows = db.query(
+            UserArticleRead.article_id,
+            Article.sub_topic_id,
+            CurriculumItem.path_id,
+            UserArticleRead.read_at
+        ).join(
+            Article, Article.article_id == UserArticleRead.article_id
+        ).join(
+            CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+        ).filter(UserArticleRead.read_at.isnot(None))
+        counts: Dict[Tuple[str, int, str, datetime], int] = defaultdict(int)
+        for article_id, sub_topic_id, path_id, read_at in rows:
+            counts[(article_id, sub_topic_id, path_id, bucket_start(read_at, "hour"))] += 1
+        with self._lock:
+            self._last_pruned = None  # 보관 기간이 지난 시간 단위 행은 바로 정리
+        self.record_counts(db, counts)
+
+    def _prune_if_due(self, db: Session):
+        # 프로세스마다 시간 구간이 바뀐 뒤 처음 기록할 때 한 번만 정리
+        current_hour = bucket_start(datetime.utcnow(), "hour")
+        with self._lock:
+            if self._last_pruned == current_hour:
+                return
+            self._last_pruned = current_hour
+        db.execute(delete(ReadRollup).where(
+            ReadRollup.granularity == "hour",
+            ReadRollup.entity_type.in_(ENTITY_TYPES),
+            ReadRollup.bucket_start < current_hour - self.hourly_retention
+        ))
+
+    def trending(self, db: Session, entity_type: str, hours: int, limit: int) -> List[TrendingEntry]:
+        """최근 hours 시간(현재 구간 포함) 동안 가장 많이 읽힌 대상 top-k (제목 포함)
+
+        집계 후 삭제된 대상은 제목 조회에서 빠지므로, 모자라면 후보를 두 배씩 늘려
+        다음 순위로 채웁니다.
+        """
+        now = datetime.utcnow()
+        if hours <= HOURLY_WINDOW_LIMIT:
+            granularity = "hour"
+            since = bucket_start(now, "hour") - timedelta(hours=hours - 1)
+        else:
+            granularity = "day"
+            since = bucket_start(now, "day") - timedelta(days=-(-hours // 24) - 1)
+
+        rows = db.query(ReadRollup.entity_id, ReadRollup.read_count).filter(
+            ReadRollup.granularity == granularity,
+            ReadRollup.entity_type == entity_type,
+            ReadRollup.bucket_start >= since
+        )
+        totals: Dict[str, int] = defaultdict(int)
+        for entity_id, read_count in rows:
+            totals[entity_id] += read_count
+
+        entries: List[TrendingEntry] = []
+        checked = 0
+        fetch = limit
+        while len(entries) < limit and checked < len(totals):
+            # 크기 k인 힙으로 상위 k개만 유지 (전체 정렬 없음). nlargest는 안정 정렬과
+            # 같은 순서이므로 k를 늘려도 앞쪽 순위는 그대로
+            candidates = heapq.nlargest(fetch, totals.items(), key=itemgetter(1))[checked:]
+            titles = read_models.entity_titles(db, entity_type, [entity_id for entity_id, _ in candidates])
+            entries.extend(
+                TrendingEntry(entity_id, titles[entity_id], read_count)
+                for entity_id, read_count in candidates if entity_id in titles
+            )
+            checked += len(candidates)
+            fetch *= 2
+        return entries[:limit]
+
+# 싱글톤 인스턴스
+popularity_rollups = PopularityRollups(settings.rollup_hourly_retention_days)
@@ -0,0 +1,230 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import Article, CurriculumItem, LearningPath, SubTopic, UserArticleRead, UserProgress
+from app.services.popularity import popularity_rollups
+from app.services.read_state import read_state_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ArticlePlacement(NamedTuple):
+    """진행률 집계 단위 (글이 속한 소주제와 학습 경로, 경로 안의 위치)"""
+    sub_topic_id: int
+    path_id: str
+    level_code: str
+    sort_order: int
+
+
+class ProgressTracker:
+    """읽음 이벤트 쓰기 경로와 진행률 집계
+
+    진행률 조회 때마다 articles/user_article_reads를 COUNT하지 않도록
+    - 분모: sub_topics.article_count, learning_paths.article_count (글 생성 시 증분)
+    - 분자: user_progress(user_id, sub_topic_id, path_id).read_count (처음 읽을 때 증분)
+    - 경로 화면용 읽음 비트맵: user_read_bitmaps (app.services.read_state)
+    를 쓰기 경로에서 같은 트랜잭션으로 갱신합니다. 읽음 기록은 반드시 `record_read`
+    (이벤트 로그 압축 시에는 `record_reads`)를 거쳐야 하며, commit은 호출자 책임입니다.
+    """
+
+    def placement(self, db: Session, article_id: str) -> Optional[ArticlePlacement]:
+        row = db.query(
+            Article.sub_topic_id,
+            CurriculumItem.path_id,
+            Article.level_code,
+            CurriculumItem.sort_order
+        ).join(
+            CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+        ).filter(Article.article_id == article_id).first()
+        return ArticlePlacement(*row) if row else None
+
+    def placements(self, db: Session, article_ids: Iterable[str]) -> Dict[str, ArticlePlacement]:
+        """여러 글의 위치를 한 번에 조회 (없는 글은 결과에서 빠짐)"""
+        placements: Dict[str, ArticlePlacement] = {}
+        for chunk in _chunks(sorted(set(article_ids))):
+            rows = db.query(
+                Article.article_id,
+                Article.sub_topic_id,
+                CurriculumItem.path_id,
+                Article.level_code,
+                CurriculumItem.sort_order
+            ).join(
+                CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+            ).filter(Article.article_id.in_(chunk))
+            placements.update((row[0], ArticlePlacement(*row[1:])) for row in rows)
+        return placements
+
+    def record_read(
+        self,
+        db: Session,
+        user_id: str,
+        article_id: str,
+        read_at: Optional[datetime] = None
+    ) -> Optional[UserArticleRead]:
+        """읽음 기록을 남깁니다. 글이 없으면 None.
+
+        이미 읽은 글이면 read_at만 갱신하고, 처음 읽은 글이면 user_progress를 1 증가시킵니다.
+        """
+        placement = self.placement(db, article_id)
+        if placement is None:
+            return None
+
+        read_at = read_at or datetime.utcnow()
+        popularity_rollups.record(db, article_id, placement.sub_topic_id, placement.path_id, read_at)
+        read_record = db.get(UserArticleRead, (user_id, article_id))
+        if read_record is not None:
+            read_record.read_at = read_at
+            return read_record
+
+        read_record = UserArticleRead(user_id=user_id, article_id=article_id, read_at=read_at)
+        db.add(read_record)
+        self._count_first_read(db, user_id, placement)
+        return read_record
+
+    def record_reads(
+        self,
+        db: Session,
+        reads: Mapping[Tuple[str, str], datetime],
+        hourly_counts: Optional[Mapping[Tuple[str, datetime], int]] = None
+    ) -> int:
+        """{(user_id, article_id): read_at} 읽음 이벤트를 일괄 반영하고 처음 읽은 글 수를 반환합니다.
+
+        같은 이벤트를 여러 번 반영해도 결과가 같도록(멱등) read_at은 더 최근 값만 남기고,
+        집계는 아직 읽음 기록이 없던 글에 대해서만 증가시킵니다. 없는 글의 이벤트는 버립니다.
+        hourly_counts({(article_id, 시간 구간 시작): 읽음 수})는 인기 집계에 그대로 더해지므로
+        이 부분은 멱등이 아닙니다 (ReadEventLog는 반영한 로그 파일을 기록해 한 번만 넘김).
+        """
+        placements = self.placements(db, {article_id for _, article_id in reads})
+        if hourly_counts:
+            popularity_rollups.record_counts(db, {
+                (article_id, placements[article_id].sub_topic_id, placements[article_id].path_id, hour): count
+                for (article_id, hour), count in hourly_counts.items() if article_id in placements
+            })
+        reads = {key: read_at for key, read_at in reads.items() if key[1] in placements}
+        if not reads:
+            return 0
+
+        existing = set()
+        for chunk in _chunks(list(reads)):
+            existing.update(tuple(row) for row in db.query(UserArticleRead.user_id, UserArticleRead.article_id).filter(
+                tuple_(UserArticleRead.user_id, UserArticleRead.article_id).in_(chunk)
+            ))
+
+        stmt = sqlite_insert(UserArticleRead.__table__)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "article_id"],
+            set_={"read_at": func.max(func.coalesce(stmt.table.c.read_at, stmt.excluded.read_at), stmt.excluded.read_at)}
+        ), [
+            {"user_id": user_id, "article_id": article_id, "read_at": read_at}
+            for (user_id, article_id), read_at in reads.items()
+        ])
+
+        # 처음 읽은 글만 (사용자, 소주제, 경로) 카운터와 (사용자, 경로, 레벨) 비트맵에 반영
+        counts: Dict[Tuple[str, int, str], int] = defaultdict(int)
+        masks: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        for user_id, article_id in reads.keys() - existing:
+            placement = placements[article_id]
+            counts[(user_id, placement.sub_topic_id, placement.path_id)] += 1
+            if placement.sort_order >= 0:
+                masks[(user_id, placement.path_id, placement.level_code)] |= 1 << placement.sort_order
+        if counts:
+            stmt = sqlite_insert(UserProgress.__table__)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["user_id", "sub_topic_id", "path_id"],
+                set_={"read_count": stmt.table.c.read_count + stmt.excluded.read_count}
+            ), [
+                {"user_id": user_id, "sub_topic_id": sub_topic_id, "path_id": path_id, "read_count": count}
+                for (user_id, sub_topic_id, path_id), count in counts.items()
+            ])
+        for (user_id, path_id, level_code), mask in masks.items():
+            read_state_cache.merge(db, user_id, path_id, level_code, mask)
+        return sum(counts.values())
+
+    def count_new_read(self, db: Session, user_id: str, article_id: str, read_at: Optional[datetime] = None):
+        """호출자가 직접 추가한 UserArticleRead를 집계에 반영합니다 (디버그 데이터 생성용)."""
+        placement = self.placement(db, article_id)
+        if placement is not None:
+            self._count_first_read(db, user_id, placement)
+            if read_at is not None:
+                popularity_rollups.record(db, article_id, placement.sub_topic_id, placement.path_id, read_at)
+
+    def _count_first_read(self, db: Session, user_id: str, placement: ArticlePlacement):
+        stmt = sqlite_insert(UserProgress).values(
+            user_id=user_id,
+            sub_topic_id=placement.sub_topic_id,
+            path_id=placement.path_id,
+            read_count=1
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "sub_topic_id", "path_id"],
+            set_={"read_count": UserProgress.read_count + 1}
+        ))
+        read_state_cache.mark_read(db, user_id, placement.path_id, placement.level_code, placement.sort_order)
+
+    def record_article_added(self, db: Session, article: Article):
+        """새 글을 소주제/학습 경로 글 수에 반영하고 그 위치의 이전 읽음 비트를 끕니다."""
+        position = db.query(CurriculumItem.path_id, CurriculumItem.sort_order).filter(
+            CurriculumItem.curriculum_item_id == article.curriculum_item_id
+        ).first()
+        db.execute(
+            update(SubTopic).where(SubTopic.sub_topic_id == article.sub_topic_id)
+            .values(article_count=SubTopic.article_count + 1)
+        )
+        if position is not None:
+            db.execute(
+                update(LearningPath).where(LearningPath.path_id == position.path_id)
+                .values(article_count=LearningPath.article_count + 1)
+            )
+            read_state_cache.clear_position(db, position.path_id, article.level_code, position.sort_order)
+
+    def progress(self, db: Session, user_id: str, sub_topic_id: Optional[int] = None) -> Tuple[int, int]:
+        """(전체 글 수, 읽은 글 수) - sub_topic_id가 없으면 전체 기준"""
+        if sub_topic_id:
+            total = db.query(SubTopic.article_count).filter(SubTopic.sub_topic_id == sub_topic_id).scalar()
+            read = db.query(func.sum(UserProgress.read_count)).filter(
+                UserProgress.user_id == user_id,
+                UserProgress.sub_topic_id == sub_topic_id
+            ).scalar()
+        else:
+            total = db.query(func.sum(SubTopic.article_count)).scalar()
+            read = db.query(func.sum(UserProgress.read_count)).filter(UserProgress.user_id == user_id).scalar()
+        return int(total or 0), int(read or 0)
+
+    def rebuild(self, db: Session):
+        """글/읽음 기록에서 집계를 다시 계산합니다 (마이그레이션 이전 데이터, 디버그 데이터 삭제 후)."""
+        db.execute(update(SubTopic).values(
+            article_count=select(func.count()).where(Article.sub_topic_id == SubTopic.sub_topic_id)
+            .correlate(SubTopic).scalar_subquery()
+        ))
+        db.execute(update(LearningPath).values(
+            article_count=select(func.count()).select_from(Article).join(
+                CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+            ).where(CurriculumItem.path_id == LearningPath.path_id)
+            .correlate(LearningPath).scalar_subquery()
+        ))
+        db.execute(delete(UserProgress))
+        db.execute(insert(UserProgress).from_select(
+            ["user_id", "sub_topic_id", "path_id", "read_count"],
+            select(UserArticleRead.user_id, Article.sub_topic_id, CurriculumItem.path_id, func.count())
+            .join(Article, Article.article_id == UserArticleRead.article_id)
+            .join(CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id)
+            .group_by(UserArticleRead.user_id, Article.sub_topic_id, CurriculumItem.path_id)
+        ))
+        read_state_cache.rebuild(db)
+        logger.info("진행률 집계 재계산 완료")
+
+
+def _chunks(values: Sequence, size: int = 500):
+    # SQLite 바인드 변수 수 제한 안에서 IN 목록을 나눔
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+# 싱글톤 인스턴스
+progress_tracker = ProgressTracker()
@@ -0,0 +1,347 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models import CompactedReadLog
+from app.services.metrics import metrics
+from app.services.popularity import bucket_start
+from app.services.progress_tracker import progress_tracker
+
+logger = logging.getLogger(__name__)
+
+events_appended = metrics.counter("infou_read_events_appended_total", "Read events appended to the event log")
+events_compacted = metrics.counter(
+    "infou_read_events_compacted_total", "Read events folded from the event log into SQLite"
+)
+log_fsyncs = metrics.counter("infou_read_event_log_fsyncs_total", "Batched fsync calls on the read event log")
+compaction_errors = metrics.counter("infou_read_event_log_compaction_errors_total", "Failed event log compactions")
+
+# 레코드: [payload 길이 u32][payload crc32 u32][payload]
+# payload: [read_at (UTC epoch 마이크로초) i64][user_id 길이 u16][user_id][article_id]
+RECORD_HEADER = struct.Struct("<II")
+EVENT_HEADER = struct.Struct("<qH")
+EPOCH = datetime(1970, 1, 1)
+
+LOG_FILE = re.compile(r"^reads-(\d+)(?:-[\d-]+)?\.(log|sealed)$")
+
+ReadEvent = Tuple[str, str, datetime]  # (user_id, article_id, read_at)
+
+
+def encode_record(user_id: str, article_id: str, read_at: datetime) -> bytes:
+    user_bytes = user_id.encode("utf-8")
+    micros = (read_at - EPOCH) // timedelta(microseconds=1)
+    payload = EVENT_HEADER.pack(micros, len(user_bytes)) + user_bytes + article_id.encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def iter_records(path: str) -> Iterator[ReadEvent]:
+    """로그 파일을 mmap으로 읽어 이벤트를 순서대로 돌려줍니다.
+
+    기록 도중 중단되어 잘리거나 체크섬이 맞지 않는 꼬리 레코드를 만나면 거기서 멈춥니다.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            while offset + RECORD_HEADER.size <= size:
+                length, crc = RECORD_HEADER.unpack_from(data, offset)
+                start = offset + RECORD_HEADER.size
+                payload = data[start:start + length]
+                if len(payload) < length or length < EVENT_HEADER.size or zlib.crc32(payload) != crc:
+                    logger.warning(f"읽음 이벤트 로그 손상 레코드 무시: {path} offset={offset}")
+                    return
+                micros, user_length = EVENT_HEADER.unpack_from(payload)
+                user_end = EVENT_HEADER.size + user_length
+                yield (
+                    payload[EVENT_HEADER.size:user_end].decode("utf-8"),
+                    payload[user_end:].decode("utf-8"),
+                    EPOCH + timedelta(microseconds=micros)
+                )
+                offset = start + length
+
+
+def file_digest(path: str) -> str:
+    """봉인 파일 내용의 sha256 (파일 이름과 무관하게 같은 로그를 알아보는 키)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ReadEventLog:
+    """읽음 이벤트 추가 전용(append-only) 로그와 SQLite 압축기
+
+    활성화하면 읽음 처리 요청은 DB 대신 워커별 로그 파일(reads-<pid>.log)에 레코드를
+    덧붙이고 바로 응답합니다. fsync는 `fsync_interval`마다 모아서 한 번 하므로
+    장애 시 그 구간의 이벤트가 유실될 수 있습니다. 압축기는 `compact_interval`마다
+    활성 파일을 봉인(.sealed)하고 봉인된 파일의 이벤트를 user_article_reads와
+    진행률 집계에 일괄 반영(`ProgressTracker.record_reads`)한 뒤 파일을 지웁니다.
+    반영한 파일의 내용 해시를 같은 트랜잭션에서 compacted_read_logs에 기록하므로,
+    반영 후 삭제 전에 죽어도 재시작 시 그 파일은 지우기만 하고 인기 집계를 다시 더하지 않습니다.
+    시작 시에는 종료된 프로세스가 남긴 파일을 rename으로 가져와 먼저 반영합니다.
+    진행률/읽은 기록 조회에는 압축 주기만큼 늦게 반영됩니다.
+    """
+
+    def __init__(self, directory: str, fsync_interval: float, compact_interval: float, enabled: bool = False):
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.compact_interval = compact_interval
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._fd_pid: Optional[int] = None
+        self._dirty = False
+        self._pending_bytes = 0
+        self._seq = itertools.count()
+        self._tasks: List[asyncio.Task] = []
+        self.last_compaction: Dict[str, Any] = {}
+
+    def _active_path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"reads-{pid}.log")
+
+    def append(self, user_id: str, article_id: str, read_at: datetime):
+        record = encode_record(user_id, article_id, read_at)
+        with self._lock:
+            pid = os.getpid()
+            if self._fd is None or self._fd_pid != pid:
+                # fork 후에는 부모의 파일을 공유하지 않도록 워커별 파일을 새로 엶
+                os.makedirs(self.directory, exist_ok=True)
+                self._fd = os.open(self._active_path(pid), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                self._fd_pid = pid
+            os.write(self._fd, record)
+            self._dirty = True
+            self._pending_bytes += len(record)
+        events_appended.inc()
+
+    def sync(self):
+        """마지막 fsync 이후 추가된 레코드를 디스크에 기록합니다.
+
+        fsync는 잠금 밖에서 복제한 fd로 하므로 그동안에도 `append`가 막히지 않습니다.
+        """
+        with self._lock:
+            if not self._dirty or self._fd is None:
+                return
+            self._dirty = False
+            fd = os.dup(self._fd)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        log_fsyncs.inc()
+
+    def _sealed_path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"reads-{pid}-{time.time_ns()}-{next(self._seq)}.sealed")
+
+    def _seal_active(self) -> Optional[str]:
+        with self._lock:
+            if self._fd is None:
+                return None
+            fd, self._fd = self._fd, None
+            if self._fd_pid != os.getpid():
+                # fork 전에 부모가 연 파일은 부모가 봉인
+                os.close(fd)
+                return None
+            dirty, self._dirty = self._dirty, False
+            self._pending_bytes = 0
+            sealed = self._sealed_path(self._fd_pid)
+            # 이름만 바꾸고 잠금을 놓음 - 이후 append는 새 활성 파일에 기록
+            os.rename(self._active_path(self._fd_pid), sealed)
+        try:
+            if dirty:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        return sealed
+
+    def _claim_files(self) -> List[str]:
+        """이 프로세스가 반영할 봉인 파일 목록 (종료된 프로세스의 파일은 rename으로 가져옴)"""
+        pid = os.getpid()
+        claimed = []
+        try:
+            names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return claimed
+        for name in names:
+            match = LOG_FILE.match(name)
+            if not match:
+                continue
+            owner = int(match.group(1))
+            path = os.path.join(self.directory, name)
+            if owner == pid and match.group(2) == "sealed":
+                claimed.append(path)
+            elif owner != pid and not _pid_alive(owner):
+                target = self._sealed_path(pid)
+                try:
+                    os.rename(path, target)  # 다른 워커가 먼저 가져갔으면 실패
+                except FileNotFoundError:
+                    continue
+                claimed.append(target)
+        return sorted(claimed)
+
+    def compact_once(self) -> int:
+        """봉인된 로그를 SQLite에 반영하고 반영한 이벤트 수를 반환합니다 (동기, 스레드에서 실행)."""
+        with self._compact_lock:
+            self._seal_active()
+            paths = self._claim_files()
+            if not paths:
+                return 0
+
+            start = time.perf_counter()
+            reads: Dict[Tuple[str, str], datetime] = {}
+            hourly_counts: Dict[Tuple[str, datetime], int] = defaultdict(int)
+            events = 0
+            first_reads = 0
+            digests = {path: file_digest(path) for path in paths}
+
+            db = SessionLocal()
+            try:
+                # 이전 실행이 반영만 하고 지우지 못한 파일은 건너뜀
+                done = {digest for (digest,) in db.query(CompactedReadLog.digest).filter(
+                    CompactedReadLog.digest.in_(set(digests.values()))
+                )}
+                new_digests = set()
+                for path in paths:
+                    if digests[path] in done or digests[path] in new_digests:
+                        continue
+                    new_digests.add(digests[path])
+                    for user_id, article_id, read_at in iter_records(path):
+                        key = (user_id, article_id)
+                        if key not in reads or read_at > reads[key]:
+                            reads[key] = read_at
+                        hourly_counts[(article_id, bucket_start(read_at, "hour"))] += 1
+                        events += 1
+
+                if reads:
+                    first_reads = progress_tracker.record_reads(db, reads, hourly_counts)
+                compacted_at = datetime.utcnow()
+                db.add_all(CompactedReadLog(digest=digest, compacted_at=compacted_at) for digest in new_digests)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            for path in paths:
+                os.remove(path)
+            # 파일을 지웠으므로 기록도 정리 (실패해도 남은 행은 해가 없음)
+            db = SessionLocal()
+            try:
+                db.query(CompactedReadLog).filter(
+                    CompactedReadLog.digest.in_(set(digests.values()))
+                ).delete(synchronize_session=False)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"읽음 이벤트 로그 압축 기록 정리 실패: {str(e)}")
+            finally:
+                db.close()
+
+            events_compacted.inc(events)
+            self.last_compaction = {
+                "finished_at": datetime.utcnow().isoformat() + "Z",
+                "files": len(paths),
+                "events": events,
+                "distinct_reads": len(reads),
+                "first_reads": first_reads,
+                "seconds": round(time.perf_counter() - start, 4),
+            }
+            return events
+
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "pending_bytes": self._pending_bytes,
+            "last_compaction": self.last_compaction,
+        }
+
+    async def _run_fsync(self):
+        while True:
+            await asyncio.sleep(self.fsync_interval)
+            try:
+                await asyncio.to_thread(self.sync)
+            except Exception as e:
+                logger.warning(f"읽음 이벤트 로그 fsync 실패: {str(e)}")
+
+    async def _run_compaction(self):
+        # 첫 압축은 바로 실행해 이전 실행이 남긴(압축되지 않은) 이벤트부터 반영
+        delay = 0.0
+        while True:
+            await asyncio.sleep(delay)
+            delay = self.compact_interval
+            try:
+                await asyncio.to_thread(self.compact_once)
+            except Exception as e:
+                compaction_errors.inc()
+                logger.warning(f"읽음 이벤트 로그 압축 실패: {str(e)}")
+
+    def start(self):
+        if not self.enabled or self._tasks:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # 이전 실행이 같은 pid로 남긴 활성 파일은 이어 쓰지 않고 봉인 (잘린 꼬리 뒤에 덧붙이지 않도록)
+        with self._lock:
+            stale = self._active_path(os.getpid())
+            if self._fd is None and os.path.exists(stale):
+                os.rename(stale, self._sealed_path(os.getpid()))
+        self._tasks = [asyncio.create_task(self._run_fsync()), asyncio.create_task(self._run_compaction())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._tasks:
+            self._tasks = []
+            try:
+                await asyncio.to_thread(self.compact_once)
+            except Exception as e:
+                compaction_errors.inc()
+                logger.warning(f"읽음 이벤트 로그 종료 압축 실패: {str(e)}")
+
+
+# 싱글톤 인스턴스
+read_event_log = ReadEventLog(
+    directory=settings.read_event_log_dir,
+    fsync_interval=settings.read_event_log_fsync_interval,
+    compact_interval=settings.read_event_log_compact_interval,
+    enabled=settings.read_event_log_enabled
+)
+
+metrics.gauge(
+    "infou_read_event_log_pending_bytes", "Bytes appended to the active read event log since it was last sealed",
+    read_event_log.pending_bytes
+)
@@ -0,0 +1,454 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Type, TypeVar
+
+from sqlalchemy import case, exists, func, select
+from sqlalchemy.orm import Query, Session
+
+from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic, UserArticleRead
+
+# 읽기 전용 엔드포인트용 읽기 모델
+#
+# ORM 엔티티를 identity map에 올린 뒤 속성 몇 개를 응답 모델로 복사하는 대신,
+# 필요한 컬럼만 SELECT해 NamedTuple 행으로 돌려줍니다. 필드 순서는 각 응답 모델과
+# 같으므로 RowEncoder에 그대로 넘길 수 있습니다. *_query 함수는 keyset 페이지네이션처럼
+# 조건/정렬을 더 붙여야 하는 호출자를 위해 같은 컬럼 목록의 Query를 반환합니다.
+
+RowT = TypeVar("RowT", bound=tuple)
+
+
+class MainTopicRow(NamedTuple):
+    main_topic_id: int
+    name: str
+    description: str
+
+
+class SubTopicRow(NamedTuple):
+    sub_topic_id: int
+    name: str
+    description: str
+    source_type: str
+
+
+class LevelRow(NamedTuple):
+    level_code: str
+    name: str
+    description: str
+
+
+class LearningPathRow(NamedTuple):
+    path_id: str
+    title: str
+    description: str
+
+
+class LearningPathSummaryRow(NamedTuple):
+    path_id: str
+    title: str
+    description: str
+    curriculum_count: int
+    estimated_hours: int
+
+
+class PathItemRow(NamedTuple):
+    curriculum_item_id: str
+    title: str
+    sort_order: int
+
+
+class CurriculumItemRow(NamedTuple):
+    curriculum_item_id: str
+    title: str
+    sort_order: int
+    has_articles: bool
+
+
+class ArticleListRow(NamedTuple):
+    article_id: str
+    level_code: str
+    title: str
+    preview: str
+
+
+class ArticleDetailRow(NamedTuple):
+    article_id: str
+    title: str
+    body: str
+    level_code: str
+    curriculum_item_id: str
+
+
+class ArticleNavigationRow(NamedTuple):
+    article_id: str
+    title: str
+    curriculum_item_id: str
+    level_code: str
+
+
+class UnreadArticleRow(NamedTuple):
+    article_id: str
+    title: str
+    curriculum_item_id: str
+    level_code: str
+    path_id: str
+    sort_order: int
+
+
+class PathLevelArticleRow(NamedTuple):
+    """경로 아이템과 해당 레벨 글 (글이 아직 없으면 article_id가 None)"""
+    curriculum_item_id: str
+    title: str
+    sort_order: int
+    article_id: Optional[str]
+
+
+class ReadHistoryRow(NamedTuple):
+    article_id: str
+    title: str
+    level_code: str
+    curriculum_item_id: str
+    read_at: datetime
+
+
+class ArticlePositionRow(NamedTuple):
+    """이전/다음 글 탐색 기준 (글이 속한 학습 경로와 순서)"""
+    article_id: str
+    level_code: str
+    path_id: str
+    sort_order: int
+
+
+def fetch_all(rows: Iterable[tuple], row_type: Type[RowT]) -> List[RowT]:
+    return list(map(row_type._make, rows))
+
+
+def fetch_one(row: Optional[tuple], row_type: Type[RowT]) -> Optional[RowT]:
+    return row_type._make(row) if row is not None else None
+
+
+# 존재 확인 (PK 인덱스만 읽음)
+def main_topic_exists(db: Session, main_topic_id: int) -> bool:
+    return db.query(MainTopic.main_topic_id).filter(MainTopic.main_topic_id == main_topic_id).first() is not None
+
+
+def sub_topic_exists(db: Session, sub_topic_id: int) -> bool:
+    return db.query(SubTopic.sub_topic_id).filter(SubTopic.sub_topic_id == sub_topic_id).first() is not None
+
+
+def learning_path_exists(db: Session, path_id: str) -> bool:
+    return db.query(LearningPath.path_id).filter(LearningPath.path_id == path_id).first() is not None
+
+
+def curriculum_item_exists(db: Session, curriculum_item_id: str) -> bool:
+    return db.query(CurriculumItem.curriculum_item_id).filter(
+        CurriculumItem.curriculum_item_id == curriculum_item_id
+    ).first() is not None
+
+
+def article_exists(db: Session, article_id: str) -> bool:
+    return db.query(Article.article_id).filter(Article.article_id == article_id).first() is not None
+
+
+# 카탈로그
+def main_topics_query(db: Session) -> Query:
+    return db.query(
+        MainTopic.main_topic_id,
+        MainTopic.name,
+        func.coalesce(MainTopic.description, "")
+    )
+
+
+def main_topics(db: Session) -> List[MainTopicRow]:
+    return fetch_all(main_topics_query(db).order_by(MainTopic.main_topic_id), MainTopicRow)
+
+
+def sub_topics_query(db: Session, main_topic_id: int) -> Query:
+    return db.query(
+        SubTopic.sub_topic_id,
+        SubTopic.name,
+        func.coalesce(SubTopic.description, ""),
+        SubTopic.source_type
+    ).filter(SubTopic.main_topic_id == main_topic_id)
+
+
+def sub_topics(db: Session, main_topic_id: int) -> List[SubTopicRow]:
+    return fetch_all(sub_topics_query(db, main_topic_id).order_by(SubTopic.sub_topic_id), SubTopicRow)
+
+
+def sub_topics_by_ids(db: Session, sub_topic_ids: Iterable[int]) -> Dict[int, SubTopicRow]:
+    rows = db.query(
+        SubTopic.sub_topic_id,
+        SubTopic.name,
+        func.coalesce(SubTopic.description, ""),
+        SubTopic.source_type
+    ).filter(SubTopic.sub_topic_id.in_(list(sub_topic_ids)))
+    return {row.sub_topic_id: row for row in fetch_all(rows, SubTopicRow)}
+
+
+def levels(db: Session) -> List[LevelRow]:
+    return fetch_all(
+        db.query(Level.level_code, Level.name, func.coalesce(Level.description, "")),
+        LevelRow
+    )
+
+
+# 학습 경로
+def learning_paths(db: Session, sub_topic_id: int) -> List[LearningPathSummaryRow]:
+    """소주제의 학습 경로 목록 - 경로별 커리큘럼 수는 상관 서브쿼리로 한 번에 계산"""
+    curriculum_count = select(func.count()).where(
+        CurriculumItem.path_id == LearningPath.path_id
+    ).correlate(LearningPath).scalar_subquery()
+    rows = db.query(
+        LearningPath.path_id,
+        LearningPath.title,
+        func.coalesce(LearningPath.description, ""),
+        curriculum_count
+    ).filter(
+        LearningPath.sub_topic_id == sub_topic_id
+    )
+    # 더미 계산: 커리큘럼당 2시간
+    return [
+        LearningPathSummaryRow(path_id, title, description, count, count * 2)
+        for path_id, title, description, count in rows
+    ]
+
+
+def learning_path(db: Session, path_id: str) -> Optional[LearningPathRow]:
+    row = db.query(
+        LearningPath.path_id,
+        LearningPath.title,
+        func.coalesce(LearningPath.description, "")
+    ).filter(LearningPath.path_id == path_id).first()
+    return fetch_one(row, LearningPathRow)
+
+
+def path_items(db: Session, path_id: str) -> List[PathItemRow]:
+    return fetch_all(
+        db.query(
+            CurriculumItem.curriculum_item_id,
+            CurriculumItem.title,
+            CurriculumItem.sort_order
+        ).filter(CurriculumItem.path_id == path_id).order_by(CurriculumItem.sort_order),
+        PathItemRow
+    )
+
+
+def path_level_articles(db: Session, path_id: str, level: str) -> List[PathLevelArticleRow]:
+    """경로의 아이템별 해당 레벨 글 - idx_path_sort_order + idx_curriculum_item_level"""
+    return fetch_all(
+        db.query(
+            CurriculumItem.curriculum_item_id,
+            CurriculumItem.title,
+            CurriculumItem.sort_order,
+            Article.article_id
+        ).outerjoin(
+            Article,
+            (Article.curriculum_item_id == CurriculumItem.curriculum_item_id) & (Article.level_code == level)
+        ).filter(CurriculumItem.path_id == path_id).order_by(CurriculumItem.sort_order),
+        PathLevelArticleRow
+    )
+
+
+def curriculum_items_query(db: Session, path_id: str) -> Query:
+    """경로의 커리큘럼 아이템 - 글 존재 여부는 EXISTS 서브쿼리로 한 번에 계산"""
+    has_articles = exists().where(
+        Article.curriculum_item_id == CurriculumItem.curriculum_item_id
+    )
+    return db.query(
+        CurriculumItem.curriculum_item_id,
+        CurriculumItem.title,
+        CurriculumItem.sort_order,
+        has_articles
+    ).filter(CurriculumItem.path_id == path_id)
+
+
+def curriculum_items(db: Session, path_id: str) -> List[CurriculumItemRow]:
+    return fetch_all(
+        curriculum_items_query(db, path_id).order_by(CurriculumItem.sort_order),
+        CurriculumItemRow
+    )
+
+
+# 글
+def articles_by_curriculum_item_query(db: Session, curriculum_item_id: str, level: Optional[str] = None) -> Query:
+    """아이템의 글 목록 - 저장된 미리보기만 읽어 본문(overflow 페이지)은 건드리지 않음"""
+    query = db.query(
+        Article.article_id,
+        Article.level_code,
+        Article.title,
+        Article.preview
+    ).filter(Article.curriculum_item_id == curriculum_item_id)
+    if level:
+        query = query.filter(Article.level_code == level)
+    return query
+
+
+def articles_by_curriculum_item(db: Session, curriculum_item_id: str, level: Optional[str] = None) -> List[ArticleListRow]:
+    # 아이템 안에서 level_code는 고유하므로 (curriculum_item_id, level_code) 인덱스 순서를 그대로 사용
+    return fetch_all(
+        articles_by_curriculum_item_query(db, curriculum_item_id, level).order_by(Article.level_code),
+        ArticleListRow
+    )
+
+
+def article_detail(db: Session, article_id: str) -> Optional[ArticleDetailRow]:
+    row = db.query(
+        Article.article_id,
+        Article.title,
+        Article.body,
+        Article.level_code,
+        Article.curriculum_item_id
+    ).filter(Article.article_id == article_id).first()
+    return fetch_one(row, ArticleDetailRow)
+
+
+def article_summaries(db: Session, article_ids: Iterable[str]) -> Dict[str, ArticleNavigationRow]:
+    rows = db.query(
+        Article.article_id,
+        Article.title,
+        Article.curriculum_item_id,
+        Article.level_code
+    ).filter(Article.article_id.in_(list(article_ids)))
+    return {row.article_id: row for row in fetch_all(rows, ArticleNavigationRow)}
+
+
+def article_position(db: Session, article_id: str) -> Optional[ArticlePositionRow]:
+    row = db.query(
+        Article.article_id,
+        Article.level_code,
+        CurriculumItem.path_id,
+        CurriculumItem.sort_order
+    ).join(
+        CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+    ).filter(Article.article_id == article_id).first()
+    return fetch_one(row, ArticlePositionRow)
+
+
+def adjacent_article(
+    db: Session,
+    position: ArticlePositionRow,
+    level_code: str,
+    forward: bool = True
+) -> Optional[ArticleNavigationRow]:
+    """같은 학습 경로에서 바로 다음(이전) 아이템의 해당 레벨 글
+
+    바로 옆 아이템에 그 레벨 글이 없으면 더 건너뛰지 않고 None을 반환합니다.
+    """
+    if forward:
+        neighbour = select(func.min(CurriculumItem.sort_order)).where(
+            CurriculumItem.path_id == position.path_id,
+            CurriculumItem.sort_order > position.sort_order
+        )
+    else:
+        neighbour = select(func.max(CurriculumItem.sort_order)).where(
+            CurriculumItem.path_id == position.path_id,
+            CurriculumItem.sort_order < position.sort_order
+        )
+    row = db.query(
+        Article.article_id,
+        Article.title,
+        Article.curriculum_item_id,
+        Article.level_code
+    ).join(
+        CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+    ).filter(
+        CurriculumItem.path_id == position.path_id,
+        CurriculumItem.sort_order == neighbour.scalar_subquery(),
+        Article.level_code == level_code
+    ).first()
+    return fetch_one(row, ArticleNavigationRow)
+
+
+# 읽음 상태
+LEVEL_ORDER = ("beginner", "intermediate", "expert")
+
+# 레벨 코드 문자열 순서(expert < intermediate)가 아닌 난이도 순서로 정렬하기 위한 순위
+level_rank = case(
+    {code: rank for rank, code in enumerate(LEVEL_ORDER)},
+    value=Article.level_code,
+    else_=len(LEVEL_ORDER)
+)
+
+
+def unread_articles_query(
+    db: Session,
+    user_id: str,
+    path_id: Optional[str] = None,
+    sub_topic_id: Optional[int] = None,
+    level: Optional[str] = None
+) -> Query:
+    """사용자가 아직 읽지 않은 글 - user_article_reads PK에 대한 LEFT JOIN ... IS NULL 안티 조인
+
+    curriculum_items(idx_path_sort_order)를 바깥 루프로, articles(idx_curriculum_item_level)와
+    user_article_reads(PK)를 인덱스 조회로 붙이므로 (path_id, sort_order, level_code) 순서로
+    정렬하면 정렬 단계 없이 읽히고 LIMIT에서 바로 멈춥니다. 읽은 글 수와 무관하게
+    확인하는 글 수만큼만 비용이 듭니다. sub_topic_id는 그 소주제의 학습 경로
+    (idx_learning_path_sub_topic_id)로 바꿔 해당 경로의 아이템만 훑습니다.
+    """
+    query = db.query(
+        Article.article_id,
+        Article.title,
+        Article.curriculum_item_id,
+        Article.level_code,
+        CurriculumItem.path_id,
+        CurriculumItem.sort_order
+    ).select_from(CurriculumItem).join(
+        Article, Article.curriculum_item_id == CurriculumItem.curriculum_item_id
+    ).outerjoin(
+        UserArticleRead,
+        (UserArticleRead.user_id == user_id) & (UserArticleRead.article_id == Article.article_id)
+    ).filter(UserArticleRead.article_id.is_(None))
+    if path_id is not None:
+        query = query.filter(CurriculumItem.path_id == path_id)
+    if sub_topic_id is not None:
+        query = query.filter(CurriculumItem.path_id.in_(
+            select(LearningPath.path_id).where(LearningPath.sub_topic_id == sub_topic_id)
+        ))
+    if level:
+        query = query.filter(Article.level_code == level)
+    return query
+
+
+def first_unread_article(
+    db: Session,
+    user_id: str,
+    path_id: Optional[str] = None,
+    sub_topic_id: Optional[int] = None,
+    level: Optional[str] = None
+) -> Optional[UnreadArticleRow]:
+    """커리큘럼 순서상 첫 번째 안 읽은 글 (이어 읽기 위치)
+
+    같은 아이템에서는 레벨 난이도 순서(beginner → intermediate → expert)로 고릅니다.
+    """
+    order = [CurriculumItem.path_id, CurriculumItem.sort_order]
+    if not level:
+        order.append(level_rank)
+    row = unread_articles_query(db, user_id, path_id, sub_topic_id, level).order_by(*order).first()
+    return fetch_one(row, UnreadArticleRow)
+
+
+def reading_history_query(db: Session, user_id: str) -> Query:
+    """사용자의 읽은 기록 - idx_user_read_at(user_id, read_at, article_id)을 역순으로 훑고 글 제목은 PK로 조회"""
+    return db.query(
+        UserArticleRead.article_id,
+        Article.title,
+        Article.level_code,
+        Article.curriculum_item_id,
+        UserArticleRead.read_at
+    ).join(
+        Article, Article.article_id == UserArticleRead.article_id
+    ).filter(
+        UserArticleRead.user_id == user_id,
+        UserArticleRead.read_at.isnot(None)
+    )
+
+
+def entity_titles(db: Session, entity_type: str, entity_ids: Iterable[str]) -> Dict[str, str]:
+    """인기 목록 대상(article | path | sub_topic) id → 제목"""
+    if entity_type == "article":
+        id_column, title_column = Article.article_id, Article.title
+    elif entity_type == "path":
+        id_column, title_column = LearningPath.path_id, LearningPath.title
+    else:
+        id_column, title_column = SubTopic.sub_topic_id, SubTopic.name
+        entity_ids = [int(entity_id) for entity_id in entity_ids]
+    return {str(entity_id): title for entity_id, title in db.query(id_column, title_column).filter(id_column.in_(list(entity_ids)))}
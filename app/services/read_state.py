@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple
+
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models import Article, CurriculumItem, UserArticleRead, UserReadBitmap
+
+BitmapKey = Tuple[str, str, str]  # (user_id, path_id, level_code)
+
+# 세션 info에 commit 전까지 모아두는 캐시 갱신 {BitmapKey: bits}
+_PENDING_KEY = "read_state_pending"
+# commit 뒤 캐시를 모두 비워야 하는지 (전체 재계산)
+_CLEAR_KEY = "read_state_clear"
+
+
+def decode_bits(blob: bytes) -> int:
+    return int.from_bytes(blob, "little")
+
+
+def encode_bits(bits: int) -> bytes:
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def positions_mask(sort_orders: Iterable[int]) -> int:
+    """sort_order 목록을 비트 마스크로 변환 (음수 위치는 비트맵에 담지 않음)"""
+    mask = 0
+    for sort_order in sort_orders:
+        if sort_order >= 0:
+            mask |= 1 << sort_order
+    return mask
+
+
+class ReadStateCache:
+    """(사용자, 학습 경로, 레벨)별 읽음 비트맵
+
+    비트 i가 1이면 그 경로에서 sort_order가 i인 아이템의 해당 레벨 글을 읽은 것입니다.
+    user_read_bitmaps 테이블에 BLOB으로 저장하고 최근 사용한 비트맵은 파이썬 정수로
+    메모리에 두므로, 경로 화면의 읽음 표시/진행률/안 읽은 글 필터는 user_article_reads
+    조인 없이 비트 연산으로 계산됩니다. 쓰기는 `mark_read` (읽음 이벤트 경로)와 위치에 새 글이
+    생길 때의 `clear_position`, 재계산에서 일어나며 commit은 호출자 책임입니다. 메모리 캐시는
+    그 세션의 commit이 성공한 뒤에 갱신되고 롤백되면 버려집니다. 다른 워커의 갱신은 TTL이
+    지난 뒤 반영됩니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[BitmapKey, Tuple[int, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, db: Session, user_id: str, path_id: str, level_code: str) -> int:
+        key = (user_id, path_id, level_code)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        blob = db.query(UserReadBitmap.bits).filter(
+            UserReadBitmap.user_id == user_id,
+            UserReadBitmap.path_id == path_id,
+            UserReadBitmap.level_code == level_code
+        ).scalar()
+        bits = decode_bits(blob) if blob else 0
+        with self._lock:
+            # 로드 도중 mark_read가 더 새 값을 넣었다면 그 값을 유지
+            current = self._entries.get(key)
+            if current is None or current is entry:
+                self._store(key, bits)
+            else:
+                bits = current[0]
+        return bits
+
+    def mark_read(self, db: Session, user_id: str, path_id: str, level_code: str, sort_order: int):
+        """비트 하나를 켭니다. 같은 트랜잭션에서 읽음 기록과 함께 commit되어야 합니다."""
+        if sort_order >= 0:
+            self.merge(db, user_id, path_id, level_code, 1 << sort_order)
+
+    def merge(self, db: Session, user_id: str, path_id: str, level_code: str, mask: int):
+        """여러 비트를 한 번에 켭니다 (읽음 이벤트 일괄 반영용)."""
+        key = (user_id, path_id, level_code)
+        # 먼저 쓰기로 행을 확보해 쓰기 잠금을 잡은 뒤 읽고 갱신 (동시 갱신 유실 방지)
+        db.execute(sqlite_insert(UserReadBitmap).values(
+            user_id=user_id, path_id=path_id, level_code=level_code, bits=b""
+        ).on_conflict_do_nothing())
+        where = (
+            (UserReadBitmap.user_id == user_id)
+            & (UserReadBitmap.path_id == path_id)
+            & (UserReadBitmap.level_code == level_code)
+        )
+        bits = decode_bits(db.execute(select(UserReadBitmap.bits).where(where)).scalar_one()) | mask
+        db.execute(update(UserReadBitmap).where(where).values(bits=encode_bits(bits)))
+        db.info.setdefault(_PENDING_KEY, {})[key] = bits
+
+    def clear_position(self, db: Session, path_id: str, level_code: str, sort_order: int):
+        """경로의 한 위치에 새 글이 생기면 그 위치의 비트를 모든 사용자에게서 끕니다.
+
+        비트맵은 글이 아니라 커리큘럼 위치를 가리키므로, 지워진 글/아이템 자리에 새 글이
+        생기면 이전 글의 읽음 표시가 새 글에 남습니다.
+        """
+        if sort_order < 0:
+            return
+        bit = 1 << sort_order
+        rows = db.execute(select(UserReadBitmap.user_id, UserReadBitmap.bits).where(
+            UserReadBitmap.path_id == path_id,
+            UserReadBitmap.level_code == level_code
+        )).all()
+        pending = db.info.setdefault(_PENDING_KEY, {})
+        for user_id, blob in rows:
+            bits = decode_bits(blob)
+            if bits & bit:
+                bits &= ~bit
+                db.execute(update(UserReadBitmap).where(
+                    (UserReadBitmap.user_id == user_id)
+                    & (UserReadBitmap.path_id == path_id)
+                    & (UserReadBitmap.level_code == level_code)
+                ).values(bits=encode_bits(bits)))
+                pending[(user_id, path_id, level_code)] = bits
+
+    def apply(self, bitmaps: Dict[BitmapKey, int]):
+        """commit된 비트맵을 캐시에 반영합니다."""
+        with self._lock:
+            for key, bits in bitmaps.items():
+                self._store(key, bits)
+
+    def _store(self, key: BitmapKey, bits: int):
+        self._entries[key] = (bits, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def rebuild(self, db: Session):
+        """user_article_reads에서 모든 비트맵을 다시 계산합니다."""
+        rows = db.query(
+            UserArticleRead.user_id,
+            CurriculumItem.path_id,
+            Article.level_code,
+            CurriculumItem.sort_order
+        ).join(
+            Article, Article.article_id == UserArticleRead.article_id
+        ).join(
+            CurriculumItem, CurriculumItem.curriculum_item_id == Article.curriculum_item_id
+        )
+        bitmaps: Dict[BitmapKey, int] = {}
+        for user_id, path_id, level_code, sort_order in rows:
+            if sort_order >= 0:
+                key = (user_id, path_id, level_code)
+                bitmaps[key] = bitmaps.get(key, 0) | (1 << sort_order)
+
+        db.execute(delete(UserReadBitmap))
+        if bitmaps:
+            db.execute(UserReadBitmap.__table__.insert(), [
+                {"user_id": user_id, "path_id": path_id, "level_code": level_code, "bits": encode_bits(bits)}
+                for (user_id, path_id, level_code), bits in bitmaps.items()
+            ])
+        # 캐시는 commit된 뒤에 비움 (롤백되면 기존 값이 그대로 맞음)
+        db.info.pop(_PENDING_KEY, None)
+        db.info[_CLEAR_KEY] = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+# 싱글톤 인스턴스
+read_state_cache = ReadStateCache(settings.read_state_cache_size, settings.read_state_cache_ttl)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_pending(session: Session):
+    if session.info.pop(_CLEAR_KEY, False):
+        read_state_cache.clear()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        read_state_cache.apply(pending)
+
+
+@event.listens_for(SessionLocal, "after_transaction_end")
+def _discard_pending(session: Session, transaction):
+    # commit 없이 끝난 트랜잭션(롤백, close)의 갱신은 캐시에 반영하지 않음
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_CLEAR_KEY, None)
@@ -0,0 +1,425 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models import Article, SubTopic
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("article", "sub_topic")
+NGRAM_SIZES = (2, 3)
+HASH_BITS = 18  # 문서 빈도(df)를 세는 n-gram 해시 버킷 수 = 2^18
+MAX_TEXT_LENGTH = 2000  # 본문은 앞부분만 벡터화
+_WHITESPACE = re.compile(r"\s+")
+
+# (id, 텍스트) 목록을 새로 만들어 주는 함수 (전체 재생성은 목록을 두 번 훑음)
+TextSource = Callable[[], Iterable[Tuple[str, str]]]
+
+
+class SimilarEntry(NamedTuple):
+    entity_id: str
+    score: float  # 코사인 유사도
+
+
+def ngram_buckets(text: str) -> np.ndarray:
+    """텍스트의 문자 2/3-gram을 해시 버킷 번호 배열로 변환 (반복 포함)"""
+    text = _WHITESPACE.sub(" ", text.lower()).strip()[:MAX_TEXT_LENGTH]
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    hashes = []
+    for n in NGRAM_SIZES:
+        count = len(codes) - n + 1
+        if count <= 0:
+            continue
+        h = np.full(count, n, dtype=np.uint64)
+        for offset in range(n):
+            h = h * np.uint64(1000003) + codes[offset:offset + count]
+        hashes.append(h)
+    if not hashes:
+        return np.zeros(0, dtype=np.int64)
+    # splitmix64 마무리 단계로 섞은 뒤 상위 비트를 버킷으로 사용
+    h = np.concatenate(hashes)
+    h ^= h >> np.uint64(31)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(29)
+    return (h >> np.uint64(64 - HASH_BITS)).astype(np.int64)
+
+
+def document_text(title: str, body: Optional[str]) -> str:
+    return f"{title} {body or ''}"
+
+
+class _Segment(NamedTuple):
+    name: str  # 파일 이름 (세대마다 새 이름이므로 같으면 내용도 같음)
+    matrix: np.ndarray  # (행 수, dims) float32, 디스크에서 mmap
+    ids: List[str]
+    positions: Dict[str, int]  # id → 행
+
+
+class _LoadedIndex(NamedTuple):
+    manifest_version: Tuple[int, int]  # (inode, mtime) - os.replace마다 바뀜
+    dims: int
+    documents: int
+    df: str  # 문서 빈도 파일 이름 (IDF는 인덱스에 없는 항목을 조회할 때만 필요)
+    base: _Segment
+    delta: _Segment
+
+
+class SimilarityIndex:
+    """소주제/글 문자 n-gram TF-IDF 벡터 인덱스
+
+    문자 2/3-gram을 2^18개 버킷으로 해시해 TF-IDF(1 + log tf, 버킷별 df)를 구하고,
+    버킷을 부호와 함께 `dims`차원으로 접어(feature hashing) L2 정규화한 float32 행렬로
+    저장합니다. 유사도 조회는 정규화된 행렬과 질의 벡터의 곱 한 번 + argpartition top-k입니다.
+
+    파일은 종류별로 `directory`에 둡니다.
+    - `<kind>-<세대>.npy`, `.ids`: 기준 행렬과 행별 id (줄 단위)
+    - `<kind>-<세대>-delta.npy`, `.ids`: 기준 이후 추가된 행
+    - `<kind>-<세대>-df.npy`: 버킷별 문서 빈도
+    - `<kind>.manifest.json`: 현재 세대의 파일 이름과 문서 수 (os.replace로 교체)
+    행렬은 `np.load(mmap_mode="r")`로 열어 여러 워커가 같은 페이지 캐시를 공유하고,
+    조회 때마다 manifest 변경 시각을 확인해 다른 워커가 쓴 새 세대를 다시 엽니다. 이름이 같은
+    기준 행렬과 id 매핑은 그대로 재사용하므로 delta만 바뀐 경우 작은 delta만 다시 읽습니다.
+    새 글/소주제는 `add`로 대기열에 넣으면 백그라운드 작업이 `update_interval`마다 모아
+    delta에 덧붙이며 (파일 잠금으로 워커 간 직렬화), delta가 `delta_max_rows`를 넘으면
+    기준 행렬에 합칩니다. 추가된 행은 그 시점의 IDF로 계산되므로
+    `python -m app.database.rebuild_similarity_index`로 가끔 전체 재생성하면 가중치가
+    다시 맞춰집니다. 인덱스가 없으면 앱 시작 시 백그라운드에서 만들며, 그동안 조회는 빈 목록입니다.
+    """
+
+    def __init__(self, directory: str, dims: int, delta_max_rows: int, update_interval: float):
+        self.directory = directory
+        self.dims = dims
+        self.delta_max_rows = delta_max_rows
+        self.update_interval = update_interval
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, _LoadedIndex] = {}
+        self._idfs: Dict[str, Tuple[str, np.ndarray]] = {}  # kind → (df 파일 이름, IDF)
+        self._pending_lock = threading.Lock()
+        self._pending: List[Tuple[str, str, str]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @contextmanager
+    def _file_lock(self, kind: str) -> Iterator[None]:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(f"{kind}.lock"), "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_manifest(self, kind: str) -> Optional[dict]:
+        try:
+            with open(self._path(f"{kind}.manifest.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _read_ids(self, name: str) -> List[str]:
+        with open(self._path(name + ".ids"), encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def _load_segment(self, name: str) -> _Segment:
+        ids = self._read_ids(name)
+        return _Segment(
+            name, np.load(self._path(name + ".npy"), mmap_mode="r"), ids,
+            {entity_id: row for row, entity_id in enumerate(ids)}
+        )
+
+    def _cached_segment(self, kind: str, name: str) -> _Segment:
+        """이미 열어 둔 세그먼트면 재사용하고 아니면 파일에서 엽니다."""
+        loaded = self._loaded.get(kind)
+        if loaded is not None:
+            for segment in (loaded.base, loaded.delta):
+                if segment.name == name:
+                    return segment
+        return self._load_segment(name)
+
+    def _write_segment(self, name: str, matrix: np.ndarray, ids: List[str]):
+        np.save(self._path(name + ".npy"), matrix)
+        with open(self._path(name + ".ids"), "w", encoding="utf-8") as f:
+            f.write("".join(f"{entity_id}\n" for entity_id in ids))
+
+    def _publish(self, kind: str, manifest: dict):
+        """새 manifest로 교체하고 더 이상 참조하지 않는 파일을 지웁니다 (열려 있는 mmap은 유지됨)."""
+        tmp = self._path(f"{kind}.manifest.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self._path(f"{kind}.manifest.json"))
+
+        keep = {manifest["base"], manifest["df"], manifest["delta"]}
+        for name in os.listdir(self.directory):
+            stem, ext = os.path.splitext(name)
+            if name.startswith(f"{kind}-") and ext in (".npy", ".ids") and stem not in keep:
+                os.remove(self._path(name))
+
+    @staticmethod
+    def _idf(df: np.ndarray, documents: int) -> np.ndarray:
+        return (np.log((1 + documents) / (1 + df)) + 1).astype(np.float32)
+
+    def _vector(self, buckets: np.ndarray, idf: np.ndarray, dims: int) -> np.ndarray:
+        vector = np.zeros(dims, dtype=np.float32)
+        if len(buckets):
+            unique, counts = np.unique(buckets, return_counts=True)
+            weights = (1 + np.log(counts)) * idf[unique]
+            signs = np.where((unique // dims) & 1, -1.0, 1.0)
+            np.add.at(vector, unique % dims, (signs * weights).astype(np.float32))
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    def build(self, kind: str, source: TextSource, only_if_missing: bool = False):
+        """전체 재생성 (df 계산과 벡터화를 위해 source를 두 번 훑음)"""
+        with self._file_lock(kind):
+            if only_if_missing and self._read_manifest(kind) is not None:
+                return  # 다른 워커가 먼저 만듦
+            df = np.zeros(1 << HASH_BITS, dtype=np.int32)
+            documents = 0
+            for _, text in source():
+                df[np.unique(ngram_buckets(text))] += 1
+                documents += 1
+
+            idf = self._idf(df, documents)
+            ids: List[str] = []
+            rows: List[np.ndarray] = []
+            for entity_id, text in source():
+                ids.append(str(entity_id))
+                rows.append(self._vector(ngram_buckets(text), idf, self.dims))
+            matrix = np.vstack(rows) if rows else np.zeros((0, self.dims), dtype=np.float32)
+
+            generation = time.time_ns()
+            manifest = {
+                "dims": self.dims,
+                "documents": documents,
+                "base": f"{kind}-{generation}",
+                "delta": f"{kind}-{generation}-delta",
+                "df": f"{kind}-{generation}-df",
+            }
+            self._write_segment(manifest["base"], matrix, ids)
+            self._write_segment(manifest["delta"], np.zeros((0, self.dims), dtype=np.float32), [])
+            np.save(self._path(manifest["df"] + ".npy"), df)
+            self._publish(kind, manifest)
+        self._load(kind)
+
+    def add_rows(self, kind: str, items: List[Tuple[str, str]]):
+        """(id, 텍스트) 행들을 delta에 한 번에 덧붙입니다 (동기, 스레드에서 실행)."""
+        with self._file_lock(kind):
+            manifest = self._read_manifest(kind)
+            if manifest is None:
+                return  # 인덱스를 만들 때 DB에서 함께 읽힘
+            dims = manifest["dims"]
+            df = np.load(self._path(manifest["df"] + ".npy"))
+            idf = self._idf(df, manifest["documents"])
+            base_segment = self._cached_segment(kind, manifest["base"])
+            delta = np.load(self._path(manifest["delta"] + ".npy"))
+            delta_ids = self._read_ids(manifest["delta"])
+            # 전체 생성과 겹쳐 이미 들어간 항목은 건너뜀
+            existing = set(delta_ids)
+
+            rows = []
+            for entity_id, text in items:
+                if entity_id in existing or entity_id in base_segment.positions:
+                    continue
+                existing.add(entity_id)
+                buckets = ngram_buckets(text)
+                rows.append(self._vector(buckets, idf, dims))
+                df[np.unique(buckets)] += 1
+                delta_ids.append(entity_id)
+            if not rows:
+                return
+            delta = np.vstack([delta] + [row[np.newaxis, :] for row in rows])
+
+            generation = time.time_ns()
+            manifest = dict(manifest, documents=manifest["documents"] + len(rows), df=f"{kind}-{generation}-df")
+            if len(delta_ids) > self.delta_max_rows:
+                # delta가 커지면 기준 행렬에 합쳐 조회당 세그먼트 수를 유지
+                manifest["base"] = f"{kind}-{generation}"
+                self._write_segment(
+                    manifest["base"], np.vstack([base_segment.matrix, delta]), base_segment.ids + delta_ids
+                )
+                delta, delta_ids = np.zeros((0, dims), dtype=np.float32), []
+            manifest["delta"] = f"{kind}-{generation}-delta"
+            self._write_segment(manifest["delta"], delta, delta_ids)
+            np.save(self._path(manifest["df"] + ".npy"), df)
+            self._publish(kind, manifest)
+        # 새 세대를 이 스레드에서 열어 두어 다음 조회 요청이 파일을 읽지 않게 함
+        self._load(kind)
+
+    def add(self, kind: str, entity_id: str, text: str):
+        """새 글/소주제를 반영 대기열에 넣습니다 (요청 경로에서는 파일을 쓰지 않음)."""
+        with self._pending_lock:
+            self._pending.append((kind, str(entity_id), text))
+
+    def add_article(self, article: Article):
+        self.add("article", article.article_id, document_text(article.title, article.body))
+
+    def add_sub_topic(self, sub_topic: SubTopic):
+        self.add("sub_topic", str(sub_topic.sub_topic_id), document_text(sub_topic.name, sub_topic.description))
+
+    def flush(self) -> int:
+        """대기열의 항목을 종류별로 모아 반영하고 반영 시도한 항목 수를 반환합니다 (동기)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        by_kind: Dict[str, List[Tuple[str, str]]] = {}
+        for kind, entity_id, text in pending:
+            by_kind.setdefault(kind, []).append((entity_id, text))
+        for kind, items in by_kind.items():
+            try:
+                self.add_rows(kind, items)
+            except Exception as e:
+                logger.warning(f"유사도 인덱스 추가 실패 ({kind} {len(items)}개): {str(e)}")
+        return len(pending)
+
+    def ensure_built(self):
+        """인덱스가 없는 종류를 DB에서 만듭니다 (동기, 시작 시 스레드에서 실행)."""
+        db = SessionLocal()
+        try:
+            for kind in KINDS:
+                self.build(kind, lambda: texts(db, kind), only_if_missing=True)
+        finally:
+            db.close()
+
+    async def _run_updates(self):
+        try:
+            await asyncio.to_thread(self.ensure_built)
+        except Exception as e:
+            logger.warning(f"유사도 인덱스 생성 실패: {str(e)}")
+        while True:
+            await asyncio.sleep(self.update_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.warning(f"유사도 인덱스 갱신 실패: {str(e)}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_updates())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await asyncio.to_thread(self.flush)
+
+    def _load(self, kind: str) -> Optional[_LoadedIndex]:
+        try:
+            stat = os.stat(self._path(f"{kind}.manifest.json"))
+        except FileNotFoundError:
+            return None
+        version = (stat.st_ino, stat.st_mtime_ns)
+        loaded = self._loaded.get(kind)
+        if loaded is not None and loaded.manifest_version == version:
+            return loaded
+
+        with self._lock:
+            loaded = self._loaded.get(kind)
+            if loaded is not None and loaded.manifest_version == version:
+                return loaded  # 잠금을 기다리는 동안 다른 스레드가 엶
+            for _ in range(3):
+                manifest = self._read_manifest(kind)
+                try:
+                    base = self._cached_segment(kind, manifest["base"])
+                    delta = self._cached_segment(kind, manifest["delta"])
+                    break
+                except FileNotFoundError:
+                    continue  # manifest를 읽은 뒤 다른 워커가 새 세대로 교체함
+            else:
+                return loaded
+            loaded = _LoadedIndex(version, manifest["dims"], manifest["documents"], manifest["df"], base, delta)
+            self._loaded[kind] = loaded
+            return loaded
+
+    def _idf_for(self, kind: str, index: _LoadedIndex) -> Optional[np.ndarray]:
+        cached = self._idfs.get(kind)
+        if cached is not None and cached[0] == index.df:
+            return cached[1]
+        try:
+            df = np.load(self._path(index.df + ".npy"))
+        except FileNotFoundError:
+            return None  # 다른 워커가 새 세대로 교체함
+        idf = self._idf(df, index.documents)
+        self._idfs[kind] = (index.df, idf)
+        return idf
+
+    def similar(self, db: Session, kind: str, entity_id: str, limit: int) -> List[SimilarEntry]:
+        """entity_id와 가장 비슷한 항목 (자기 자신 제외, 유사도 내림차순)"""
+        index = self._load(kind)
+        if index is None:
+            return []  # 시작 시 백그라운드 생성이 끝나기 전
+
+        segment = index.delta if entity_id in index.delta.positions else index.base
+        row = segment.positions.get(entity_id)
+        if row is not None:
+            query = np.array(segment.matrix[row])
+        else:
+            # 인덱스에 아직 없는 항목(대기열에 있거나 다른 경로로 추가됨)은 현재 IDF로 바로 벡터화
+            text = next((text for _, text in texts(db, kind, [entity_id])), None)
+            idf = self._idf_for(kind, index)
+            if text is None or idf is None:
+                return []
+            query = self._vector(ngram_buckets(text), idf, index.dims)
+
+        base_rows = len(index.base.ids)
+        scores = np.concatenate([index.base.matrix @ query, index.delta.matrix @ query])
+        k = min(limit + 1, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        entries = []
+        for i in top:
+            row = int(i)
+            found = index.base.ids[row] if row < base_rows else index.delta.ids[row - base_rows]
+            if found != entity_id:
+                entries.append(SimilarEntry(found, float(scores[i])))
+        return entries[:limit]
+
+    def size(self, kind: str) -> int:
+        index = self._load(kind)
+        return len(index.base.ids) + len(index.delta.ids) if index else 0
+
+
+def texts(db: Session, kind: str, entity_ids: Optional[List[str]] = None) -> Iterator[Tuple[str, str]]:
+    """인덱스에 넣을 (id, 텍스트): 글은 제목 + 본문 앞부분, 소주제는 이름 + 설명"""
+    if kind == "article":
+        query = db.query(Article.article_id, Article.title, Article.body)
+        id_column = Article.article_id
+    else:
+        query = db.query(SubTopic.sub_topic_id, SubTopic.name, SubTopic.description)
+        id_column = SubTopic.sub_topic_id
+        if entity_ids is not None:
+            entity_ids = [int(entity_id) for entity_id in entity_ids]
+    if entity_ids is not None:
+        query = query.filter(id_column.in_(entity_ids))
+    for entity_id, title, body in query.order_by(id_column).yield_per(1000):
+        yield str(entity_id), document_text(title, body)
+
+
+# 싱글톤 인스턴스
+similarity_index = SimilarityIndex(
+    directory=settings.similarity_index_dir,
+    dims=settings.similarity_dimensions,
+    delta_max_rows=settings.similarity_delta_max_rows,
+    update_interval=settings.similarity_update_interval
+)
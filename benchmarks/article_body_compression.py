@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+아티클 본문 사전 압축 벤치마크
+저장 공간(DB 크기) 증가분과 요청당 압축 CPU 비용을 비교합니다.
+
+실행: python benchmarks/article_body_compression.py
+"""
+
+import gzip
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append('.')
+
+from app.services.article_body_store import article_body_store, brotli
+
+WORDS = (
+    "트랜스포머는 어텐션 메커니즘 시퀀스 처리 신경망 구조 토큰 관련도 계산 가중합 표현 "
+    "학습 데이터 모델 입력 출력 레이어 가중치 기울기 최적화 손실 함수 정규화 임베딩 "
+    "attention layer token model gradient loss vector matrix batch"
+).split()
+
+
+def make_article(size_chars: int):
+    # 실제 글처럼 반복이 적은 본문을 만들기 위해 단어를 무작위로 배열
+    rng = random.Random(size_chars)
+    parts, length = [], 0
+    while length < size_chars:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))) + ". "
+        if rng.random() < 0.15:
+            sentence += "\n\n"
+        parts.append(sentence)
+        length += len(sentence)
+    body = "".join(parts)[:size_chars]
+    return SimpleNamespace(
+        article_id="art_bench",
+        title="벤치마크용 글",
+        body=body,
+        level_code="intermediate",
+        curriculum_item_id="item_bench",
+    )
+
+
+def timeit(fn, repeat: int) -> float:
+    """평균 실행 시간(ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    print(f"brotli: {'사용 가능' if brotli is not None else '미설치 (gzip만 측정)'}\n")
+    header = f"{'본문(자)':>8} | {'JSON':>8} | {'gzip':>8} | {'br':>8} | {'저장 증가':>8} | {'작성시 압축':>10} | {'요청당 gzip(6)':>13} | {'요청당 gzip(9)':>13}"
+    print(header)
+    print("-" * len(header))
+
+    for size in (1_000, 5_000, 20_000, 100_000):
+        article = make_article(size)
+        payload = article_body_store.encode_payload(article)
+        variants = article_body_store.build_variants(article)
+        br_size = len(variants["br_payload"]) if variants["br_payload"] is not None else 0
+        extra = len(variants["gzip_payload"]) + br_size
+
+        repeat = max(5, 2_000_000 // len(payload))
+        write_ms = timeit(lambda: article_body_store.build_variants(article), max(3, repeat // 20))
+        gzip6_ms = timeit(lambda: gzip.compress(payload, compresslevel=6), repeat)
+        gzip9_ms = timeit(lambda: gzip.compress(payload, compresslevel=9), repeat)
+
+        print(
+            f"{size:>8} | {len(payload):>8} | {len(variants['gzip_payload']):>8} | {br_size:>8} | "
+            f"{extra / len(payload) * 100:>7.1f}% | {write_ms:>8.2f}ms | {gzip6_ms:>11.3f}ms | {gzip9_ms:>11.3f}ms"
+        )
+
+    print("\n사전 압축 시 요청당 압축 CPU는 0이며, 대신 글 1건당 '저장 증가' 비율만큼 DB가 커집니다.")
+    print("작성시 압축 비용은 글 생성 시 1회만 발생합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+글 목록 미리보기 벤치마크
+긴 본문(약 20KB)을 가진 글 목록을 조회할 때 세 가지 방식의 요청당 지연시간과
+파이썬 메모리 최대 사용량(tracemalloc)을 비교합니다.
+
+- 엔티티 로드: Article 엔티티 전체(본문 포함)를 읽고 파이썬에서 body[:100]
+- SQL substr: 쿼리에서 substr(body, 1, 100)로 잘라 읽음 (본문 overflow 페이지는 여전히 읽음)
+- 저장된 preview: 작성 시 계산해 둔 preview 컬럼만 읽음 (현재 방식)
+
+실행: python benchmarks/article_list_preview.py
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append('.')
+
+_tmp_dir = tempfile.mkdtemp(prefix="infou-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import undefer
+
+from app.database.database import SessionLocal
+from app.database.init_db import init_db
+from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic
+from app.models.article import make_preview
+
+ITEMS = 200
+LEVELS = ["beginner", "intermediate", "expert"]
+BODY_CHARS = 20_000
+WORDS = ["트랜스포머", "어텐션", "임베딩", "역전파", "정규화", "토큰", "디코더", "인코더", "학습률", "손실"]
+
+
+def seed():
+    init_db()
+    db = SessionLocal()
+    rng = random.Random(42)
+    db.add_all([Level(level_code=code, name=code) for code in LEVELS])
+    db.add(MainTopic(main_topic_id=1, name="AI"))
+    db.add(SubTopic(sub_topic_id=1, main_topic_id=1, name="ML", source_type="curated"))
+    db.add(LearningPath(path_id="path", sub_topic_id=1, title="path"))
+    for i in range(ITEMS):
+        item_id = f"item_{i:04d}"
+        db.add(CurriculumItem(curriculum_item_id=item_id, sub_topic_id=1, path_id="path", title=item_id, sort_order=i))
+        for level in LEVELS:
+            body = " ".join(rng.choice(WORDS) for _ in range(BODY_CHARS // 4))[:BODY_CHARS]
+            db.add(Article(
+                article_id=f"art_{i:04d}_{level}", curriculum_item_id=item_id, sub_topic_id=1,
+                level_code=level, title=f"{item_id} {level}", body=body
+            ))
+    db.commit()
+    db.close()
+
+
+def entity_load(db, item_id):
+    articles = db.query(Article).options(undefer(Article.body)).filter(Article.curriculum_item_id == item_id).all()
+    return [(a.article_id, a.level_code, a.title, make_preview(a.body)) for a in articles]
+
+
+def sql_substr(db, item_id):
+    preview = case(
+        (func.length(Article.body) > 100, func.substr(Article.body, 1, 100) + "..."),
+        else_=Article.body
+    )
+    return db.query(Article.article_id, Article.level_code, Article.title, preview).filter(
+        Article.curriculum_item_id == item_id
+    ).all()
+
+
+def stored_preview(db, item_id):
+    return db.query(Article.article_id, Article.level_code, Article.title, Article.preview).filter(
+        Article.curriculum_item_id == item_id
+    ).all()
+
+
+def measure(fn):
+    """요청마다 새 세션으로 모든 아이템 목록을 조회한 평균 지연시간(ms)과 최대 메모리(KB)"""
+    item_ids = [f"item_{i:04d}" for i in range(ITEMS)]
+    start = time.perf_counter()
+    for item_id in item_ids:
+        db = SessionLocal()
+        fn(db, item_id)
+        db.close()
+    latency_ms = (time.perf_counter() - start) / ITEMS * 1000
+
+    peak_kb = 0.0
+    for item_id in item_ids[:20]:
+        db = SessionLocal()
+        tracemalloc.start()
+        fn(db, item_id)
+        peak_kb = max(peak_kb, tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+        db.close()
+    return latency_ms, peak_kb
+
+
+def main():
+    seed()
+    db = SessionLocal()
+    expected = sorted(tuple(row) for row in entity_load(db, "item_0000"))
+    assert sorted(tuple(row) for row in sql_substr(db, "item_0000")) == expected
+    assert sorted(tuple(row) for row in stored_preview(db, "item_0000")) == expected
+    db.close()
+
+    print(f"아이템 {ITEMS}개 x 레벨 {len(LEVELS)}개, 본문 {BODY_CHARS:,}자\n")
+    print(f"{'방식':<16} | {'요청당 지연':>10} | {'최대 메모리':>10}")
+    print("-" * 44)
+    for name, fn in [("엔티티 로드", entity_load), ("SQL substr", sql_substr), ("저장된 preview", stored_preview)]:
+        measure(fn)  # 페이지 캐시 워밍업
+        latency_ms, peak_kb = measure(fn)
+        print(f"{name:<16} | {latency_ms:>8.3f}ms | {peak_kb:>8.1f}KB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+리스트 응답 직렬화 벤치마크
+1,000행 응답에서 기존 경로(행마다 Pydantic 모델 생성 + response_model 검증/직렬화)와
+RowEncoder 고속 경로의 요청당 CPU 시간을 비교합니다.
+
+실행: python benchmarks/list_serialization.py
+"""
+
+import json
+import sys
+import time
+from typing import List
+
+sys.path.append('.')
+
+from pydantic import TypeAdapter
+
+from app.api.articles import ArticleListResponse, article_list_encoder
+from app.api.curriculum_items import CurriculumItemResponse, curriculum_item_encoder
+
+ROWS = 1_000
+REPEAT = 200
+
+
+def legacy_path(model, rows):
+    """기존 방식: 행마다 모델 생성 → response_model 검증 → JSON 직렬화"""
+    fields = tuple(model.model_fields)
+    items = [model(**dict(zip(fields, row))) for row in rows]
+    adapter = TypeAdapter(List[model])
+    content = adapter.dump_python(adapter.validate_python(items, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def cpu_ms(fn) -> float:
+    start = time.process_time()
+    for _ in range(REPEAT):
+        fn()
+    return (time.process_time() - start) / REPEAT * 1000
+
+
+def run(name, model, encoder, rows):
+    assert legacy_path(model, rows) == encoder.encode_list(rows)
+    legacy = cpu_ms(lambda: legacy_path(model, rows))
+    fast = cpu_ms(lambda: encoder.encode_list(rows))
+    print(f"{name:<24} | {legacy:>10.3f}ms | {fast:>10.3f}ms | {legacy / fast:>6.1f}x")
+
+
+def main():
+    article_rows = [
+        (f"art_{i:08x}", "intermediate", f"트랜스포머 구조 이해 {i}", "어텐션 메커니즘으로 시퀀스를 처리하는 신경망 구조를 설명합니다. " * 2)
+        for i in range(ROWS)
+    ]
+    curriculum_rows = [
+        (f"item_{i:08x}", f"딥러닝 - {i + 1}단계", i + 1, i % 3 != 0)
+        for i in range(ROWS)
+    ]
+
+    print(f"{ROWS}행 응답, 요청당 CPU 시간 (평균 {REPEAT}회)\n")
+    print(f"{'응답 모델':<24} | {'기존 경로':>12} | {'고속 경로':>12} | {'배율':>7}")
+    print("-" * 66)
+    run("ArticleListResponse", ArticleListResponse, article_list_encoder, article_rows)
+    run("CurriculumItemResponse", CurriculumItemResponse, curriculum_item_encoder, curriculum_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+읽기 모델 벤치마크
+같은 응답을 만들 때 ORM 엔티티를 로드해 속성을 복사하는 방식과
+app.services.read_models의 컬럼 조회 + NamedTuple 행 방식의
+요청당 지연시간과 파이썬 메모리 할당량(tracemalloc 최대치)을 비교합니다.
+
+실행: python benchmarks/read_models.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append('.')
+
+_tmp_dir = tempfile.mkdtemp(prefix="infou-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from app.database.database import SessionLocal
+from app.database.init_db import init_db
+from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic
+from app.services import read_models
+
+ITEMS = 500
+LEVELS = ["beginner", "intermediate", "expert"]
+REPEAT = 50
+
+
+def seed():
+    init_db()
+    db = SessionLocal()
+    db.add_all([Level(level_code=code, name=code, description=f"{code} 설명") for code in LEVELS])
+    for i in range(1, 51):
+        db.add(MainTopic(main_topic_id=i, name=f"대주제 {i}", description="설명"))
+        db.add(SubTopic(sub_topic_id=i, main_topic_id=i, name=f"소주제 {i}", source_type="curated"))
+    db.add(LearningPath(path_id="path", sub_topic_id=1, title="경로", description="설명"))
+    for i in range(ITEMS):
+        item_id = f"item_{i:04d}"
+        db.add(CurriculumItem(curriculum_item_id=item_id, sub_topic_id=1, path_id="path", title=f"단계 {i}", sort_order=i))
+        for level in LEVELS:
+            db.add(Article(
+                article_id=f"art_{i:04d}_{level}", curriculum_item_id=item_id, sub_topic_id=1,
+                level_code=level, title=f"{item_id} {level}", body="본문 " * 300
+            ))
+    db.commit()
+    db.close()
+
+
+# 기존 방식: 엔티티 로드 후 속성 복사
+def orm_main_topics(db):
+    return [(t.main_topic_id, t.name, t.description or "") for t in db.query(MainTopic).all()]
+
+
+def orm_path_items(db):
+    items = db.query(CurriculumItem).filter(CurriculumItem.path_id == "path").order_by(CurriculumItem.sort_order).all()
+    return [(item.curriculum_item_id, item.title, item.sort_order) for item in items]
+
+
+def orm_next_article(db, article_id="art_0250_beginner"):
+    current = db.query(Article).filter(Article.article_id == article_id).first()
+    item = db.query(CurriculumItem).filter(CurriculumItem.curriculum_item_id == current.curriculum_item_id).first()
+    next_item = db.query(CurriculumItem).filter(
+        CurriculumItem.path_id == item.path_id, CurriculumItem.sort_order > item.sort_order
+    ).order_by(CurriculumItem.sort_order).first()
+    article = db.query(Article).filter(
+        Article.curriculum_item_id == next_item.curriculum_item_id, Article.level_code == current.level_code
+    ).first()
+    return (article.article_id, article.title, article.curriculum_item_id, article.level_code)
+
+
+# 읽기 모델
+def rm_main_topics(db):
+    return read_models.main_topics(db)
+
+
+def rm_path_items(db):
+    return read_models.path_items(db, "path")
+
+
+def rm_next_article(db, article_id="art_0250_beginner"):
+    position = read_models.article_position(db, article_id)
+    return read_models.adjacent_article(db, position, position.level_code)
+
+
+def as_tuples(result):
+    if isinstance(result, list):
+        return [tuple(row) for row in result]
+    return tuple(result)
+
+
+def measure(fn):
+    for _ in range(5):
+        db = SessionLocal()
+        fn(db)
+        db.close()
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        db = SessionLocal()
+        fn(db)
+        db.close()
+    latency_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+    db = SessionLocal()
+    tracemalloc.start()
+    fn(db)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    db.close()
+    return latency_ms, peak_kb
+
+
+def main():
+    seed()
+    cases = [
+        ("대주제 목록 (50행)", orm_main_topics, rm_main_topics),
+        (f"경로 아이템 ({ITEMS}행)", orm_path_items, rm_path_items),
+        ("다음 글 탐색", orm_next_article, rm_next_article),
+    ]
+
+    print(f"요청당 지연시간 (평균 {REPEAT}회) / 최대 메모리\n")
+    print(f"{'조회':<20} | {'ORM 엔티티':>20} | {'읽기 모델':>20}")
+    print("-" * 68)
+    for name, orm_fn, rm_fn in cases:
+        db = SessionLocal()
+        assert as_tuples(orm_fn(db)) == as_tuples(rm_fn(db))
+        db.close()
+
+        orm_ms, orm_kb = measure(orm_fn)
+        rm_ms, rm_kb = measure(rm_fn)
+        print(f"{name:<20} | {orm_ms:>8.3f}ms {orm_kb:>8.1f}KB | {rm_ms:>8.3f}ms {rm_kb:>8.1f}KB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
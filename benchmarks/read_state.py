@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+읽음 상태 비트맵 벤치마크
+긴 학습 경로(아이템 1,000개)에서 사용자가 절반을 읽었을 때, 경로 화면의
+아이템별 읽음 여부 + 진행률을 계산하는 세 가지 방식의 요청당 지연시간과
+파이썬 메모리 최대 사용량(tracemalloc)을 비교합니다.
+
+- 글별 조회: 아이템마다 user_article_reads를 PK로 조회
+- 조인 1회: LEFT JOIN user_article_reads로 한 번에 조회
+- 비트맵: 경로 아이템 조회 + 캐시된 읽음 비트맵의 비트 연산 (현재 방식)
+
+실행: python benchmarks/read_state.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append('.')
+
+_tmp_dir = tempfile.mkdtemp(prefix="infou-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from app.database.database import SessionLocal
+from app.database.init_db import init_db
+from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic, User, UserArticleRead
+from app.services import read_models
+from app.services.progress_tracker import progress_tracker
+from app.services.read_state import encode_bits, positions_mask, read_state_cache
+
+ITEMS = 1000
+LEVEL = "beginner"
+USER_ID = "bench_user"
+PATH_ID = "path"
+REPEAT = 30
+
+
+def seed():
+    init_db()
+    db = SessionLocal()
+    db.add(Level(level_code=LEVEL, name=LEVEL))
+    db.add(User(user_id=USER_ID, nickname="bench"))
+    db.add(MainTopic(main_topic_id=1, name="AI"))
+    db.add(SubTopic(sub_topic_id=1, main_topic_id=1, name="ML", source_type="curated"))
+    db.add(LearningPath(path_id=PATH_ID, sub_topic_id=1, title="경로"))
+    for i in range(1, ITEMS + 1):
+        item_id = f"item_{i:04d}"
+        db.add(CurriculumItem(curriculum_item_id=item_id, sub_topic_id=1, path_id=PATH_ID, title=f"단계 {i}", sort_order=i))
+        db.add(Article(
+            article_id=f"art_{i:04d}", curriculum_item_id=item_id, sub_topic_id=1,
+            level_code=LEVEL, title=f"글 {i}", body="본문"
+        ))
+    db.commit()
+    for i in range(1, ITEMS + 1, 2):
+        progress_tracker.record_read(db, USER_ID, f"art_{i:04d}")
+    db.commit()
+    db.close()
+
+
+def per_article(db):
+    rows = read_models.path_level_articles(db, PATH_ID, LEVEL)
+    flags = [
+        db.query(UserArticleRead.article_id).filter(
+            UserArticleRead.user_id == USER_ID, UserArticleRead.article_id == row.article_id
+        ).first() is not None
+        for row in rows
+    ]
+    return flags, sum(flags)
+
+
+def single_join(db):
+    rows = db.query(CurriculumItem.sort_order, UserArticleRead.article_id).join(
+        Article, (Article.curriculum_item_id == CurriculumItem.curriculum_item_id) & (Article.level_code == LEVEL)
+    ).outerjoin(
+        UserArticleRead, (UserArticleRead.user_id == USER_ID) & (UserArticleRead.article_id == Article.article_id)
+    ).filter(CurriculumItem.path_id == PATH_ID).order_by(CurriculumItem.sort_order).all()
+    flags = [read_id is not None for _, read_id in rows]
+    return flags, sum(flags)
+
+
+def bitmap(db):
+    rows = read_models.path_level_articles(db, PATH_ID, LEVEL)
+    read = read_state_cache.get(db, USER_ID, PATH_ID, LEVEL) & positions_mask(r.sort_order for r in rows if r.article_id)
+    flags = [(read >> row.sort_order) & 1 == 1 for row in rows]
+    return flags, read.bit_count()
+
+
+def measure(fn):
+    for _ in range(3):
+        db = SessionLocal()
+        fn(db)
+        db.close()
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        db = SessionLocal()
+        fn(db)
+        db.close()
+    latency_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+    db = SessionLocal()
+    tracemalloc.start()
+    fn(db)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    db.close()
+    return latency_ms, peak_kb
+
+
+def main():
+    seed()
+    db = SessionLocal()
+    expected = per_article(db)
+    assert single_join(db) == expected
+    assert bitmap(db) == expected
+    blob_bytes = len(encode_bits(read_state_cache.get(db, USER_ID, PATH_ID, LEVEL)))
+    db.close()
+
+    print(f"아이템 {ITEMS}개 중 {expected[1]}개 읽음, 비트맵 BLOB {blob_bytes}바이트\n")
+    print(f"{'방식':<12} | {'요청당 지연':>10} | {'최대 메모리':>10}")
+    print("-" * 40)
+    for name, fn in [("글별 조회", per_article), ("조인 1회", single_join), ("비트맵", bitmap)]:
+        latency_ms, peak_kb = measure(fn)
+        print(f"{name:<12} | {latency_ms:>8.3f}ms | {peak_kb:>8.1f}KB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
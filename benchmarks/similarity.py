@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+유사도 인덱스 벤치마크
+합성 글 100,000개(제목 + 본문 약 300자)로 문자 n-gram TF-IDF 인덱스를 만든 뒤,
+관련 글 조회(mmap 행렬 × 질의 벡터 1회 + argpartition top-k)의 지연시간 분포와
+인덱스 파일 크기를 측정합니다. 백그라운드 증분 반영(delta 세그먼트에 한 행 쓰기) 비용도 함께 측정합니다.
+
+실행: python benchmarks/similarity.py
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append('.')
+
+_tmp_dir = tempfile.mkdtemp(prefix="infou-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+os.environ["DEBUG"] = "false"
+os.environ["SIMILARITY_INDEX_DIR"] = f"{_tmp_dir}/similarity"
+
+from app.services.similarity_index import similarity_index
+
+ARTICLES = 100_000
+QUERIES = 500
+LIMIT = 10
+WORDS = [
+    "딥러닝", "신경망", "역전파", "경사하강법", "합성곱", "트랜스포머", "어텐션", "임베딩", "강화학습", "정책",
+    "경제", "인플레이션", "금리", "환율", "무역", "조선", "고려", "삼국", "왕조", "개혁",
+    "데이터베이스", "인덱스", "트랜잭션", "정규화", "쿼리", "세포", "유전자", "단백질", "진화", "생태계",
+]
+
+
+def synthetic_texts():
+    rng = random.Random(42)
+    for i in range(ARTICLES):
+        topic = rng.sample(WORDS, 3)
+        body = " ".join(rng.choice(topic + WORDS) for _ in range(60))
+        yield f"art_{i:06d}", f"{topic[0]}와 {topic[1]} - {i % 3 + 1}단계 {body}"
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    start = time.perf_counter()
+    similarity_index.build("article", synthetic_texts)
+    build_seconds = time.perf_counter() - start
+    index_bytes = sum(
+        os.path.getsize(os.path.join(similarity_index.directory, name))
+        for name in os.listdir(similarity_index.directory)
+    )
+    print(f"글 {ARTICLES:,}개 인덱스 생성 {build_seconds:.1f}초, 파일 {index_bytes / 1024 / 1024:.1f}MB\n")
+
+    rng = random.Random(7)
+    similarity_index.similar(None, "article", "art_000000", LIMIT)  # mmap 로드
+    latencies = []
+    for _ in range(QUERIES):
+        article_id = f"art_{rng.randrange(ARTICLES):06d}"
+        start = time.perf_counter()
+        entries = similarity_index.similar(None, "article", article_id, LIMIT)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert len(entries) == LIMIT
+
+    adds = []
+    after_adds = []
+    for i in range(20):
+        start = time.perf_counter()
+        similarity_index.add_rows("article", [(f"new_{i}", "딥러닝과 신경망 - 새 글 " + " ".join(rng.sample(WORDS, 10)))])
+        adds.append((time.perf_counter() - start) * 1000)
+        # 반영 직후 첫 조회 (새 세대를 다시 여는 비용 포함)
+        start = time.perf_counter()
+        similarity_index.similar(None, "article", f"art_{rng.randrange(ARTICLES):06d}", LIMIT)
+        after_adds.append((time.perf_counter() - start) * 1000)
+
+    print(f"{'작업':<16} | {'p50':>9} | {'p99':>9}")
+    print("-" * 42)
+    print(f"{'관련 글 top-10':<16} | {percentile(latencies, 0.5):>7.2f}ms | {percentile(latencies, 0.99):>7.2f}ms")
+    print(f"{'증분 반영':<16} | {percentile(adds, 0.5):>7.2f}ms | {percentile(adds, 0.99):>7.2f}ms")
+    print(f"{'반영 후 첫 조회':<16} | {percentile(after_adds, 0.5):>7.2f}ms | {percentile(after_adds, 0.99):>7.2f}ms")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
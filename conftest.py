@@ -0,0 +1,80 @@
+"""
+pytest 공통 설정
+테스트 모듈이 앱을 불러오기 전에 임시 DB와 인덱스 디렉터리를 지정해 작업 트리의 ./data를 쓰지 않게 합니다.
+테스트 파일을 직접 실행할 때도 `from conftest import ...`로 같은 설정과 시드 도우미를 씁니다.
+"""
+
+import os
+import tempfile
+from typing import List, NamedTuple
+
+_tmp_dir = tempfile.mkdtemp(prefix="infou-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_dir}/test.db")
+os.environ.setdefault("SIMILARITY_INDEX_DIR", f"{_tmp_dir}/similarity")
+os.environ.setdefault("READ_EVENT_LOG_DIR", f"{_tmp_dir}/read_events")
+os.environ.setdefault("API_RATE_LIMIT", "0")
+os.environ.setdefault("GENERATION_RATE_LIMIT", "0")
+
+TEST_USER_ID = "dummy_user_id"  # 더미 토큰 파싱이 돌려주는 사용자
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+LEVELS = ["beginner", "intermediate", "expert"]
+
+
+class SeededPath(NamedTuple):
+    main_topic_id: int
+    sub_topic_id: int
+    path_id: str
+    item_ids: List[str]
+    article_ids: List[List[str]]  # 아이템별 [레벨 순서대로 글 id]
+
+
+def seed_learning_path(prefix: str, item_count: int = 3, levels: List[str] = LEVELS) -> SeededPath:
+    """대주제/소주제/학습 경로 하나와 아이템별 레벨 글을 만듭니다 (id는 prefix로 구분).
+
+    글 작성 API와 같이 본문 압축 변형본과 소주제/경로 글 수도 함께 반영합니다.
+    """
+    from app.database.database import SessionLocal
+    from app.database.init_db import init_db
+    from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic, User
+    from app.services.article_body_store import article_body_store
+    from app.services.progress_tracker import progress_tracker
+
+    init_db()
+    db = SessionLocal()
+    try:
+        for code in LEVELS:
+            db.merge(Level(level_code=code, name=code))
+        db.merge(User(user_id=TEST_USER_ID, nickname="tester"))
+        main_topic = MainTopic(name=f"{prefix} 대주제")
+        db.add(main_topic)
+        db.flush()
+        sub_topic = SubTopic(main_topic_id=main_topic.main_topic_id, name=f"{prefix} 소주제", source_type="curated")
+        db.add(sub_topic)
+        db.flush()
+        path_id = f"{prefix}_path"
+        db.add(LearningPath(path_id=path_id, sub_topic_id=sub_topic.sub_topic_id, title=f"{prefix} 경로"))
+        item_ids, article_ids = [], []
+        for i in range(item_count):
+            item_id = f"{prefix}_item_{i}"
+            db.add(CurriculumItem(
+                curriculum_item_id=item_id, sub_topic_id=sub_topic.sub_topic_id, path_id=path_id,
+                title=f"{prefix} 주제 {i + 1}", sort_order=i + 1
+            ))
+            db.flush()
+            item_ids.append(item_id)
+            article_ids.append([])
+            for code in levels:
+                article = Article(
+                    article_id=f"{prefix}_art_{i}_{code}", curriculum_item_id=item_id,
+                    sub_topic_id=sub_topic.sub_topic_id, level_code=code,
+                    title=f"{prefix} 주제 {i + 1} ({code})", body=f"{prefix} 주제 {i + 1}의 {code} 본문"
+                )
+                db.add(article)
+                db.flush()
+                article_body_store.save(db, article)
+                progress_tracker.record_article_added(db, article)
+                article_ids[-1].append(article.article_id)
+        db.commit()
+        return SeededPath(main_topic.main_topic_id, sub_topic.sub_topic_id, path_id, item_ids, article_ids)
+    finally:
+        db.close()
@@ -1,17 +1,70 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.database.database import SessionLocal
+from app.services.catalog_cache import catalog_cache
+from app.services.health_prober import health_prober
+from app.services.db_maintenance import db_maintenance
+from app.services.read_event_log import read_event_log
+from app.services.similarity_index import similarity_index
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
 
 # API 라우터들
-from app.api import health, debug, web, topics, learning_paths, articles, reading, curriculum_items, levels
+from app.api import health, debug, web, topics, learning_paths, articles, reading, curriculum_items, levels, trending, search
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 처리"""
+    # 카탈로그 캐시 적재 (실패해도 첫 요청 시 다시 읽어옴)
+    db = SessionLocal()
+    try:
+        catalog_cache.warm(db)
+    except Exception as e:
+        logger.warning(f"카탈로그 캐시 적재 실패: {str(e)}")
+    finally:
+        db.close()
+    
+    # readiness 상태를 주기적으로 갱신하는 백그라운드 프로버
+    health_prober.start()
+    # ANALYZE / PRAGMA optimize / WAL 체크포인트
+    db_maintenance.start()
+    # 읽음 이벤트 로그 fsync / 압축 (설정으로 활성화한 경우)
+    read_event_log.start()
+    # 유사도 인덱스 생성(없을 때) / 새 글·소주제 반영
+    similarity_index.start()
+    
+    yield
+    
+    await similarity_index.stop()
+    await read_event_log.stop()
+    await db_maintenance.stop()
+    await health_prober.stop()
+
 
 app = FastAPI(
     title=settings.app_name,
     description="LLM 기반 개인화 소주제 생성 및 5단계 난이도별 동적 커리큘럼/아티클 생성을 지원하는 고성능 학습 API 서버",
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
+# 요청별 SQL 수/DB 시간 집계 미들웨어 (라우팅 바로 바깥)
+if settings.query_stats_enabled:
+    app.add_middleware(QueryStatsMiddleware)
+
+# 요청 수 제한 미들웨어 (429 응답에도 CORS 헤더가 붙도록 CORS보다 안쪽에 등록)
+app.add_middleware(RateLimitMiddleware, trust_forwarded=settings.rate_limit_trust_forwarded)
+
 # CORS 미들웨어 설정
 cors_origins = settings.cors_origins.split(",") if settings.cors_origins else ["*"]
 app.add_middleware(
@@ -20,8 +73,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],  # 브라우저에서 다음 페이지 커서를 읽을 수 있도록
 )
 
+# 요청 지연시간 측정 미들웨어 (가장 바깥에서 전체 처리 시간을 측정)
+app.add_middleware(MetricsMiddleware)
+
 # API 라우터 등록
 app.include_router(web.router)  # 웹 인터페이스를 먼저 등록
 app.include_router(health.router)
@@ -34,6 +91,8 @@ app.include_router(curriculum_items.router)
 app.include_router(articles.router)
 app.include_router(reading.router)
 app.include_router(levels.router)
+app.include_router(trending.router)
+app.include_router(search.router)
 
 # 루트 경로는 web.router에서 처리
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+글 상세 응답 캐시 테스트
+바이트 예산, TinyLFU 승인/거절/축출과 인코딩별 무효화 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from app.services.article_cache import ArticleResponseCache
+
+
+def payload(size: int, fill: bytes = b"x") -> bytes:
+    return fill * size
+
+
+def test_admit_within_budget():
+    """공간이 충분하면 바로 승인"""
+    print("🧪 Testing admission within budget...")
+    cache = ArticleResponseCache(max_bytes=100, sketch_width=1024)
+
+    assert cache.put("art_a", None, payload(40))
+    assert cache.put("art_a", "gzip", payload(20))
+    assert cache.current_bytes == 60
+    assert cache.get("art_a", "identity") == payload(40)
+    assert cache.stats()["admissions"] == 2
+
+    # 같은 키를 다시 저장하면 이전 크기를 빼고 새 크기를 더함
+    assert cache.put("art_a", "gzip", payload(30))
+    assert cache.current_bytes == 70
+    assert cache.get("art_a", "gzip") == payload(30)
+
+    # 예산보다 큰 항목은 저장하지 않음
+    assert not cache.put("art_big", None, payload(101))
+    assert cache.current_bytes == 70
+    print("   ✅ put/get - bytes accounted")
+
+
+def test_rejected_refresh_keeps_previous_entry():
+    """승인이 거절된 갱신은 기존 항목을 지우지 않음"""
+    print("🧪 Testing rejected refresh...")
+    cache = ArticleResponseCache(max_bytes=100, sketch_width=1024)
+    assert cache.put("art_hot", None, payload(50, b"h"))
+    for _ in range(5):
+        cache.get("art_hot", None)
+    assert cache.put("art_x", None, payload(40, b"o"))
+    cache.get("art_x", None)
+
+    # 60바이트로 커진 갱신은 더 인기 있는 art_hot을 밀어내야 하므로 거절
+    assert not cache.put("art_x", None, payload(60, b"n"))
+    assert cache.current_bytes == 90
+    assert cache.get("art_x", None) == payload(40, b"o")
+    assert cache.get("art_hot", None) == payload(50, b"h")
+    assert cache.stats()["rejections"] == 1
+    assert cache.stats()["evictions"] == 0
+    print("   ✅ rejected put - previous payload and bytes kept")
+
+
+def test_evicts_less_frequent_entries():
+    """새 항목이 더 자주 요청되면 덜 인기 있는 LRU 항목을 축출"""
+    print("🧪 Testing eviction...")
+    cache = ArticleResponseCache(max_bytes=100, sketch_width=1024)
+    assert cache.put("art_cold1", None, payload(30))
+    assert cache.put("art_cold2", None, payload(30))
+    assert cache.put("art_cold3", None, payload(30))
+    for _ in range(3):
+        cache.get("art_new", None)
+
+    assert cache.put("art_new", None, payload(50))
+    assert cache.current_bytes == 80
+    assert cache.get("art_cold1", None) is None
+    assert cache.get("art_cold2", None) is None
+    assert cache.get("art_cold3", None) == payload(30)
+    assert cache.stats()["evictions"] == 2
+    assert cache.current_bytes == sum(len(value) for value in cache._entries.values())
+    print("   ✅ put - 2 LRU entries evicted, bytes accounted")
+
+
+def test_same_article_encodings_do_not_block_admission():
+    """같은 글의 다른 인코딩은 희생 후보로 비교하지 않음"""
+    print("🧪 Testing admission next to other encodings of the same article...")
+    cache = ArticleResponseCache(max_bytes=100, sketch_width=1024)
+    assert cache.put("art_a", "identity", payload(35))
+    assert cache.put("art_c", "identity", payload(30))
+    assert cache.put("art_a", "gzip", payload(35))
+    for _ in range(3):
+        cache.get("art_a", "br")
+
+    # LRU 맨 앞의 (art_a, identity)는 건너뛰고 art_c를 축출
+    assert cache.put("art_a", "br", payload(30))
+    assert cache.get("art_c", None) is None
+    assert cache.get("art_a", "identity") == payload(35)
+    assert cache.current_bytes == 100
+    assert cache.stats()["evictions"] == 1
+
+    # 같은 글 항목만 남아 공간을 만들 수 없으면 거절
+    assert not cache.put("art_a", "identity", payload(60))
+    assert cache.get("art_a", "identity") == payload(35)
+    assert cache.current_bytes == 100
+    print("   ✅ put - other encodings skipped as victims")
+
+
+def test_invalidate_all_encodings():
+    """무효화는 세 인코딩 항목을 모두 제거"""
+    print("🧪 Testing invalidate...")
+    cache = ArticleResponseCache(max_bytes=1000, sketch_width=1024)
+    for encoding, size in (("identity", 100), ("gzip", 40), ("br", 30)):
+        assert cache.put("art_a", encoding, payload(size))
+    assert cache.put("art_b", "gzip", payload(50))
+    assert cache.current_bytes == 220
+
+    cache.invalidate("art_a")
+    for encoding in ("identity", "gzip", "br"):
+        assert cache.get("art_a", encoding) is None
+    assert cache.get("art_b", "gzip") == payload(50)
+    assert cache.current_bytes == 50
+    assert cache.stats()["entries"] == 1
+    print("   ✅ invalidate - identity/gzip/br removed")
+
+
+def main():
+    """전체 캐시 테스트 실행"""
+    print("🚀 Starting article cache tests...\n")
+
+    try:
+        test_admit_within_budget()
+        print()
+        test_rejected_refresh_keeps_previous_entry()
+        print()
+        test_evicts_less_frequent_entries()
+        print()
+        test_same_article_encodings_do_not_block_admission()
+        print()
+        test_invalidate_all_encodings()
+
+        print("\n🎉 All article cache tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
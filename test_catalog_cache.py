@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+카탈로그 캐시 테스트
+레벨/대주제/소주제 목록은 캐시에서 응답하고, 디버그 데이터 생성과 소주제 생성 API가 캐시를 무효화하는지 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models import MainTopic
+from app.services.catalog_cache import catalog_cache
+
+client = TestClient(app)
+
+seeded = seed_learning_path("catalog", item_count=1)
+
+
+def debug_post(path: str, body: dict) -> dict:
+    previous = settings.debug
+    settings.debug = True
+    try:
+        response = client.post(f"/debug/data/{path}", json=body)
+    finally:
+        settings.debug = previous
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def main_topic_names():
+    return [topic["name"] for topic in client.get("/api/main-topics").json()]
+
+
+def sub_topic_names(main_topic_id: int):
+    return [topic["name"] for topic in client.get(f"/api/main-topics/{main_topic_id}/sub-topics").json()]
+
+
+def test_served_from_cache():
+    """무효화 훅을 거치지 않은 쓰기는 캐시가 살아 있는 동안 보이지 않음"""
+    print("🧪 Testing catalog cache hits...")
+    catalog_cache.invalidate()
+    assert "catalog 대주제" in main_topic_names()
+    hits = catalog_cache.hits
+    main_topic_names()
+    assert catalog_cache.hits == hits + 1
+
+    db = SessionLocal()
+    try:
+        db.add(MainTopic(name="catalog 캐시 우회"))
+        db.commit()
+    finally:
+        db.close()
+    assert "catalog 캐시 우회" not in main_topic_names()
+    print("   ✅ GET /api/main-topics - served from cache")
+
+    catalog_cache.invalidate()
+    assert "catalog 캐시 우회" in main_topic_names()
+    print("   ✅ invalidate() - reloaded")
+
+
+def test_debug_writes_invalidate():
+    """디버그 레벨/대주제/소주제 생성 후 목록에 바로 반영"""
+    print("🧪 Testing invalidation on debug writes...")
+    client.get("/api/levels")
+    debug_post("levels", {"level_code": "catalog_level", "name": "catalog 레벨"})
+    assert "catalog_level" in [level["level_code"] for level in client.get("/api/levels").json()]
+    print("   ✅ POST /debug/data/levels - /api/levels updated")
+
+    main_topic_names()
+    main_topic = debug_post("main-topics", {"name": "catalog 새 대주제"})
+    assert "catalog 새 대주제" in main_topic_names()
+    print("   ✅ POST /debug/data/main-topics - /api/main-topics updated")
+
+    sub_topic_names(seeded.main_topic_id)
+    debug_post("sub-topics", {"main_topic_id": seeded.main_topic_id, "name": "catalog 새 소주제"})
+    assert "catalog 새 소주제" in sub_topic_names(seeded.main_topic_id)
+    print("   ✅ POST /debug/data/sub-topics - sub-topic list updated")
+
+    # 캐시에 없던(404) 대주제도 생성 뒤에는 목록이 보임
+    assert sub_topic_names(main_topic["main_topic_id"]) == []
+
+
+def test_generate_sub_topic_invalidates():
+    """소주제 생성 API도 같은 무효화 훅을 호출"""
+    print("🧪 Testing invalidation on sub-topic generation...")
+    before = sub_topic_names(seeded.main_topic_id)
+    response = client.post(f"/api/main-topics/{seeded.main_topic_id}/sub-topics/generate", json={"topic_hint": "catalog"})
+    assert response.status_code == 200
+    after = sub_topic_names(seeded.main_topic_id)
+    assert after == before + [response.json()["name"]]
+    print(f"   ✅ POST /api/main-topics/{seeded.main_topic_id}/sub-topics/generate - list updated")
+
+
+def main():
+    """전체 카탈로그 캐시 테스트 실행"""
+    print("🚀 Starting catalog cache tests...\n")
+
+    try:
+        test_served_from_cache()
+        print()
+        test_debug_writes_invalidate()
+        print()
+        test_generate_sub_topic_invalidates()
+
+        print("\n🎉 All catalog cache tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+요청 범위 DB 세션 테스트
+release 이후 재사용 금지와 엔드포인트별 커넥션 체크아웃 한 번 이하 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from main import app
+from app.database.database import LazySession, SessionLocal, engine
+from app.models import Article
+from app.services.article_cache import article_cache
+from app.services.catalog_cache import catalog_cache
+
+client = TestClient(app)
+
+# expert 글은 비워 두고 생성/변형본 없는 글에 사용
+seeded = seed_learning_path("sessions", item_count=3, levels=["beginner", "intermediate"])
+
+checkouts = []
+
+
+def seed_legacy_article(item_id: str) -> str:
+    """미리 압축한 본문 변형본이 없는 글 (비로그인 조회가 일반 조회 경로로 넘어감)"""
+    db = SessionLocal()
+    try:
+        db.add(Article(
+            article_id="sessions_legacy", curriculum_item_id=item_id, sub_topic_id=seeded.sub_topic_id,
+            level_code="expert", title="sessions 변형본 없는 글", body="본문"
+        ))
+        db.commit()
+        return "sessions_legacy"
+    finally:
+        db.close()
+
+
+@event.listens_for(engine, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    checkouts.append(connection_record)
+
+
+def test_release_is_final():
+    """release 이후 다시 사용하면 RuntimeError"""
+    print("🧪 Testing LazySession release...")
+    db = LazySession()
+    assert not db.active
+    assert db.execute(text("SELECT 1")).scalar() == 1
+    assert db.active
+    db.release()
+    assert not db.active
+    try:
+        db.execute(text("SELECT 1"))
+        assert False, "use after release should raise"
+    except RuntimeError:
+        pass
+    db.release()  # 의존성 정리에서 한 번 더 호출해도 됨
+    print("   ✅ use after release() - RuntimeError")
+
+
+def test_one_checkout_per_request():
+    """읽기/쓰기 엔드포인트가 요청당 커넥션을 한 번 이하로 체크아웃"""
+    print("🧪 Testing connection checkouts per request...")
+    item_id = seeded.item_ids[1]
+    article_id = seeded.article_ids[1][0]
+    legacy_article_id = seed_legacy_article(seeded.item_ids[2])
+    user = f"/api/users/{TEST_USER_ID}"
+    requests = [
+        ("GET", "/api/main-topics", {}, None),
+        ("GET", "/api/main-topics", {"limit": 1}, None),
+        ("GET", f"/api/main-topics/{seeded.main_topic_id}/sub-topics", {}, None),
+        ("GET", f"/api/main-topics/{seeded.main_topic_id}/sub-topics", {"limit": 1}, None),
+        ("GET", f"/api/sub-topics/{seeded.sub_topic_id}/similar", {}, None),
+        ("GET", f"/api/sub-topics/{seeded.sub_topic_id}/learning-paths", {}, None),
+        ("GET", f"/api/learning-paths/{seeded.path_id}", {}, None),
+        ("GET", f"/api/learning-paths/{seeded.path_id}/curriculum-items", {}, None),
+        ("GET", f"/api/learning-paths/{seeded.path_id}/curriculum-items", {"limit": 1}, None),
+        ("GET", f"/api/curriculum-items/{item_id}/articles", {}, None),
+        ("GET", f"/api/curriculum-items/{item_id}/articles", {"limit": 1}, None),
+        ("GET", f"/api/articles/{article_id}", {}, None),
+        ("GET", f"/api/articles/{article_id}", {}, AUTH_HEADERS),
+        ("GET", "/api/articles/missing_article", {}, None),
+        ("GET", f"/api/articles/{legacy_article_id}", {}, None),
+        ("GET", f"/api/articles/{article_id}/next", {}, None),
+        ("GET", f"/api/articles/{article_id}/previous", {}, None),
+        ("GET", f"/api/articles/{article_id}/related", {}, None),
+        ("POST", f"/api/articles/{article_id}/read", {}, AUTH_HEADERS),
+        ("POST", f"/api/curriculum-items/{item_id}/articles/generate", {}, None),
+        ("POST", f"/api/main-topics/{seeded.main_topic_id}/sub-topics/generate", {}, None),
+        ("POST", f"/api/sub-topics/{seeded.sub_topic_id}/learning-paths/generate", {}, None),
+        ("GET", f"{user}/progress", {}, AUTH_HEADERS),
+        ("GET", f"{user}/progress", {"sub_topic_id": seeded.sub_topic_id}, AUTH_HEADERS),
+        ("GET", f"{user}/resume", {"path_id": seeded.path_id, "level": "beginner"}, AUTH_HEADERS),
+        ("GET", f"{user}/learning-paths/{seeded.path_id}/read-state", {"level": "beginner"}, AUTH_HEADERS),
+        ("GET", f"{user}/unread", {"path_id": seeded.path_id}, AUTH_HEADERS),
+        ("GET", f"{user}/history", {}, AUTH_HEADERS),
+        ("GET", "/api/levels", {}, None),
+        ("GET", "/api/trending", {}, None),
+        ("GET", "/api/search", {"q": "sessions"}, None),
+    ]
+    generate_bodies = {
+        "articles": {"level": "expert", "content_style": "x", "word_count": 100},
+        "sub-topics": {"topic_hint": "sessions"},
+        "learning-paths": {"learning_objective": "sessions", "difficulty": "beginner", "item_count": 2},
+    }
+    for method, url, params, headers in requests:
+        # 캐시 히트로 DB를 건너뛰지 않도록 매번 비움
+        article_cache.clear()
+        catalog_cache.invalidate()
+        checkouts.clear()
+        body = generate_bodies[url.split("/")[-2]] if url.endswith("/generate") else None
+        response = client.request(method, url, params=params, headers=headers, json=body)
+        assert response.status_code < 500, (url, response.status_code, response.text)
+        assert len(checkouts) <= 1, (url, len(checkouts))
+        print(f"   ✅ {method} {url} {params or ''} - {response.status_code}, {len(checkouts)} checkout")
+
+
+def main():
+    """전체 DB 세션 테스트 실행"""
+    print("🚀 Starting DB session tests...\n")
+
+    try:
+        test_release_is_final()
+        print()
+        test_one_checkout_per_request()
+
+        print("\n🎉 All DB session tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+지연시간 히스토그램 테스트
+HDR 버킷 경계, 백분위 상대 오차, 병합, Prometheus 출력 확인
+"""
+
+import random
+import sys
+sys.path.append('.')
+
+from app.services.metrics import LatencyHistogram, MetricsRegistry
+
+MAX_RELATIVE_ERROR = 1 / LatencyHistogram.SUB_BUCKETS  # 하위 구간 16개 → 6.25%
+
+
+def exact_percentile(values, p: float) -> int:
+    ordered = sorted(values)
+    return ordered[max(1, int(len(ordered) * p / 100.0 + 0.5)) - 1]
+
+
+def test_bucket_bounds():
+    """값은 자기 버킷 상한 이하, 이전 버킷 상한 초과이고 버킷 폭은 값의 6.25% 이내"""
+    print("🧪 Testing HDR bucket bounds...")
+    indexes = [LatencyHistogram.bucket_index(value) for value in range(5000)]
+    assert indexes == sorted(indexes)
+    for value in list(range(5000)) + [2 ** shift + delta for shift in range(12, 28) for delta in (-1, 0, 1)]:
+        index = LatencyHistogram.bucket_index(value)
+        assert 0 <= index < LatencyHistogram.BUCKET_COUNT
+        upper = LatencyHistogram.bucket_upper_bound(index)
+        if index < LatencyHistogram.BUCKET_COUNT - 1:
+            assert value <= upper, (value, index, upper)
+            lower = LatencyHistogram.bucket_upper_bound(index - 1) + 1 if index else 0
+            assert lower <= value
+            assert upper - lower + 1 <= max(1, value * MAX_RELATIVE_ERROR), (value, lower, upper)
+    print("   ✅ 0-5000µs and powers of two up to 2^27µs")
+
+    assert LatencyHistogram.bucket_index(10 ** 12) == LatencyHistogram.BUCKET_COUNT - 1
+    print("   ✅ values beyond ~268s go to the last bucket")
+
+
+def test_percentiles():
+    """백분위는 실제 값 이상, 6.25% 오차 이내, 최댓값을 넘지 않음"""
+    print("🧪 Testing percentiles...")
+    assert LatencyHistogram().percentile(99) == 0
+
+    rng = random.Random(31)
+    values = [int(rng.lognormvariate(9, 1.2)) for _ in range(20000)]  # 중앙값 약 8ms, 긴 꼬리
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.max_us == max(values)
+    assert abs(histogram.mean() - sum(values) / len(values)) < 1e-6
+    for p in (50, 90, 95, 99, 99.9):
+        exact = exact_percentile(values, p)
+        estimate = histogram.percentile(p)
+        assert exact <= estimate <= exact * (1 + MAX_RELATIVE_ERROR) + 1, (p, exact, estimate)
+        print(f"   ✅ p{p} - exact {exact}µs, histogram {estimate}µs")
+    assert histogram.percentile(100) == max(values)
+
+    single = LatencyHistogram()
+    single.record(12345)
+    assert single.percentile(50) == single.percentile(99) == 12345
+    print("   ✅ single value - every percentile equals the value")
+
+
+def test_merge():
+    """두 히스토그램 병합은 한 히스토그램에 모두 기록한 것과 같음"""
+    print("🧪 Testing merge...")
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 100000, 7):
+        (a if value % 2 else b).record(value)
+        both.record(value)
+    merged = LatencyHistogram()
+    merged.merge(a)
+    merged.merge(b)
+    assert merged.counts == both.counts
+    assert (merged.count, merged.total_us, merged.max_us) == (both.count, both.total_us, both.max_us)
+    print(f"   ✅ merged {merged.count} samples")
+
+
+def test_registry_output():
+    """라우트별 분위수/합계/개수와 응답 상태 카운터 출력"""
+    print("🧪 Testing Prometheus output...")
+    registry = MetricsRegistry()
+    for elapsed_us in (1000, 2000, 3000, 4000):
+        registry.observe("GET /api/items", 200, elapsed_us)
+    registry.observe("GET /api/items", 404, 500)
+
+    summary = registry.summary()
+    assert summary["requests"] == 5
+    assert summary["p50_ms"] == 2.05  # 2000µs가 든 버킷 상한 2047µs
+    assert summary["p99_ms"] == 4.0  # 버킷 상한이 최댓값보다 크면 최댓값
+    text = registry.render_prometheus()
+    assert 'infou_http_request_duration_seconds_count{route="GET /api/items"} 5' in text
+    assert 'infou_http_request_duration_seconds_sum{route="GET /api/items"} 0.0105' in text
+    assert 'infou_http_request_duration_seconds{route="GET /api/items",quantile="0.5"} 0.002047' in text
+    assert 'infou_http_request_duration_seconds{route="GET /api/items",quantile="0.99"} 0.004' in text
+    assert 'infou_http_responses_total{route="GET /api/items",status="2xx"} 4' in text
+    assert 'infou_http_responses_total{route="GET /api/items",status="4xx"} 1' in text
+    print("   ✅ summary and /metrics lines")
+
+
+def main():
+    """전체 지연시간 히스토그램 테스트 실행"""
+    print("🚀 Starting latency histogram tests...\n")
+
+    try:
+        test_bucket_bounds()
+        print()
+        test_percentiles()
+        print()
+        test_merge()
+        print()
+        test_registry_output()
+
+        print("\n🎉 All latency histogram tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
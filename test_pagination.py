@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+커서 페이지네이션 테스트
+잘못된 커서는 400, 여러 페이지를 이어 읽으면 전체 목록과 중복/누락 없이 같은지 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.services.pagination import NEXT_CURSOR_HEADER, encode_cursor
+
+client = TestClient(app)
+
+seeded = seed_learning_path("pagination", item_count=7)
+
+
+def walk(url: str, limit: int, params=None, headers=None):
+    """limit 크기로 마지막 페이지까지 이어 읽은 항목 목록"""
+    items, cursor, pages = [], None, 0
+    while True:
+        query = dict(params or {}, limit=limit)
+        if cursor is not None:
+            query["cursor"] = cursor
+        response = client.get(url, params=query, headers=headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= limit
+        items.extend(page)
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return items, pages
+
+
+def test_cursor_type_mismatch():
+    """키 타입과 다른 커서 값은 400"""
+    print("🧪 Testing cursor type validation...")
+    cases = [
+        ("/api/main-topics", [[1]]),
+        ("/api/main-topics", ["1"]),
+        ("/api/main-topics", [True]),
+        (f"/api/learning-paths/{seeded.path_id}/curriculum-items", ["x"]),
+        (f"/api/learning-paths/{seeded.path_id}/curriculum-items", [1.5]),
+        (f"/api/learning-paths/{seeded.path_id}/curriculum-items", [None]),
+        (f"/api/learning-paths/{seeded.path_id}/curriculum-items", [1, 2]),
+        (f"/api/curriculum-items/{seeded.item_ids[0]}/articles", [1]),
+        (f"/api/users/{TEST_USER_ID}/history", ["not-a-date", "art"]),
+        (f"/api/users/{TEST_USER_ID}/history", [1, "art"]),
+        (f"/api/users/{TEST_USER_ID}/unread", [1, 1, "beginner"]),
+    ]
+    for url, values in cases:
+        response = client.get(url, params={"limit": 2, "cursor": encode_cursor(values)}, headers=AUTH_HEADERS)
+        assert response.status_code == 400, (url, values, response.status_code)
+        print(f"   ✅ GET {url}?cursor={values} - 400")
+
+    response = client.get("/api/search", params={"q": "pagination", "cursor": encode_cursor(["x", "article", "a"])})
+    assert response.status_code == 400
+    print("   ✅ GET /api/search?cursor=['x', 'article', 'a'] - 400")
+
+    response = client.get("/api/main-topics", params={"limit": 2, "cursor": "%%%"})
+    assert response.status_code == 400
+    print("   ✅ GET /api/main-topics?cursor=%%% - 400")
+
+
+def test_curriculum_items_walk():
+    """커리큘럼 아이템 목록을 페이지로 이어 읽기"""
+    print("🧪 Testing curriculum items page walk...")
+    url = f"/api/learning-paths/{seeded.path_id}/curriculum-items"
+    full = client.get(url).json()
+    items, pages = walk(url, 2)
+    assert items == full
+    assert len({item["curriculum_item_id"] for item in items}) == len(seeded.item_ids)
+    print(f"   ✅ GET {url} - {len(items)} items in {pages} pages, no duplicates or gaps")
+
+
+def test_unread_walk():
+    """복합 키 (sort_order, level_code) 커서로 안 읽은 글 이어 읽기"""
+    print("🧪 Testing unread feed page walk...")
+    url = f"/api/users/{TEST_USER_ID}/unread"
+    params = {"path_id": seeded.path_id}
+    items, pages = walk(url, 4, params, AUTH_HEADERS)
+    expected = [article_id for articles in seeded.article_ids for article_id in articles]
+    assert sorted(item["article_id"] for item in items) == sorted(expected)
+    assert len(items) == len(set(item["article_id"] for item in items))
+    print(f"   ✅ GET {url} - {len(items)} articles in {pages} pages, no duplicates or gaps")
+
+
+def test_main_topics_walk():
+    """대주제 목록을 페이지로 이어 읽기"""
+    print("🧪 Testing main topics page walk...")
+    full = client.get("/api/main-topics").json()
+    items, pages = walk("/api/main-topics", 1)
+    assert [item["main_topic_id"] for item in items] == sorted(item["main_topic_id"] for item in full)
+    print(f"   ✅ GET /api/main-topics - {len(items)} topics in {pages} pages")
+
+
+def main():
+    """전체 페이지네이션 테스트 실행"""
+    print("🚀 Starting pagination tests...\n")
+
+    try:
+        test_cursor_type_mismatch()
+        print()
+        test_curriculum_items_walk()
+        print()
+        test_unread_walk()
+        print()
+        test_main_topics_walk()
+
+        print("\n🎉 All pagination tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+미리 압축한 글 상세 응답 테스트
+Accept-Encoding 협상(q=0, identity;q=0 포함)과 인코딩별 응답 본문 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.services.article_body_store import article_body_store
+from app.services.article_cache import article_cache
+
+client = TestClient(app)
+
+seeded = seed_learning_path("precompressed", item_count=1)
+
+# brotli는 선택 의존성 - 없으면 br 대신 gzip (br만 허용하면 무압축)
+BEST = article_body_store.supported_encodings[0]
+BR = "br" if BEST == "br" else None
+
+
+def test_negotiate():
+    """q 값이 가장 큰 인코딩, 같으면 br 우선, q=0은 제외"""
+    print("🧪 Testing Accept-Encoding negotiation...")
+    cases = [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, br", BEST),
+        ("br;q=0.5, gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=0, br;q=0", None),
+        ("GZIP;Q=0", None),
+        ("gzip ; q=0", None),
+        ("gzip;q=abc", None),
+        ("*", BEST),
+        ("*;q=0", None),
+        ("*, br;q=0", "gzip"),
+        ("identity;q=0, gzip", "gzip"),
+        ("identity;q=0, *;q=0.1", BEST),
+        # 압축도 무압축도 허용하지 않으면 헤더를 무시하고 무압축으로 응답
+        ("identity;q=0", None),
+    ]
+    for header, expected in cases:
+        assert article_body_store.negotiate(header) == expected, (header, expected)
+        print(f"   ✅ {header!r} - {expected}")
+
+
+def test_served_payloads():
+    """비로그인 응답은 협상한 변형본을 Content-Encoding과 함께 전송하고 본문은 같음"""
+    print("🧪 Testing precompressed article responses...")
+    article_id = seeded.article_ids[0][0]
+    url = f"/api/articles/{article_id}"
+    expected = None
+    for header, encoding in [
+        ("identity", None), ("gzip", "gzip"), ("br", BR), ("gzip;q=0, br;q=0", None), ("identity;q=0, gzip", "gzip")
+    ]:
+        article_cache.clear()
+        for attempt in ("db", "cache"):
+            response = client.get(url, headers={"Accept-Encoding": header})
+            assert response.status_code == 200
+            assert response.headers.get("content-encoding") == encoding, (header, response.headers)
+            assert "Accept-Encoding" in response.headers["vary"]
+            # TestClient가 압축을 풀어 주므로 모든 변형본의 JSON이 같아야 함
+            body = response.json()
+            if expected is None:
+                expected = body
+            assert body == expected
+            print(f"   ✅ Accept-Encoding: {header} ({attempt}) - {encoding or 'identity'}")
+
+    assert expected["article_id"] == article_id
+    assert expected["is_read"] is None
+
+
+def main():
+    """전체 압축 응답 테스트 실행"""
+    print("🚀 Starting precompressed payload tests...\n")
+
+    try:
+        test_negotiate()
+        print()
+        test_served_payloads()
+
+        print("\n🎉 All precompressed payload tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
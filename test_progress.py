@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+진행률 집계 테스트
+같은 글을 다시 읽어도 한 번만 세고, 일괄 반영은 멱등이며, 증분 집계가 전체 재계산과 같은지 확인
+"""
+
+import sys
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.database.database import SessionLocal
+from app.models import LearningPath, SubTopic, UserArticleRead, UserProgress
+from app.services.progress_tracker import progress_tracker
+
+client = TestClient(app)
+
+seeded = seed_learning_path("progress", item_count=3)
+
+progress_url = f"/api/users/{TEST_USER_ID}/progress"
+
+
+def progress():
+    response = client.get(progress_url, params={"sub_topic_id": seeded.sub_topic_id}, headers=AUTH_HEADERS)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    return body["read_articles"], body["total_articles"]
+
+
+def read(article_id: str):
+    response = client.post(f"/api/articles/{article_id}/read", headers=AUTH_HEADERS)
+    assert response.status_code == 200, response.text
+
+
+def test_repeat_reads_count_once():
+    """같은 글을 여러 번 읽어도 읽은 글 수는 1만 증가"""
+    print("🧪 Testing repeat reads...")
+    assert progress() == (0, 9)
+    article_id = seeded.article_ids[0][0]
+    for _ in range(3):
+        read(article_id)
+    assert progress() == (1, 9)
+    print(f"   ✅ 3 reads of {article_id} - read_articles 1")
+
+    read(seeded.article_ids[0][1])
+    assert progress() == (2, 9)
+    print("   ✅ another article - read_articles 2")
+
+    response = client.post("/api/articles/progress_missing/read", headers=AUTH_HEADERS)
+    assert response.status_code == 404
+    assert progress() == (2, 9)
+    print("   ✅ missing article - 404, counters unchanged")
+
+
+def test_batch_reads_idempotent():
+    """읽음 이벤트 일괄 반영을 다시 해도 집계는 그대로, read_at은 더 최근 값 유지"""
+    print("🧪 Testing batch read idempotency...")
+    article_id = seeded.article_ids[1][0]
+    newer = datetime(2026, 5, 2, 12, 0, 0)
+    older = newer - timedelta(days=1)
+    batches = [
+        ({(TEST_USER_ID, article_id): newer, (TEST_USER_ID, "progress_missing"): newer}, 1),
+        ({(TEST_USER_ID, article_id): newer}, 0),
+        ({(TEST_USER_ID, article_id): older}, 0),
+    ]
+    for reads, first_reads in batches:
+        db = SessionLocal()
+        try:
+            assert progress_tracker.record_reads(db, reads) == first_reads
+            db.commit()
+        finally:
+            db.close()
+    assert progress() == (3, 9)
+
+    db = SessionLocal()
+    try:
+        assert db.get(UserArticleRead, (TEST_USER_ID, article_id)).read_at == newer
+    finally:
+        db.close()
+    print("   ✅ replayed batches - counted once, read_at kept the newer value")
+
+
+def progress_rows(db):
+    return sorted(
+        (row.user_id, row.sub_topic_id, row.path_id, row.read_count)
+        for row in db.query(UserProgress).filter(UserProgress.sub_topic_id == seeded.sub_topic_id)
+    )
+
+
+def test_counters_match_rebuild():
+    """증분 집계가 읽음 기록에서 다시 계산한 값과 같음"""
+    print("🧪 Testing counters against a full rebuild...")
+    db = SessionLocal()
+    try:
+        incremental = progress_rows(db)
+        article_counts = (
+            db.get(SubTopic, seeded.sub_topic_id).article_count,
+            db.get(LearningPath, seeded.path_id).article_count
+        )
+        progress_tracker.rebuild(db)
+        db.commit()
+        assert progress_rows(db) == incremental == [(TEST_USER_ID, seeded.sub_topic_id, seeded.path_id, 3)]
+        assert (
+            db.get(SubTopic, seeded.sub_topic_id).article_count,
+            db.get(LearningPath, seeded.path_id).article_count
+        ) == article_counts == (9, 9)
+    finally:
+        db.close()
+    print(f"   ✅ user_progress {incremental}, article counts {article_counts}")
+
+
+def main():
+    """전체 진행률 집계 테스트 실행"""
+    print("🚀 Starting progress counter tests...\n")
+
+    try:
+        test_repeat_reads_count_once()
+        print()
+        test_batch_reads_idempotent()
+        print()
+        test_counters_match_rebuild()
+
+        print("\n🎉 All progress counter tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
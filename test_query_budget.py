@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+쿼리 수 상한 테스트
+목록 엔드포인트가 페이지 크기나 데이터 양과 무관하게 정해진 수의 SQL만 실행하는지 확인
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append('.')
+
+# 앱을 불러오기 전에 임시 DB와 인덱스 디렉터리를 지정 (pytest로 실행하면 conftest.py에서 먼저 지정)
+_tmp_dir = tempfile.mkdtemp(prefix="infou-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_dir}/test.db")
+os.environ.setdefault("SIMILARITY_INDEX_DIR", f"{_tmp_dir}/similarity")
+os.environ.setdefault("READ_EVENT_LOG_DIR", f"{_tmp_dir}/read_events")
+os.environ["QUERY_STATS_ENABLED"] = "true"
+os.environ["API_RATE_LIMIT"] = "0"
+
+from fastapi.testclient import TestClient
+from main import app
+from app.database.database import SessionLocal
+from app.database.init_db import init_db
+from app.database.query_stats import query_budget
+from app.models import Article, CurriculumItem, LearningPath, Level, MainTopic, SubTopic
+from app.services.pagination import NEXT_CURSOR_HEADER
+
+client = TestClient(app)
+
+PATH_ID = "path_budget"
+ITEM_COUNT = 12
+LEVELS = ["beginner", "intermediate", "expert"]
+
+# 존재 확인 1 + 목록 1
+LIST_QUERY_BUDGET = 2
+
+
+def seed():
+    """학습 경로 1개, 커리큘럼 아이템 ITEM_COUNT개, 아이템별 난이도 3개 글 생성"""
+    init_db()
+    db = SessionLocal()
+    try:
+        for code in LEVELS:
+            db.merge(Level(level_code=code, name=code))
+        main_topic = MainTopic(name="AI")
+        db.add(main_topic)
+        db.flush()
+        sub_topic = SubTopic(main_topic_id=main_topic.main_topic_id, name="머신러닝", source_type="curated")
+        db.add(sub_topic)
+        db.flush()
+        db.add(LearningPath(path_id=PATH_ID, sub_topic_id=sub_topic.sub_topic_id, title="머신러닝 기초"))
+        for i in range(ITEM_COUNT):
+            item_id = f"item_{i:02d}"
+            db.add(CurriculumItem(
+                curriculum_item_id=item_id, sub_topic_id=sub_topic.sub_topic_id, path_id=PATH_ID,
+                title=f"{i + 1}. 주제 {i}", sort_order=i + 1
+            ))
+            for code in LEVELS:
+                db.add(Article(
+                    article_id=f"art_{i:02d}_{code}", curriculum_item_id=item_id, sub_topic_id=sub_topic.sub_topic_id,
+                    level_code=code, title=f"주제 {i} ({code})", body=f"주제 {i} 본문"
+                ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_curriculum_items_query_budget():
+    """커리큘럼 아이템 목록 쿼리 수 테스트"""
+    print("🧪 Testing curriculum items query budget...")
+    url = f"/api/learning-paths/{PATH_ID}/curriculum-items"
+
+    # 전체 목록
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}") as budget:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(response.json()) == ITEM_COUNT
+    print(f"   ✅ GET {url} - {budget.count} queries")
+
+    # limit만 지정 (첫 페이지)
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}?limit=5") as budget:
+        response = client.get(url, params={"limit": 5})
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    print(f"   ✅ GET {url}?limit=5 - {budget.count} queries")
+
+    # limit + cursor (다음 페이지)
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}?limit=5&cursor=...") as budget:
+        response = client.get(url, params={"limit": 5, "cursor": cursor})
+    assert response.status_code == 200
+    assert [item["sort_order"] for item in response.json()] == [6, 7, 8, 9, 10]
+    print(f"   ✅ GET {url}?limit=5&cursor=... - {budget.count} queries")
+
+
+def test_curriculum_item_articles_query_budget():
+    """커리큘럼 아이템별 글 목록 쿼리 수 테스트"""
+    print("🧪 Testing curriculum item articles query budget...")
+    url = "/api/curriculum-items/item_00/articles"
+
+    # 전체 목록
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}") as budget:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(response.json()) == len(LEVELS)
+    print(f"   ✅ GET {url} - {budget.count} queries")
+
+    # limit만 지정 (첫 페이지)
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}?limit=2") as budget:
+        response = client.get(url, params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    print(f"   ✅ GET {url}?limit=2 - {budget.count} queries")
+
+    # limit + cursor (다음 페이지)
+    with query_budget(LIST_QUERY_BUDGET, f"GET {url}?limit=2&cursor=...") as budget:
+        response = client.get(url, params={"limit": 2, "cursor": cursor})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert NEXT_CURSOR_HEADER not in response.headers
+    print(f"   ✅ GET {url}?limit=2&cursor=... - {budget.count} queries")
+
+
+seed()
+
+
+def main():
+    """전체 쿼리 수 테스트 실행"""
+    print("🚀 Starting query budget tests...\n")
+
+    try:
+        test_curriculum_items_query_budget()
+        print()
+        test_curriculum_item_articles_query_budget()
+
+        print("\n🎉 All query budget tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+요청 수 제한 테스트
+토큰 버킷 충전/소비, 429와 Retry-After, 클라이언트/경로 분류별 버킷 분리 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import rate_limit as rate_limit_module
+from app.middleware.rate_limit import RateLimitMiddleware, TokenBucketLimiter, classify_route
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def with_clock(test):
+    """time.monotonic을 FakeClock으로 바꿔 실행"""
+    clock = FakeClock()
+    real_monotonic = rate_limit_module.time.monotonic
+    rate_limit_module.time.monotonic = clock
+    try:
+        test(clock)
+    finally:
+        rate_limit_module.time.monotonic = real_monotonic
+
+
+def test_bucket_refill():
+    """용량만큼 허용 후 거절, 경과 시간만큼 다시 충전 (용량 이상은 쌓이지 않음)"""
+    print("🧪 Testing token bucket refill...")
+
+    def run(clock):
+        limiter = TokenBucketLimiter(60)  # 초당 1개
+        assert all(limiter.acquire("a") == 0.0 for _ in range(60))
+        assert limiter.acquire("a") == 1.0
+        print("   ✅ 60 allowed, 61st rejected with 1.0s wait")
+
+        clock.now += 0.5
+        assert limiter.acquire("a") == 0.5
+        clock.now += 0.5
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0
+        print("   ✅ refilled one token per second")
+
+        # 오래 쉬어도 용량(60)까지만 충전
+        clock.now += 3600
+        assert all(limiter.acquire("a") == 0.0 for _ in range(60))
+        assert limiter.acquire("a") > 0
+        print("   ✅ refill capped at capacity")
+
+        # 다른 키는 별도 버킷
+        assert limiter.acquire("b") == 0.0
+
+    with_clock(run)
+
+
+def test_sweep_idle_buckets():
+    """가득 찰 만큼 쉰 버킷만 정리"""
+    print("🧪 Testing idle bucket sweep...")
+
+    def run(clock):
+        limiter = TokenBucketLimiter(60, sweep_interval=10.0)
+        limiter.acquire("idle")
+        clock.now += 30
+        limiter.acquire("recent")
+        clock.now += 31  # idle은 61초, recent는 31초 경과
+        limiter.acquire("recent")
+        assert len(limiter) == 1
+        print("   ✅ idle bucket removed, active bucket kept")
+
+    with_clock(run)
+
+
+def test_classify_route():
+    """/api/ 밖은 제한 없음, 생성 POST는 별도 분류"""
+    print("🧪 Testing route classification...")
+    assert classify_route("GET", "/health") is None
+    assert classify_route("GET", "/debug/tables") is None
+    assert classify_route("GET", "/api/main-topics") == "read"
+    assert classify_route("POST", "/api/articles/a/read") == "read"
+    assert classify_route("POST", "/api/curriculum-items/i/articles/generate") == "generation"
+    print("   ✅ health/debug unlimited, generate POST separate")
+
+
+def test_middleware_429():
+    """제한을 넘으면 429와 Retry-After, 클라이언트와 분류마다 버킷이 따로"""
+    print("🧪 Testing 429 / Retry-After...")
+    app = FastAPI()
+
+    @app.get("/api/items")
+    async def items():
+        return {"ok": True}
+
+    @app.post("/api/items/generate")
+    async def generate():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    client = TestClient(RateLimitMiddleware(app, limits={"read": 2, "generation": 1}, trust_forwarded=True))
+    client_a = {"X-Forwarded-For": "10.0.0.1, 172.16.0.1"}
+    client_b = {"X-Forwarded-For": "10.0.0.2"}
+
+    assert [client.get("/api/items", headers=client_a).status_code for _ in range(2)] == [200, 200]
+    response = client.get("/api/items", headers=client_a)
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Rate limit exceeded"}
+    retry_after = int(response.headers["retry-after"])
+    assert 1 <= retry_after <= 30  # 분당 2개 = 30초에 1개
+    print(f"   ✅ 3rd read - 429, Retry-After: {retry_after}")
+
+    assert client.get("/api/items", headers=client_b).status_code == 200
+    assert client.post("/api/items/generate", headers=client_a).status_code == 200
+    assert client.post("/api/items/generate", headers=client_a).status_code == 429
+    assert client.get("/health", headers=client_a).status_code == 200
+    print("   ✅ other client, generation bucket and /health unaffected")
+
+
+def main():
+    """전체 요청 수 제한 테스트 실행"""
+    print("🚀 Starting rate limit tests...\n")
+
+    try:
+        test_bucket_refill()
+        print()
+        test_sweep_idle_buckets()
+        print()
+        test_classify_route()
+        print()
+        test_middleware_429()
+
+        print("\n🎉 All rate limit tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+읽음 이벤트 로그 테스트
+레코드 인코딩, 손상된 꼬리 처리, 종료된 워커 파일 인수, 압축 재실행 멱등성, 압축 후 진행률/기록 반영 확인
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+from datetime import datetime
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.database.database import SessionLocal
+from app.models import CompactedReadLog, ReadRollup, UserArticleRead
+from app.services import read_event_log as read_event_log_module
+from app.services.read_event_log import ReadEventLog, encode_record, iter_records, read_event_log
+
+client = TestClient(app)
+
+seeded = seed_learning_path("eventlog", item_count=3)
+
+
+def new_log() -> ReadEventLog:
+    return ReadEventLog(tempfile.mkdtemp(prefix="infou-events-"), fsync_interval=1.0, compact_interval=60.0, enabled=True)
+
+
+def write_records(path: str, events) -> bytes:
+    data = b"".join(encode_record(*event) for event in events)
+    with open(path, "wb") as f:
+        f.write(data)
+    return data
+
+
+def test_record_round_trip():
+    """레코드 인코딩/디코딩 왕복"""
+    print("🧪 Testing record round trip...")
+    events = [
+        ("user_1", "art_1", datetime(2026, 1, 2, 3, 4, 5, 678901)),
+        ("사용자_2", "art_한글", datetime(2026, 10, 19, 23, 59, 59)),
+        ("", "art_3", datetime(1999, 12, 31)),
+    ]
+    path = os.path.join(tempfile.mkdtemp(prefix="infou-events-"), "reads-1.log")
+    write_records(path, events)
+    assert list(iter_records(path)) == events
+    print(f"   ✅ {len(events)} records decoded unchanged")
+
+
+def test_torn_and_corrupt_tail():
+    """잘리거나 체크섬이 맞지 않는 꼬리 레코드에서 멈춤"""
+    print("🧪 Testing torn / corrupt tail...")
+    events = [("user_1", f"art_{i}", datetime(2026, 1, 1, 0, 0, i)) for i in range(3)]
+    directory = tempfile.mkdtemp(prefix="infou-events-")
+
+    torn = os.path.join(directory, "torn.log")
+    data = write_records(torn, events)
+    with open(torn, "wb") as f:
+        f.write(data[:-3])
+    assert list(iter_records(torn)) == events[:2]
+    print("   ✅ torn tail - first 2 records replayed")
+
+    corrupt = os.path.join(directory, "corrupt.log")
+    data = bytearray(write_records(corrupt, events))
+    data[-1] ^= 0xFF
+    with open(corrupt, "wb") as f:
+        f.write(data)
+    assert list(iter_records(corrupt)) == events[:2]
+    print("   ✅ bad crc tail - first 2 records replayed")
+
+    empty = os.path.join(directory, "empty.log")
+    open(empty, "wb").close()
+    assert list(iter_records(empty)) == []
+
+
+def test_claim_dead_worker_files():
+    """종료된 워커의 활성/봉인 파일은 rename으로 가져오고 살아 있는 워커의 파일은 두기"""
+    print("🧪 Testing dead worker file claim...")
+    log = new_log()
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    dead_pid = process.pid
+    alive_pid = os.getppid()
+
+    event = (TEST_USER_ID, "art_dead", datetime(2026, 1, 1))
+    write_records(os.path.join(log.directory, f"reads-{dead_pid}.log"), [event])
+    write_records(os.path.join(log.directory, f"reads-{dead_pid}-1-0.sealed"), [event])
+    write_records(os.path.join(log.directory, f"reads-{alive_pid}.log"), [event])
+
+    claimed = log._claim_files()
+    assert len(claimed) == 2
+    for path in claimed:
+        assert os.path.basename(path).startswith(f"reads-{os.getpid()}-")
+        assert path.endswith(".sealed")
+        assert list(iter_records(path)) == [event]
+    remaining = sorted(os.listdir(log.directory))
+    assert f"reads-{alive_pid}.log" in remaining
+    assert not any(name.startswith(f"reads-{dead_pid}") for name in remaining)
+    print(f"   ✅ claimed {len(claimed)} files from pid {dead_pid}, kept pid {alive_pid}")
+
+
+def hourly_article_counts(article_ids):
+    db = SessionLocal()
+    try:
+        rows = db.query(ReadRollup.entity_id, ReadRollup.read_count).filter(
+            ReadRollup.granularity == "hour",
+            ReadRollup.entity_type == "article",
+            ReadRollup.entity_id.in_(article_ids)
+        ).all()
+        return {entity_id: read_count for entity_id, read_count in rows}
+    finally:
+        db.close()
+
+
+def test_compaction_replay_after_crash():
+    """반영 후 파일 삭제 전에 죽은 경우 다시 압축해도 인기 집계를 두 번 더하지 않음"""
+    print("🧪 Testing compaction replay after crash...")
+    log = new_log()
+    article_ids = [seeded.article_ids[1][0], seeded.article_ids[1][1]]
+    now = datetime.utcnow()
+    log.append(TEST_USER_ID, article_ids[0], now)
+    log.append(TEST_USER_ID, article_ids[0], now)
+    log.append(TEST_USER_ID, article_ids[1], now)
+
+    def crash(path):
+        raise OSError("simulated crash before remove")
+
+    real_remove = read_event_log_module.os.remove
+    read_event_log_module.os.remove = crash
+    try:
+        log.compact_once()
+        assert False, "compact_once should have failed"
+    except OSError:
+        pass
+    finally:
+        read_event_log_module.os.remove = real_remove
+
+    after_crash = hourly_article_counts(article_ids)
+    assert after_crash == {article_ids[0]: 2, article_ids[1]: 1}
+    print(f"   ✅ first compaction committed - {after_crash}")
+
+    assert log.compact_once() == 0
+    assert hourly_article_counts(article_ids) == after_crash
+    assert os.listdir(log.directory) == []
+    db = SessionLocal()
+    try:
+        assert db.query(CompactedReadLog).count() == 0
+    finally:
+        db.close()
+    print("   ✅ replay skipped the folded file and pruned its digest")
+
+    log.append(TEST_USER_ID, article_ids[1], now)
+    assert log.compact_once() == 1
+    assert hourly_article_counts(article_ids) == {article_ids[0]: 2, article_ids[1]: 2}
+    print("   ✅ later events still folded")
+
+
+def test_progress_and_history_after_compaction():
+    """로그 모드의 읽음 처리는 압축 후 진행률/읽은 기록에 반영"""
+    print("🧪 Testing progress/history after compaction...")
+    article_id = seeded.article_ids[2][2]
+    previous = (read_event_log.enabled, read_event_log.directory)
+    read_event_log.enabled = True
+    read_event_log.directory = tempfile.mkdtemp(prefix="infou-events-")
+    try:
+        progress_url = f"/api/users/{TEST_USER_ID}/progress"
+        params = {"sub_topic_id": seeded.sub_topic_id}
+        before = client.get(progress_url, params=params, headers=AUTH_HEADERS).json()
+
+        response = client.post(f"/api/articles/{article_id}/read", headers=AUTH_HEADERS)
+        assert response.status_code == 200
+        db = SessionLocal()
+        try:
+            assert db.query(UserArticleRead).filter(UserArticleRead.article_id == article_id).count() == 0
+        finally:
+            db.close()
+        print("   ✅ POST /api/articles/{id}/read - appended to the log only")
+
+        assert read_event_log.compact_once() == 1
+        after = client.get(progress_url, params=params, headers=AUTH_HEADERS).json()
+        assert after["read_articles"] == before["read_articles"] + 1
+        assert after["total_articles"] == before["total_articles"]
+        print(f"   ✅ GET {progress_url} - read_articles {before['read_articles']} -> {after['read_articles']}")
+
+        history = client.get(f"/api/users/{TEST_USER_ID}/history", headers=AUTH_HEADERS).json()
+        assert article_id in [entry["article_id"] for entry in history]
+        print(f"   ✅ GET /api/users/{TEST_USER_ID}/history - {article_id} listed")
+    finally:
+        read_event_log.sync()
+        read_event_log.enabled, read_event_log.directory = previous
+
+
+def main():
+    """전체 읽음 이벤트 로그 테스트 실행"""
+    print("🚀 Starting read event log tests...\n")
+
+    try:
+        test_record_round_trip()
+        print()
+        test_torn_and_corrupt_tail()
+        print()
+        test_claim_dead_worker_files()
+        print()
+        test_compaction_replay_after_crash()
+        print()
+        test_progress_and_history_after_compaction()
+
+        print("\n🎉 All read event log tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
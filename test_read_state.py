@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+읽음 비트맵 테스트
+캐시는 commit 뒤에만 갱신, 위치에 새 글이 생기면 이전 읽음 비트 끄기, 디버그 테이블 삭제 후 파생 데이터 재계산 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from main import app
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models import Article, ReadRollup, UserArticleRead
+from app.services.read_state import read_state_cache
+from app.services.similarity_index import similarity_index
+
+client = TestClient(app)
+
+seeded = seed_learning_path("readstate", item_count=3)
+
+
+def cached_bits(path_id: str, level_code: str):
+    entry = read_state_cache._entries.get((TEST_USER_ID, path_id, level_code))
+    return entry[0] if entry else None
+
+
+def read_flags(level: str):
+    response = client.get(
+        f"/api/users/{TEST_USER_ID}/learning-paths/{seeded.path_id}/read-state",
+        params={"level": level}, headers=AUTH_HEADERS
+    )
+    assert response.status_code == 200, response.text
+    return {item["sort_order"]: item["is_read"] for item in response.json()["items"]}
+
+
+def test_cache_after_commit_only():
+    """merge는 commit이 성공한 뒤에만 캐시에 반영되고 롤백되면 버려짐"""
+    print("🧪 Testing read-state cache commit / rollback...")
+    read_state_cache.clear()
+    db = SessionLocal()
+    try:
+        read_state_cache.merge(db, TEST_USER_ID, seeded.path_id, "expert", 1 << 1)
+        assert cached_bits(seeded.path_id, "expert") is None
+        db.rollback()
+        assert cached_bits(seeded.path_id, "expert") is None
+        assert read_state_cache.get(db, TEST_USER_ID, seeded.path_id, "expert") == 0
+        print("   ✅ rollback - cache and table unchanged")
+
+        read_state_cache.merge(db, TEST_USER_ID, seeded.path_id, "expert", 1 << 2)
+        assert cached_bits(seeded.path_id, "expert") == 0
+        db.commit()
+        assert cached_bits(seeded.path_id, "expert") == 1 << 2
+        print("   ✅ commit - cache updated")
+
+        # 전체 재계산도 commit 뒤에 캐시를 비움
+        read_state_cache.rebuild(db)
+        assert cached_bits(seeded.path_id, "expert") == 1 << 2
+        db.rollback()
+        assert cached_bits(seeded.path_id, "expert") == 1 << 2
+        read_state_cache.rebuild(db)
+        db.commit()
+        assert cached_bits(seeded.path_id, "expert") is None
+        assert read_state_cache.get(db, TEST_USER_ID, seeded.path_id, "expert") == 0
+        print("   ✅ rebuild - cache cleared only after commit")
+    finally:
+        db.close()
+
+
+def test_new_article_clears_position():
+    """지워진 글 자리에 새 글을 생성하면 그 위치의 읽음 표시가 남지 않음"""
+    print("🧪 Testing new article at a read position...")
+    item_id = seeded.item_ids[0]
+    old_article_id = seeded.article_ids[0][1]
+    assert client.post(f"/api/articles/{old_article_id}/read", headers=AUTH_HEADERS).status_code == 200
+    assert read_flags("intermediate")[1] is True
+
+    # 비트맵은 건드리지 않고 글만 지움 (예: 아이템 교체)
+    db = SessionLocal()
+    try:
+        for table in ("user_article_reads", "article_bodies", "articles"):
+            db.execute(text(f"DELETE FROM {table} WHERE article_id = :article_id"), {"article_id": old_article_id})
+        db.commit()
+        assert read_state_cache.get(db, TEST_USER_ID, seeded.path_id, "intermediate") & (1 << 1)
+    finally:
+        db.close()
+
+    response = client.post(
+        f"/api/curriculum-items/{item_id}/articles/generate",
+        json={"level": "intermediate", "content_style": "x", "word_count": 100}
+    )
+    assert response.status_code == 200
+    assert read_flags("intermediate")[1] is False
+    assert cached_bits(seeded.path_id, "intermediate") & (1 << 1) == 0
+    print(f"   ✅ generated {response.json()['article_id']} - position 1 unread")
+
+
+def test_debug_clear_rebuilds_derived_data():
+    """디버그 테이블 삭제는 읽음 비트맵, 인기 집계, 유사도 인덱스를 다시 계산"""
+    print("🧪 Testing debug table clear...")
+    article_id = seeded.article_ids[2][0]
+    assert client.post(f"/api/articles/{article_id}/read", headers=AUTH_HEADERS).status_code == 200
+    assert read_flags("beginner")[3] is True
+    trending = client.get("/api/trending", params={"limit": 100}).json()
+    assert article_id in [entry["entity_id"] for entry in trending]
+
+    previous = settings.debug
+    settings.debug = True
+    try:
+        response = client.delete("/debug/tables/user_article_reads")
+        assert response.status_code == 200, response.text
+    finally:
+        settings.debug = previous
+
+    assert read_flags("beginner")[3] is False
+    print("   ✅ read-state - bitmap rebuilt")
+
+    db = SessionLocal()
+    try:
+        assert db.query(UserArticleRead).count() == 0
+        assert db.query(ReadRollup).count() == 0
+        article_count = db.query(Article).count()
+    finally:
+        db.close()
+    assert client.get("/api/trending").json() == []
+    print("   ✅ trending - rollups rebuilt")
+
+    assert similarity_index.size("article") == article_count
+    print(f"   ✅ similarity index - {article_count} articles")
+
+
+def main():
+    """전체 읽음 비트맵 테스트 실행"""
+    print("🚀 Starting read state tests...\n")
+
+    try:
+        test_cache_after_commit_only()
+        print()
+        test_new_article_clears_position()
+        print()
+        test_debug_clear_rebuilds_derived_data()
+
+        print("\n🎉 All read state tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+이어 읽기 위치 테스트
+같은 아이템에서는 레벨 난이도 순서, 소주제 조회는 그 소주제의 학습 경로만 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, TEST_USER_ID, seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.database.database import SessionLocal
+from app.models import CurriculumItem, LearningPath
+
+client = TestClient(app)
+
+seeded = seed_learning_path("resume", item_count=2)
+other = seed_learning_path("resume_other", item_count=1)
+
+progress_url = f"/api/users/{TEST_USER_ID}/progress"
+
+
+def current_article(params):
+    response = client.get(progress_url, params=params, headers=AUTH_HEADERS)
+    assert response.status_code == 200, response.text
+    return (response.json()["current_article"] or {}).get("article_id")
+
+
+def read(article_id: str):
+    response = client.post(f"/api/articles/{article_id}/read", headers=AUTH_HEADERS)
+    assert response.status_code == 200, response.text
+
+
+def test_level_order():
+    """한 아이템의 글은 beginner → intermediate → expert 순서 (문자열 순서면 expert가 먼저)"""
+    print("🧪 Testing resume level order...")
+    params = {"sub_topic_id": seeded.sub_topic_id}
+    beginner, intermediate, expert = seeded.article_ids[0]
+    assert current_article(params) == beginner
+
+    read(beginner)
+    assert current_article(params) == intermediate
+    print(f"   ✅ after {beginner} - {intermediate}, not {expert}")
+
+    read(intermediate)
+    assert current_article(params) == expert
+    read(expert)
+    assert current_article(params) == seeded.article_ids[1][0]
+    print(f"   ✅ item finished - next item {seeded.article_ids[1][0]}")
+
+
+def test_resume_by_level():
+    """경로/레벨 이어 읽기는 그 레벨의 글만"""
+    print("🧪 Testing resume by path and level...")
+    response = client.get(
+        f"/api/users/{TEST_USER_ID}/resume",
+        params={"path_id": seeded.path_id, "level": "intermediate"}, headers=AUTH_HEADERS
+    )
+    assert response.status_code == 200
+    current = response.json()["current_article"]
+    assert current["article_id"] == seeded.article_ids[1][1]
+    assert current["sort_order"] == 2
+    print(f"   ✅ GET /api/users/{TEST_USER_ID}/resume - {current['article_id']}")
+
+
+def test_sub_topic_paths():
+    """소주제 조회는 그 소주제의 경로만 보고, 경로가 둘이면 두 번째 경로로 이어감"""
+    print("🧪 Testing resume within a sub-topic's learning paths...")
+    params = {"sub_topic_id": other.sub_topic_id}
+    assert current_article(params) == other.article_ids[0][0]
+
+    # 같은 소주제에 경로를 하나 더 두고 첫 경로를 모두 읽음
+    db = SessionLocal()
+    try:
+        db.add(LearningPath(path_id="resume_other_path_2", sub_topic_id=other.sub_topic_id, title="두 번째 경로"))
+        db.add(CurriculumItem(
+            curriculum_item_id="resume_other_path_2_item", sub_topic_id=other.sub_topic_id,
+            path_id="resume_other_path_2", title="두 번째 경로 아이템", sort_order=1
+        ))
+        db.commit()
+    finally:
+        db.close()
+    generated = client.post(
+        "/api/curriculum-items/resume_other_path_2_item/articles/generate",
+        json={"level": "beginner", "content_style": "x", "word_count": 100}
+    ).json()["article_id"]
+
+    for article_id in other.article_ids[0]:
+        read(article_id)
+    assert current_article(params) == generated
+    print(f"   ✅ first path finished - {generated} from the second path")
+
+    # 다른 소주제의 안 읽은 글은 섞이지 않음
+    read(generated)
+    assert current_article(params) is None
+    print("   ✅ all read - null")
+
+
+def main():
+    """전체 이어 읽기 테스트 실행"""
+    print("🚀 Starting resume tests...\n")
+
+    try:
+        test_level_order()
+        print()
+        test_resume_by_level()
+        print()
+        test_sub_topic_paths()
+
+        print("\n🎉 All resume tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
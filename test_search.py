@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+전문 검색 테스트
+트리거로 FTS 색인 동기화(추가/수정/삭제), 2글자 한국어 검색어, 종류별 정규화 점수와 페이지 이어 읽기 확인
+"""
+
+import sys
+sys.path.append('.')
+
+from conftest import seed_learning_path
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from main import app
+from app.database.database import SessionLocal
+from app.models import Article
+from app.services.pagination import NEXT_CURSOR_HEADER
+
+client = TestClient(app)
+
+# expert 자리는 트리거 테스트용 글에 사용
+seeded = seed_learning_path("searchko", item_count=3, levels=["beginner", "intermediate"])
+
+
+def search_ids(q: str, **params):
+    response = client.get("/api/search", params=dict(params, q=q))
+    assert response.status_code == 200, response.text
+    return [hit["entity_id"] for hit in response.json()]
+
+
+def test_trigger_sync():
+    """articles 추가/수정/삭제가 트리거로 검색 색인에 반영"""
+    print("🧪 Testing FTS trigger sync...")
+    db = SessionLocal()
+    try:
+        db.add(Article(
+            article_id="searchko_trigger", curriculum_item_id=seeded.item_ids[0], sub_topic_id=seeded.sub_topic_id,
+            level_code="expert", title="트리거 동기화 확인", body="qzxwv 색인 본문"
+        ))
+        db.commit()
+    finally:
+        db.close()
+    assert search_ids("qzxwv") == ["searchko_trigger"]
+    print("   ✅ insert - found by body term")
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            text("UPDATE articles SET title = :title, body = :body WHERE article_id = 'searchko_trigger'"),
+            {"title": "트리거 수정됨", "body": "vwxzq 바뀐 본문"}
+        )
+        db.commit()
+    finally:
+        db.close()
+    assert search_ids("qzxwv") == []
+    assert search_ids("vwxzq") == ["searchko_trigger"]
+    assert search_ids("트리거 수정됨") == ["searchko_trigger"]
+    print("   ✅ update - old terms removed, new terms found")
+
+    db = SessionLocal()
+    try:
+        db.execute(text("DELETE FROM articles WHERE article_id = 'searchko_trigger'"))
+        db.commit()
+    finally:
+        db.close()
+    assert search_ids("vwxzq") == []
+    print("   ✅ delete - removed from the index")
+
+
+def test_korean_short_terms():
+    """2글자 한국어 단어만 있으면 400, 3글자 이상 단어와 함께면 결과를 좁힘"""
+    print("🧪 Testing Korean 2-character terms...")
+    for q in ["본문", "소주 본문", "ab"]:
+        response = client.get("/api/search", params={"q": q})
+        assert response.status_code == 400, (q, response.status_code)
+        print(f"   ✅ GET /api/search?q={q} - 400")
+
+    ids = search_ids("searchko 본문", limit=100)
+    assert ids and all(entity_id.startswith("searchko_art_") for entity_id in ids)
+    assert search_ids("searchko 없음") == []
+    assert search_ids("searchko 소주제", entity_type="sub_topic") == [str(seeded.sub_topic_id)]
+    print(f"   ✅ GET /api/search?q=searchko 본문 - {len(ids)} articles, sub-topic/main-topic filtered out")
+
+
+def test_normalised_scores_and_walk():
+    """점수는 종류별로 (0, 1]로 정규화되고, 페이지를 이어 읽으면 전체 결과와 같음"""
+    print("🧪 Testing normalised scores / page walk...")
+    response = client.get("/api/search", params={"q": "searchko", "limit": 100})
+    full = response.json()
+    assert {hit["entity_type"] for hit in full} == {"article", "sub_topic", "main_topic"}
+    for entity_type in ("article", "sub_topic", "main_topic"):
+        scores = [hit["score"] for hit in full if hit["entity_type"] == entity_type]
+        assert max(scores) == 1.0 and all(0 < score <= 1 for score in scores)
+    assert [hit["score"] for hit in full] == sorted((hit["score"] for hit in full), reverse=True)
+    print(f"   ✅ {len(full)} hits, best per type = 1.0, sorted by score")
+
+    hits, cursor = [], None
+    while True:
+        params = {"q": "searchko", "limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/api/search", params=params)
+        hits.extend(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+    assert hits == full
+    print(f"   ✅ page walk - {len(hits)} hits, no duplicates or gaps")
+
+
+def main():
+    """전체 검색 테스트 실행"""
+    print("🚀 Starting search tests...\n")
+
+    try:
+        test_trigger_sync()
+        print()
+        test_korean_short_terms()
+        print()
+        test_normalised_scores_and_walk()
+
+        print("\n🎉 All search tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+유사도 인덱스 테스트
+TF-IDF 순위, delta 추가/기준 행렬 병합, manifest 교체 후 재사용/다른 워커 반영 확인
+"""
+
+import sys
+import tempfile
+sys.path.append('.')
+
+import numpy as np
+
+from app.services.similarity_index import SimilarityIndex
+
+DOCUMENTS = [
+    ("doc_cnn", "합성곱 신경망 이미지 분류 합성곱 필터와 풀링"),
+    ("doc_rnn", "순환 신경망 시계열 예측 순환 구조와 기울기 소실"),
+    ("doc_cnn2", "합성곱 신경망으로 이미지 분류하기 필터 풀링 실습"),
+    ("doc_sql", "관계형 데이터베이스 인덱스와 쿼리 실행 계획"),
+    ("doc_sql2", "데이터베이스 인덱스 설계와 쿼리 실행 계획 읽기"),
+    ("doc_cook", "김치찌개 끓이는 법 돼지고기와 묵은지"),
+]
+
+
+def new_index(directory: str = None, delta_max_rows: int = 1000) -> SimilarityIndex:
+    return SimilarityIndex(
+        directory or tempfile.mkdtemp(prefix="infou-similarity-"), dims=128,
+        delta_max_rows=delta_max_rows, update_interval=60.0
+    )
+
+
+def ids(entries):
+    return [entry.entity_id for entry in entries]
+
+
+def test_tfidf_ranking():
+    """내용이 가까운 문서가 먼저, 자기 자신은 제외, 점수는 내림차순"""
+    print("🧪 Testing TF-IDF ranking...")
+    index = new_index()
+    index.build("article", lambda: iter(DOCUMENTS))
+    assert index.size("article") == len(DOCUMENTS)
+
+    entries = index.similar(None, "article", "doc_cnn", 3)
+    assert entries[0].entity_id == "doc_cnn2"
+    assert "doc_cnn" not in ids(entries)
+    assert [entry.score for entry in entries] == sorted((entry.score for entry in entries), reverse=True)
+    assert entries[0].score > 0.3
+
+    assert index.similar(None, "article", "doc_sql", 1)[0].entity_id == "doc_sql2"
+    assert len(index.similar(None, "article", "doc_cook", 10)) == len(DOCUMENTS) - 1
+
+    # 행은 L2 정규화되어 자기 자신과의 내적이 1
+    loaded = index._load("article")
+    row = loaded.base.matrix[loaded.base.positions["doc_rnn"]]
+    assert abs(float(np.dot(row, row)) - 1.0) < 1e-5
+    print(f"   ✅ similar(doc_cnn) - {ids(entries)}")
+
+
+def test_delta_add_and_merge():
+    """delta 추가, 중복 무시, delta_max_rows를 넘으면 기준 행렬로 병합"""
+    print("🧪 Testing delta add / merge...")
+    index = new_index(delta_max_rows=2)
+    index.build("article", lambda: iter(DOCUMENTS[:4]))
+    base_name = index._load("article").base.name
+
+    index.add_rows("article", [("doc_sql2", DOCUMENTS[4][1]), ("doc_cnn", "이미 있는 문서")])
+    loaded = index._load("article")
+    assert loaded.base.name == base_name
+    assert loaded.delta.ids == ["doc_sql2"]
+    assert index.size("article") == 5
+    assert index.similar(None, "article", "doc_sql", 1)[0].entity_id == "doc_sql2"
+    assert index.similar(None, "article", "doc_sql2", 1)[0].entity_id == "doc_sql"
+    print("   ✅ add_rows - 1 row in delta, existing id skipped")
+
+    index.add_rows("article", [("doc_cook", DOCUMENTS[5][1]), ("doc_extra", "합성곱 신경망 필터 이미지")])
+    loaded = index._load("article")
+    assert loaded.base.name != base_name
+    assert loaded.delta.ids == []
+    assert loaded.base.ids == [doc_id for doc_id, _ in DOCUMENTS[:4]] + ["doc_sql2", "doc_cook", "doc_extra"]
+    assert index.similar(None, "article", "doc_sql", 1)[0].entity_id == "doc_sql2"
+    assert "doc_extra" in ids(index.similar(None, "article", "doc_cnn", 2))
+    print(f"   ✅ add_rows - delta merged into base ({len(loaded.base.ids)} rows)")
+
+
+def test_queue_and_flush():
+    """add는 대기열에만 넣고 flush가 한 번에 반영"""
+    print("🧪 Testing queue / flush...")
+    index = new_index()
+    index.build("article", lambda: iter(DOCUMENTS[:3]))
+    index.add("article", "doc_sql", DOCUMENTS[3][1])
+    index.add("article", "doc_sql2", DOCUMENTS[4][1])
+    assert index.size("article") == 3
+    assert index.flush() == 2
+    assert index.size("article") == 5
+    assert index.flush() == 0
+    print("   ✅ flush - 2 queued rows applied")
+
+
+def test_manifest_swap_reuses_base():
+    """delta만 바뀌면 기준 세그먼트를 다시 읽지 않고, 다른 워커는 새 세대를 읽음"""
+    print("🧪 Testing manifest swap...")
+    directory = tempfile.mkdtemp(prefix="infou-similarity-")
+    writer = new_index(directory)
+    reader = new_index(directory)
+    writer.build("article", lambda: iter(DOCUMENTS[:4]))
+
+    before = reader._load("article")
+    assert reader.size("article") == 4
+
+    writer.add_rows("article", [("doc_sql2", DOCUMENTS[4][1])])
+    after = reader._load("article")
+    assert after.manifest_version != before.manifest_version
+    assert after.base is before.base
+    assert after.delta.ids == ["doc_sql2"]
+    assert reader.similar(None, "article", "doc_sql", 1)[0].entity_id == "doc_sql2"
+    print("   ✅ reader - new delta picked up, base segment reused")
+
+    # 쓴 쪽은 반영 스레드에서 이미 새 세대를 열어 둠
+    assert writer._loaded["article"].delta.ids == ["doc_sql2"]
+
+    # 전체 재생성은 기준 세그먼트도 교체
+    writer.build("article", lambda: iter(DOCUMENTS))
+    rebuilt = reader._load("article")
+    assert rebuilt.base is not before.base
+    assert reader.size("article") == len(DOCUMENTS)
+    print("   ✅ reader - rebuilt base picked up")
+
+
+def test_missing_index():
+    """인덱스가 아직 없으면 빈 목록"""
+    print("🧪 Testing missing index...")
+    index = new_index()
+    assert index.similar(None, "sub_topic", "1", 5) == []
+    assert index.size("sub_topic") == 0
+    index.add_rows("sub_topic", [("1", "무시됨")])
+    assert index.size("sub_topic") == 0
+    print("   ✅ similar - [] before build")
+
+
+def main():
+    """전체 유사도 인덱스 테스트 실행"""
+    print("🚀 Starting similarity index tests...\n")
+
+    try:
+        test_tfidf_ranking()
+        print()
+        test_delta_add_and_merge()
+        print()
+        test_queue_and_flush()
+        print()
+        test_manifest_swap_reuses_base()
+        print()
+        test_missing_index()
+
+        print("\n🎉 All similarity index tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+인기 목록 테스트
+다시 읽은 글 집계, 시간/일 단위 기간, 삭제된 대상 건너뛰기, 시간 단위 집계 정리 확인
+"""
+
+import sys
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+from conftest import AUTH_HEADERS, seed_learning_path
+from fastapi.testclient import TestClient
+from main import app
+from app.database.database import SessionLocal
+from app.models import ReadRollup
+from app.services.popularity import bucket_start, popularity_rollups
+
+client = TestClient(app)
+
+seeded = seed_learning_path("trending", item_count=3)
+
+
+def trending(**params) -> dict:
+    response = client.get("/api/trending", params={"limit": 100, **params})
+    assert response.status_code == 200, response.text
+    return {entry["entity_id"]: entry["read_count"] for entry in response.json()}
+
+
+def record_counts(counts: dict):
+    """(글 id, 읽은 시각) → 읽음 수를 시드한 경로/소주제의 집계로 기록"""
+    db = SessionLocal()
+    try:
+        popularity_rollups.record_counts(db, {
+            (article_id, seeded.sub_topic_id, seeded.path_id, bucket_start(read_at, "hour")): count
+            for (article_id, read_at), count in counts.items()
+        })
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_rereads_counted():
+    """다시 읽을 때마다 글/경로/소주제 집계가 늘어남"""
+    print("🧪 Testing re-reads in trending...")
+    first, second = seeded.article_ids[0][0], seeded.article_ids[0][1]
+    for article_id in (first, first, first, second):
+        response = client.post(f"/api/articles/{article_id}/read", headers=AUTH_HEADERS)
+        assert response.status_code == 200, response.text
+
+    articles = trending()
+    assert (articles[first], articles[second]) == (3, 1)
+    print(f"   ✅ article - {first}: 3, {second}: 1")
+    assert trending(entity_type="path")[seeded.path_id] == 4
+    assert trending(entity_type="sub_topic")[str(seeded.sub_topic_id)] == 4
+    print("   ✅ path and sub_topic - 4")
+
+
+def test_windows():
+    """48시간 이하는 시간 단위, 그보다 길면 일 단위 집계에서 기간 안의 읽음만 합산"""
+    print("🧪 Testing trending windows...")
+    article_id = seeded.article_ids[1][0]
+    record_counts({(article_id, datetime.utcnow() - timedelta(hours=30)): 5})
+
+    assert article_id not in trending(hours=24)
+    assert trending(hours=48)[article_id] == 5
+    print("   ✅ read 30h ago - outside 24h, inside 48h (hourly)")
+    assert trending(hours=72)[article_id] == 5
+    print("   ✅ 72h - counted from daily rollups")
+
+
+def test_deleted_entities_skipped():
+    """집계에 남은 삭제된 글은 건너뛰고 다음 순위로 limit개를 채움"""
+    print("🧪 Testing deleted entities in trending...")
+    now = datetime.utcnow()
+    kept = [seeded.article_ids[2][0], seeded.article_ids[2][1]]
+    record_counts({
+        **{(f"trending_deleted_{i}", now): 10000 + i for i in range(5)},
+        (kept[0], now): 9000,
+        (kept[1], now): 8000
+    })
+
+    response = client.get("/api/trending", params={"limit": 2})
+    assert response.status_code == 200, response.text
+    assert [(entry["entity_id"], entry["read_count"]) for entry in response.json()] == [(kept[0], 9000), (kept[1], 8000)]
+    print(f"   ✅ limit=2 with 5 deleted articles ranked above - {kept}")
+
+
+def test_prune_hourly_rollups():
+    """보관 기간이 지난 시간 단위 행만 정리하고 일 단위 행은 남김"""
+    print("🧪 Testing hourly rollup pruning...")
+    article_id = seeded.article_ids[1][1]
+    old = datetime.utcnow() - popularity_rollups.hourly_retention - timedelta(days=2)
+
+    def granularities():
+        db = SessionLocal()
+        try:
+            return sorted(granularity for granularity, in db.query(ReadRollup.granularity).filter(
+                ReadRollup.entity_type == "article",
+                ReadRollup.entity_id == article_id,
+                ReadRollup.bucket_start <= old
+            ))
+        finally:
+            db.close()
+
+    # 이번 시간 구간에 이미 정리했다면 다음 구간까지 정리하지 않음
+    popularity_rollups._last_pruned = bucket_start(datetime.utcnow(), "hour")
+    record_counts({(article_id, old): 1})
+    assert granularities() == ["day", "hour"]
+    print("   ✅ already pruned this hour - old hourly row kept")
+
+    popularity_rollups._last_pruned = None
+    record_counts({(article_id, datetime.utcnow()): 1})
+    assert granularities() == ["day"]
+    print("   ✅ next record - old hourly row pruned, daily row kept")
+
+
+def main():
+    """전체 인기 목록 테스트 실행"""
+    print("🚀 Starting trending tests...\n")
+
+    try:
+        test_rereads_counted()
+        print()
+        test_windows()
+        print()
+        test_deleted_entities_skipped()
+        print()
+        test_prune_hourly_rollups()
+
+        print("\n🎉 All trending tests passed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()